@@ -27,6 +27,7 @@ from redbot.core.utils.chat_formatting import humanize_list
 # Music Imports
 from ..errors import InvalidPlaylistScope, MissingAuthor, MissingGuild
 from ..utils import PlaylistScope
+from .payload_codec import decode_listing, decode_payload, is_encoded_payload
 
 log = logging.getLogger("red.cogs.Music.api.utils")
 
@@ -51,6 +52,21 @@ class SpotifyCacheFetchResult:
             self.updated_on: datetime.datetime = datetime.datetime.fromtimestamp(self.last_updated)
 
 
+@dataclass
+class SpotifyCollectionCacheFetchResult:
+    snapshot_id: Optional[str]
+    total: int
+    tracks: Union[bytes, List[MutableMapping]]
+    last_updated: int
+
+    def __post_init__(self):
+        if isinstance(self.last_updated, int):
+            self.updated_on: datetime.datetime = datetime.datetime.fromtimestamp(self.last_updated)
+
+        if isinstance(self.tracks, (bytes, memoryview)):
+            self.tracks = decode_listing(self.tracks)
+
+
 @dataclass
 class LavalinkCacheFetchResult:
     query: Optional[MutableMapping]
@@ -60,19 +76,41 @@ class LavalinkCacheFetchResult:
         if isinstance(self.last_updated, int):
             self.updated_on: datetime.datetime = datetime.datetime.fromtimestamp(self.last_updated)
 
-        if isinstance(self.query, str):
+        if is_encoded_payload(self.query):
+            self.query = decode_payload(self.query)
+        elif isinstance(self.query, str):
             self.query = json.loads(self.query)
 
 
 @dataclass
 class LavalinkCacheFetchForGlobalResult:
     query: str
-    data: MutableMapping
+    payload: Union[bytes, str, MutableMapping]
+
+    @property
+    def data(self) -> MutableMapping:
+        """The LoadResult, decoded on every access"""
+        if is_encoded_payload(self.payload):
+            return decode_payload(self.payload)
+        elif isinstance(self.payload, str):
+            return json.loads(self.payload)
+        return self.payload
+
+    @property
+    def data_string(self) -> str:
+        if isinstance(self.payload, str):
+            return self.payload
+        return json.dumps(self.data)
 
-    def __post_init__(self):
-        if isinstance(self.data, str):
-            self.data_string = str(self.data)
-            self.data = json.loads(self.data)
+
+@dataclass
+class EvictionReport:
+    table: str
+    expired: int = 0
+    evicted: int = 0
+    rows: int = 0
+    size: int = 0
+    reclaimed_bytes: int = 0
 
 
 @dataclass
@@ -103,6 +141,21 @@ class QueueFetchResult:
             self.track_object = lavalink.Track(self.track)
 
 
+def copy_load_result(data: MutableMapping) -> MutableMapping:
+    """Copy a cached LoadResult payload so the caller can mutate it without touching the cache."""
+    payload = dict(data)
+    if isinstance(payload.get("playlistInfo"), dict):
+        payload["playlistInfo"] = dict(payload["playlistInfo"])
+    if isinstance(payload.get("tracks"), list):
+        payload["tracks"] = [
+            dict(track, info=dict(track["info"]))
+            if isinstance(track, dict) and isinstance(track.get("info"), dict)
+            else track
+            for track in payload["tracks"]
+        ]
+    return payload
+
+
 def standardize_scope(scope: str) -> str:
     """Convert any of the used scopes into one we are expecting."""
     scope = scope.upper()
@@ -0,0 +1,101 @@
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+from typing import List, Optional, TYPE_CHECKING
+import asyncio
+import contextlib
+import datetime
+import logging
+
+# Music Imports
+from ..audio_logging import debug_exc_log, IS_DEBUG
+from .api_utils import EvictionReport
+
+if TYPE_CHECKING:
+
+    # Music Imports
+    from ..core.utilities import SettingCacheManager
+    from .local_db import LocalCacheWrapper
+
+log = logging.getLogger("red.cogs.Music.api.CacheMaintenance")
+
+_MAINTENANCE_INTERVAL = 3600
+_FIRST_RUN_DELAY = 300
+
+
+class LocalCacheMaintenance:
+    """Periodically trims the local cache tables.
+
+    Each run deletes entries older than `local_cache_age`, then evicts the least recently
+    fetched entries of any table above the configured row count or size.
+    Deletes are done in small batches so reads and queued writes are never held up for long.
+    The autoplay pool is rebuilt afterwards, so it only holds entries still in the autoplay
+    window.
+    """
+
+    def __init__(
+        self,
+        local_cache: LocalCacheWrapper,
+        cache: SettingCacheManager,
+        interval: float = _MAINTENANCE_INTERVAL,
+    ):
+        self.local_cache = local_cache
+        self.config_cache = cache
+        self.interval = interval
+        self.last_run: Optional[datetime.datetime] = None
+        self.last_reports: List[EvictionReport] = []
+        self._task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        await asyncio.sleep(_FIRST_RUN_DELAY)
+        while True:
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                debug_exc_log(log, exc, "Local cache maintenance failed")
+            await asyncio.sleep(self.interval)
+
+    async def run_once(self) -> List[EvictionReport]:
+        """Trim every table of the local cache and return what was reclaimed."""
+        async with self._lock:
+            maxage = await self.local_cache.lavalink.get_max_age()
+            max_rows = await self.config_cache.local_cache_max_rows.get_global()
+            max_bytes = await self.config_cache.local_cache_max_size.get_global() * 1024 * 1024
+            reports: List[EvictionReport] = []
+            for table in (
+                self.local_cache.lavalink,
+                self.local_cache.youtube,
+                self.local_cache.spotify,
+                self.local_cache.spotify_collections,
+            ):
+                reports.extend(await table.evict(maxage, max_rows, max_bytes))
+            await self.local_cache.lavalink.rebuild_autoplay_pool()
+            self.last_run = datetime.datetime.now(datetime.timezone.utc)
+            self.last_reports = reports
+            if IS_DEBUG:
+                for report in reports:
+                    if report.expired or report.evicted:
+                        log.debug(
+                            "Removed %d expired and %d excess entries from the %s table, "
+                            "reclaiming %d bytes",
+                            report.expired,
+                            report.evicted,
+                            report.table,
+                            report.reclaimed_bytes,
+                        )
+            return reports
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await self._task
+            self._task = None
@@ -0,0 +1,137 @@
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+from collections import deque
+from typing import Deque, MutableMapping, Optional, Tuple, Union
+import logging
+import math
+import time
+
+__all__ = ["CircuitBreaker"]
+
+log = logging.getLogger("red.cogs.Music.api.CircuitBreaker")
+
+
+class CircuitBreaker:
+    """Stops calls to a remote service while it is failing or too slow.
+
+    The outcome and latency of the last `window` calls are tracked.
+    Once at least `min_calls` were made, the circuit opens if their error rate reaches
+    `error_threshold` or their p95 latency goes over `latency_budget` seconds.
+    While open every call is refused, after `cooldown` seconds a single probe is let through
+    (half-open): it closes the circuit if it succeeds within budget, otherwise the circuit opens
+    again for twice as long, up to `max_cooldown` seconds.
+    """
+
+    CLOSED = "Closed"
+    OPEN = "Open"
+    HALF_OPEN = "Half-open"
+
+    def __init__(
+        self,
+        name: str,
+        window: int = 50,
+        min_calls: int = 10,
+        error_threshold: float = 0.5,
+        latency_budget: float = 2.0,
+        cooldown: float = 30.0,
+        max_cooldown: float = 600.0,
+    ):
+        self.name = name
+        self.min_calls = min_calls
+        self.error_threshold = error_threshold
+        self.latency_budget = latency_budget
+        self.base_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.cooldown = cooldown
+        self.state = self.CLOSED
+        self.opened_at: Optional[float] = None
+        self.times_opened = 0
+        self.refused = 0
+        self._calls: Deque[Tuple[bool, float]] = deque(maxlen=max(1, window))
+        self._probing = False
+
+    @property
+    def available(self) -> bool:
+        """Whether a call could currently be allowed, without changing the state."""
+        if self.state == self.CLOSED:
+            return True
+        elif self.state == self.OPEN:
+            return time.monotonic() >= self.opened_at + self.cooldown
+        return not self._probing
+
+    @property
+    def error_rate(self) -> float:
+        if not self._calls:
+            return 0.0
+        return sum(1 for ok, __ in self._calls if not ok) / len(self._calls)
+
+    @property
+    def p95_latency(self) -> float:
+        if not self._calls:
+            return 0.0
+        latencies = sorted(latency for __, latency in self._calls)
+        return latencies[min(len(latencies) - 1, math.ceil(len(latencies) * 0.95) - 1)]
+
+    def allow(self) -> bool:
+        """Whether a call may be made now, a True result must be followed by :meth:`record`."""
+        if self.state == self.OPEN and time.monotonic() >= self.opened_at + self.cooldown:
+            self.state = self.HALF_OPEN
+            self._probing = False
+        if self.state == self.CLOSED:
+            return True
+        elif self.state == self.HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        self.refused += 1
+        return False
+
+    def record(self, success: bool, latency: float) -> None:
+        """Record the outcome of an allowed call."""
+        if self.state == self.HALF_OPEN:
+            self._probing = False
+            if success and latency <= self.latency_budget:
+                self._close()
+            else:
+                self._open(min(self.cooldown * 2, self.max_cooldown))
+            return
+        self._calls.append((success, latency))
+        if self.state == self.CLOSED and len(self._calls) >= self.min_calls:
+            if self.error_rate >= self.error_threshold or self.p95_latency > self.latency_budget:
+                self._open(self.base_cooldown)
+
+    def _open(self, cooldown: float) -> None:
+        log.warning(
+            "%s circuit opened for %ds (error rate %.0f%%, p95 latency %.2fs)",
+            self.name,
+            cooldown,
+            self.error_rate * 100,
+            self.p95_latency,
+        )
+        self.state = self.OPEN
+        self.cooldown = cooldown
+        self.opened_at = time.monotonic()
+        self.times_opened += 1
+
+    def _close(self) -> None:
+        log.info("%s circuit closed", self.name)
+        self.state = self.CLOSED
+        self.cooldown = self.base_cooldown
+        self.opened_at = None
+        self._calls.clear()
+
+    def stats(self) -> MutableMapping[str, Union[str, int, float]]:
+        return {
+            "state": self.state,
+            "calls": len(self._calls),
+            "error_rate": round(self.error_rate, 4),
+            "p95_latency": round(self.p95_latency, 3),
+            "times_opened": self.times_opened,
+            "refused": self.refused,
+            "retry_in": (
+                max(0.0, round(self.opened_at + self.cooldown - time.monotonic(), 1))
+                if self.state == self.OPEN
+                else 0.0
+            ),
+        }
@@ -0,0 +1,155 @@
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, List, Mapping, MutableMapping, Optional, Sequence, Union
+import asyncio
+import contextlib
+import functools
+import logging
+import time
+
+# Dependency Imports
+from redbot.core.utils.dbtools import APSWConnectionWrapper
+
+log = logging.getLogger("red.cogs.Music.api.DatabaseExecutor")
+
+_DEFAULT_READERS = 4
+
+
+@dataclass
+class ExecutorStats:
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    pending: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+
+    @property
+    def average_time(self) -> float:
+        finished = self.completed + self.failed
+        return self.total_time / finished if finished else 0.0
+
+    def as_dict(self) -> MutableMapping[str, Union[int, float]]:
+        return {
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "pending": self.pending,
+            "average_ms": round(self.average_time * 1000, 3),
+            "max_ms": round(self.max_time * 1000, 3),
+        }
+
+
+class DatabaseExecutor:
+    """Runs blocking APSW calls away from the event loop.
+
+    All writes go through a single dedicated thread so they are applied in the order they were
+    submitted, reads are spread over a small pool of threads.
+    Every call is awaited through :meth:`asyncio.AbstractEventLoop.run_in_executor`.
+    """
+
+    def __init__(self, conn: APSWConnectionWrapper, max_readers: int = _DEFAULT_READERS):
+        self.database = conn
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="AudioDBWriter")
+        self._readers = ThreadPoolExecutor(
+            max_workers=max(1, max_readers), thread_name_prefix="AudioDBReader"
+        )
+        self._stats: Mapping[str, ExecutorStats] = {
+            "read": ExecutorStats(),
+            "write": ExecutorStats(),
+        }
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    async def _run(self, kind: str, pool: ThreadPoolExecutor, func: Callable, *args: Any) -> Any:
+        if self._closed:
+            raise RuntimeError("The database executor has been shut down.")
+        stats = self._stats[kind]
+        stats.submitted += 1
+        stats.pending += 1
+        start = time.perf_counter()
+        failed = False
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                pool, functools.partial(func, *args)
+            )
+        except Exception:
+            failed = True
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            stats.pending -= 1
+            stats.total_time += elapsed
+            stats.max_time = max(stats.max_time, elapsed)
+            if failed:
+                stats.failed += 1
+            else:
+                stats.completed += 1
+
+    async def read(self, func: Callable, *args: Any) -> Any:
+        """Run `func` on the reader pool."""
+        return await self._run("read", self._readers, func, *args)
+
+    async def write(self, func: Callable, *args: Any) -> Any:
+        """Run `func` on the writer thread."""
+        return await self._run("write", self._writer, func, *args)
+
+    def _execute(self, statement: str, values: Optional[Union[Mapping, Sequence]] = None) -> None:
+        self.database.cursor().execute(statement, values)
+
+    def _executemany(self, statement: str, values: Sequence[Mapping]) -> None:
+        with self.database.transaction() as transaction:
+            transaction.executemany(statement, values)
+
+    def _fetchone(
+        self, statement: str, values: Optional[Union[Mapping, Sequence]] = None
+    ) -> Optional[tuple]:
+        return self.database.cursor().execute(statement, values).fetchone()
+
+    def _fetchall(
+        self, statement: str, values: Optional[Union[Mapping, Sequence]] = None
+    ) -> List[tuple]:
+        return self.database.cursor().execute(statement, values).fetchall()
+
+    async def execute(
+        self, statement: str, values: Optional[Union[Mapping, Sequence]] = None
+    ) -> None:
+        """Execute a statement that modifies the database."""
+        await self.write(self._execute, statement, values)
+
+    async def executemany(self, statement: str, values: Sequence[Mapping]) -> None:
+        """Execute a statement for each set of values inside a single transaction."""
+        if not values:
+            return
+        await self.write(self._executemany, statement, values)
+
+    async def fetchone(
+        self, statement: str, values: Optional[Union[Mapping, Sequence]] = None
+    ) -> Optional[tuple]:
+        """Fetch the first row returned by a statement."""
+        return await self.read(self._fetchone, statement, values)
+
+    async def fetchall(
+        self, statement: str, values: Optional[Union[Mapping, Sequence]] = None
+    ) -> List[tuple]:
+        """Fetch every row returned by a statement."""
+        return await self.read(self._fetchall, statement, values)
+
+    def stats(self) -> MutableMapping[str, MutableMapping[str, Union[int, float]]]:
+        """Queue depth and latency for the reader pool and the writer thread."""
+        return {kind: stats.as_dict() for kind, stats in self._stats.items()}
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting new work and wait for queued statements to finish."""
+        self._closed = True
+        with contextlib.suppress(Exception):
+            self._readers.shutdown(wait=wait)
+        with contextlib.suppress(Exception):
+            self._writer.shutdown(wait=wait)
@@ -0,0 +1,108 @@
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+from typing import AsyncIterator, Dict, Hashable, List, MutableMapping, Optional, Tuple
+import asyncio
+import contextlib
+import heapq
+import itertools
+import logging
+import time
+
+# Music Imports
+from .http_client import LatencyHistogram
+
+__all__ = ["FairShareLimiter"]
+
+log = logging.getLogger("red.cogs.Music.api.FairShareLimiter")
+
+INTERACTIVE = 0
+BULK = 1
+
+
+class FairShareLimiter:
+    """Caps concurrent calls and shares them fairly between guilds.
+
+    At most `concurrency` calls run at once. When they're all taken, interactive calls are
+    always let through before bulk ones, and within each class guilds take turns by weighted
+    fair queuing: every call advances its guild's virtual finish time by `1 / weight`, the
+    waiting call with the earliest finish time goes first.
+    A guild loading thousands of tracks therefore only delays another guild's single load by
+    one call, not by its whole backlog.
+    """
+
+    def __init__(self, concurrency: int = 6):
+        self.concurrency = max(1, concurrency)
+        self.weights: Dict[Hashable, float] = {}
+        self._running = 0
+        self._waiting: List[Tuple[int, float, int, asyncio.Future]] = []
+        self._virtual_time = 0.0
+        self._finish: Dict[Tuple[int, Hashable], float] = {}
+        self._sequence = itertools.count()
+        self.wait_times: Dict[Hashable, LatencyHistogram] = {}
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for __, __, __, future in self._waiting if not future.done())
+
+    def _tag(self, priority: int, key: Hashable) -> float:
+        start = max(self._virtual_time, self._finish.get((priority, key), 0.0))
+        finish = start + 1 / self.weights.get(key, 1.0)
+        self._finish[(priority, key)] = finish
+        return finish
+
+    def _wake_next(self) -> None:
+        while self._waiting and self._running < self.concurrency:
+            __, tag, __, future = heapq.heappop(self._waiting)
+            if future.done():
+                continue
+            self._virtual_time = max(self._virtual_time, tag)
+            self._running += 1
+            future.set_result(None)
+        if not self._waiting:
+            # Nothing is queued, the finish times of idle guilds no longer matter
+            self._finish.clear()
+
+    def _observe(self, key: Hashable, seconds: float) -> None:
+        histogram = self.wait_times.get(key)
+        if histogram is None:
+            histogram = self.wait_times[key] = LatencyHistogram()
+        histogram.observe(seconds)
+
+    async def _acquire(self, key: Hashable, priority: int) -> None:
+        future = asyncio.get_running_loop().create_future()
+        entry = (priority, self._tag(priority, key), next(self._sequence), future)
+        heapq.heappush(self._waiting, entry)
+        self._wake_next()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over just as the caller went away
+                self._running -= 1
+                self._wake_next()
+            raise
+
+    @contextlib.asynccontextmanager
+    async def slot(self, key: Hashable, bulk: bool = False) -> AsyncIterator[None]:
+        """Hold one of the slots for a call made on behalf of `key`."""
+        started = time.monotonic()
+        await self._acquire(key, BULK if bulk else INTERACTIVE)
+        self._observe(key, time.monotonic() - started)
+        try:
+            yield
+        finally:
+            self._running -= 1
+            self._wake_next()
+
+    def stats(self, key: Optional[Hashable] = None) -> MutableMapping:
+        """Wait times of every key, or only `key`."""
+        if key is not None:
+            histogram = self.wait_times.get(key)
+            return histogram.as_dict() if histogram else LatencyHistogram().as_dict()
+        return {
+            "running": self._running,
+            "queued": self.queued,
+            "wait_times": {k: h.as_dict() for k, h in self.wait_times.items()},
+        }
@@ -3,10 +3,12 @@ from __future__ import annotations
 
 # Standard Library Imports
 from copy import copy
-from typing import Mapping, Optional, TYPE_CHECKING, Union
+from typing import Mapping, Optional, Tuple, TYPE_CHECKING, Union
 import asyncio
 import contextlib
+import functools
 import logging
+import time
 
 # Dependency Imports
 import aiohttp
@@ -28,6 +30,11 @@ from redbot.core.commands import Cog
 # Music Imports
 from ..audio_dataclasses import Query
 from ..audio_logging import debug_exc_log, IS_DEBUG
+from .api_utils import copy_load_result
+from .circuit_breaker import CircuitBreaker
+from .http_client import HTTPClient
+from .memory_cache import LRUCache, MISSING
+from .single_flight import SingleFlight
 
 if TYPE_CHECKING:
 
@@ -36,6 +43,11 @@ if TYPE_CHECKING:
     from ..core.utilities import SettingCacheManager
 
 _API_URL = "https://api.redbot.app/"
+_RESULT_CACHE_SIZE = 1024
+_RESULT_TTL = 300
+_NEGATIVE_TTL = 60
+# Share of `global_api_timeout` the p95 latency may use before the circuit opens
+_LATENCY_BUDGET = 0.5
 
 log = logging.getLogger("red.cogs.Music.api.GlobalDB")
 
@@ -45,7 +57,7 @@ class GlobalCacheWrapper:
         self,
         bot: Red,
         config: Config,
-        session: aiohttp.ClientSession,
+        http: HTTPClient,
         cog: Union[Music, Cog],
         cache: SettingCacheManager,
     ):
@@ -53,15 +65,19 @@ class GlobalCacheWrapper:
         self.bot = bot
         self.config = config
         self.config_cache = cache
-        self.session = session
+        self.http = http
         self.api_key = None
         self._handshake_token = ""
         self.has_api_key = None
         self._token: Mapping[str, str] = {}
         self.cog = cog
+        self._inflight = SingleFlight()
+        self.breaker = CircuitBreaker("Global API")
+        self._results = LRUCache(_RESULT_CACHE_SIZE, negative_ttl=_NEGATIVE_TTL)
 
     async def update_token(self, new_token: Mapping[str, str]):
         self._token = new_token
+        self._results.clear()
         await self.get_perms()
 
     async def _get_api_key(
@@ -79,6 +95,60 @@ class GlobalCacheWrapper:
         self._handshake_token = "||".join(map(str, id_list))
         return self.api_key
 
+    async def _get(self, key: Tuple, api_url: str, params: Mapping[str, str]) -> dict:
+        if not self.breaker.allow():
+            return {}
+        timeout = await self.config_cache.global_api_timeout.get_global()
+        self.breaker.latency_budget = timeout * _LATENCY_BUDGET
+        search_response = "error"
+        success = False
+        start = time.monotonic()
+        try:
+            async with self.http.request(
+                "global",
+                "GET",
+                api_url,
+                timeout=aiohttp.ClientTimeout(total=timeout),
+                headers={"Authorization": self.api_key, "X-Token": self._handshake_token},
+                params=params,
+            ) as r:
+                success = r.status < 500
+                with contextlib.suppress(aiohttp.ContentTypeError):
+                    search_response = await r.json(loads=json.loads)
+                if IS_DEBUG and "x-process-time" in r.headers:
+                    log.debug(
+                        "GET || Ping %s || Status code %d || %s",
+                        r.headers.get("x-process-time"),
+                        r.status,
+                        key,
+                    )
+        except asyncio.TimeoutError:
+            pass
+        except Exception as err:
+            debug_exc_log(log, err, "Failed to Get query: %s/%s", api_url, key)
+            return {}
+        finally:
+            self.breaker.record(success, time.monotonic() - start)
+        if "tracks" not in search_response:
+            # Timeouts are remembered too, so a slow API isn't waited on again for every lookup
+            self._results.set_negative(key)
+            return {}
+        self._results.set(key, search_response, ttl=_RESULT_TTL)
+        return search_response
+
+    async def _cached_get(self, key: Tuple, api_url: str, params: Mapping[str, str]) -> dict:
+        """Serve a lookup from the result cache, or join the identical request in flight"""
+        cached = self._results.get(key)
+        if cached is None:
+            return {}
+        elif cached is MISSING:
+            if not self.breaker.available:
+                return {}
+            cached = await self._inflight.do(
+                key, functools.partial(self._get, key, api_url, params)
+            )
+        return copy_load_result(cached) if cached else {}
+
     async def get_call(self, query: Optional[Query] = None) -> dict:
         api_url = f"{_API_URL}api/v2/queries"
         if not self.cog.global_api_user.get("can_read"):
@@ -90,28 +160,8 @@ class GlobalCacheWrapper:
             await self._get_api_key()
             if self.api_key is None:
                 return {}
-            search_response = "error"
             query = query.lavalink_query
-            with contextlib.suppress(aiohttp.ContentTypeError, asyncio.TimeoutError):
-                async with self.session.get(
-                    api_url,
-                    timeout=aiohttp.ClientTimeout(
-                        total=await self.config_cache.global_api_timeout.get_global()
-                    ),
-                    headers={"Authorization": self.api_key, "X-Token": self._handshake_token},
-                    params={"query": query},
-                ) as r:
-                    search_response = await r.json(loads=json.loads)
-                    if IS_DEBUG and "x-process-time" in r.headers:
-                        log.debug(
-                            "GET || Ping %s || Status code %d || %s",
-                            r.headers.get("x-process-time"),
-                            r.status,
-                            query,
-                        )
-            if "tracks" not in search_response:
-                return {}
-            return search_response
+            return await self._cached_get(("query", query), api_url, {"query": query})
         except Exception as err:
             debug_exc_log(log, err, "Failed to Get query: %s/%s", api_url, query)
         return {}
@@ -121,65 +171,63 @@ class GlobalCacheWrapper:
             return {}
         api_url = f"{_API_URL}api/v2/queries/spotify"
         try:
-            search_response = "error"
-            params = {"title": title, "author": author}
             await self._get_api_key()
             if self.api_key is None:
                 return {}
-            with contextlib.suppress(aiohttp.ContentTypeError, asyncio.TimeoutError):
-                async with self.session.get(
-                    api_url,
-                    timeout=aiohttp.ClientTimeout(
-                        total=await self.config_cache.global_api_timeout.get_global()
-                    ),
-                    headers={"Authorization": self.api_key, "X-Token": self._handshake_token},
-                    params=params,
-                ) as r:
-                    search_response = await r.json(loads=json.loads)
-                    if IS_DEBUG and "x-process-time" in r.headers:
-                        log.debug(
-                            "GET/spotify || Ping %s || Status code %d || %s - %s",
-                            r.headers.get("x-process-time"),
-                            r.status,
-                            title,
-                            author,
-                        )
-            if "tracks" not in search_response:
-                return {}
-            return search_response
+            return await self._cached_get(
+                ("spotify", title, author), api_url, {"title": title, "author": author}
+            )
         except Exception as err:
             debug_exc_log(log, err, "Failed to Get query: %s", api_url)
         return {}
 
+    def submission_query(self, llresponse: LoadResult, query: Optional[Query]) -> Optional[str]:
+        """The Lavalink query to submit `llresponse` under, or None if it can't be submitted"""
+        if not self.cog.global_api_user.get("can_post"):
+            return None
+        query = Query.process_input(query, self.cog.local_folder_current_path)
+        if llresponse.has_error or llresponse.load_type.value in ["NO_MATCHES", "LOAD_FAILED"]:
+            return None
+        if query and query.valid and query.is_youtube:
+            return query.lavalink_query
+        return None
+
+    async def submit(
+        self, query: str, data: Mapping, http: Optional[HTTPClient] = None
+    ) -> Optional[int]:
+        """Post a LoadResult to the Global API and return the response status code.
+
+        The request goes through `http` when given, the shared client otherwise.
+        None is returned when the request could not be made at all.
+        """
+        await self._get_api_key()
+        if self.api_key is None:
+            return None
+        api_url = f"{_API_URL}api/v2/queries"
+        async with (http or self.http).request(
+            "global",
+            "POST",
+            api_url,
+            json=data,
+            headers={"Authorization": self.api_key, "X-Token": self._handshake_token},
+            params={"query": query},
+        ) as r:
+            await r.read()
+            if IS_DEBUG and "x-process-time" in r.headers:
+                log.debug(
+                    "POST || Ping %s || Status code %d || %s",
+                    r.headers.get("x-process-time"),
+                    r.status,
+                    query,
+                )
+            return r.status
+
     async def post_call(self, llresponse: LoadResult, query: Optional[Query]) -> None:
         try:
-            if not self.cog.global_api_user.get("can_post"):
-                return
-            query = Query.process_input(query, self.cog.local_folder_current_path)
-            if llresponse.has_error or llresponse.load_type.value in ["NO_MATCHES", "LOAD_FAILED"]:
-                return
-            if query and query.valid and query.is_youtube:
-                query = query.lavalink_query
-            else:
-                return None
-            await self._get_api_key()
-            if self.api_key is None:
+            lavalink_query = self.submission_query(llresponse, query)
+            if lavalink_query is None:
                 return None
-            api_url = f"{_API_URL}api/v2/queries"
-            async with self.session.post(
-                api_url,
-                json=llresponse._raw,
-                headers={"Authorization": self.api_key, "X-Token": self._handshake_token},
-                params={"query": query},
-            ) as r:
-                await r.read()
-                if IS_DEBUG and "x-process-time" in r.headers:
-                    log.debug(
-                        "GET || Ping %s || Status code %d || %s",
-                        r.headers.get("x-process-time"),
-                        r.status,
-                        query,
-                    )
+            await self.submit(lavalink_query, llresponse._raw)
         except Exception as err:
             debug_exc_log(log, err, "Failed to post query: %s", query)
         await asyncio.sleep(0)
@@ -192,7 +240,9 @@ class GlobalCacheWrapper:
             return
         with contextlib.suppress(Exception):
             api_url = f"{_API_URL}api/v2/queries/es/id"
-            async with self.session.delete(
+            async with self.http.request(
+                "global",
+                "DELETE",
                 api_url,
                 headers={"Authorization": self.api_key, "X-Token": self._handshake_token},
                 params={"id": identification},
@@ -206,15 +256,16 @@ class GlobalCacheWrapper:
         if (not is_enabled) or self.api_key is None:
             return global_api_user
         with contextlib.suppress(Exception):
-            async with aiohttp.ClientSession(json_serialize=json.dumps) as session:
-                async with session.get(
-                    f"{_API_URL}api/v2/users/me",
-                    headers={"Authorization": self.api_key, "X-Token": self._handshake_token},
-                ) as resp:
-                    if resp.status == 200:
-                        search_response = await resp.json(loads=json.loads)
-                        global_api_user["fetched"] = True
-                        global_api_user["can_read"] = search_response.get("can_read", False)
-                        global_api_user["can_post"] = search_response.get("can_post", False)
-                        global_api_user["can_delete"] = search_response.get("can_delete", False)
+            async with self.http.request(
+                "global",
+                "GET",
+                f"{_API_URL}api/v2/users/me",
+                headers={"Authorization": self.api_key, "X-Token": self._handshake_token},
+            ) as resp:
+                if resp.status == 200:
+                    search_response = await resp.json(loads=json.loads)
+                    global_api_user["fetched"] = True
+                    global_api_user["can_read"] = search_response.get("can_read", False)
+                    global_api_user["can_post"] = search_response.get("can_post", False)
+                    global_api_user["can_delete"] = search_response.get("can_delete", False)
         return global_api_user
@@ -0,0 +1,201 @@
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+from typing import List, MutableMapping, Optional, Tuple, TYPE_CHECKING
+import asyncio
+import contextlib
+import datetime
+import logging
+import random
+
+# Music Imports
+from ..audio_logging import debug_exc_log, IS_DEBUG
+from ..sql_statements import (
+    GLOBAL_SPOOL_COUNT,
+    GLOBAL_SPOOL_CREATE_INDEX,
+    GLOBAL_SPOOL_CREATE_TABLE,
+    GLOBAL_SPOOL_DELETE,
+    GLOBAL_SPOOL_FETCH_DUE,
+    GLOBAL_SPOOL_RESCHEDULE,
+    GLOBAL_SPOOL_UPSERT,
+)
+from .http_client import HTTPClient
+from .payload_codec import decode_payload, encode_payload
+
+if TYPE_CHECKING:
+
+    # Music Imports
+    from .db_executor import DatabaseExecutor
+    from .global_db import GlobalCacheWrapper
+
+log = logging.getLogger("red.cogs.Music.api.GlobalUploader")
+
+_DRAIN_INTERVAL = 30.0
+_BATCH_PAUSE = 1.0
+_BATCH_SIZE = 50
+_MAX_IN_FLIGHT = 2
+_MAX_ATTEMPTS = 8
+_BACKOFF_BASE = 60
+_BACKOFF_MAX = 6 * 3600
+
+
+class GlobalContributionUploader:
+    """Uploads contributions to the Global Audio API in the background.
+
+    Submissions are written to a spool table in the local database first, so they survive a
+    restart, and are drained `batch_size` at a time: one read of the due rows and one write
+    transaction settling them per batch.
+    The API takes one query per POST, those go through a client of their own whose connector
+    is capped at `max_in_flight` connections, so uploads never hold connections user-facing
+    requests are waiting for. Nothing is uploaded while the Global API circuit is open.
+    Failed uploads are retried with exponential backoff, submissions the API rejects outright or
+    that failed `_MAX_ATTEMPTS` times are dropped.
+    """
+
+    def __init__(
+        self,
+        global_api: GlobalCacheWrapper,
+        executor: DatabaseExecutor,
+        drain_interval: float = _DRAIN_INTERVAL,
+        batch_size: int = _BATCH_SIZE,
+        max_in_flight: int = _MAX_IN_FLIGHT,
+    ):
+        self.global_api = global_api
+        self.executor = executor
+        self.drain_interval = drain_interval
+        self.batch_size = batch_size
+        self.max_in_flight = max(1, max_in_flight)
+        self.http = HTTPClient(limit=self.max_in_flight, limit_per_host=self.max_in_flight)
+        self._wakeup = asyncio.Event()
+        self._drain_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+        self.uploaded = 0
+        self.dropped = 0
+        self.retried = 0
+
+    async def init(self) -> None:
+        await self.executor.execute(GLOBAL_SPOOL_CREATE_TABLE)
+        await self.executor.execute(GLOBAL_SPOOL_CREATE_INDEX)
+
+    def start(self) -> None:
+        self._closing = False
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while not self._closing:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.drain_interval)
+            self._wakeup.clear()
+            try:
+                await self.drain()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                debug_exc_log(log, exc, "Failed to drain the Global API spool")
+
+    @staticmethod
+    def _now() -> int:
+        return int(datetime.datetime.now(datetime.timezone.utc).timestamp())
+
+    async def add_many(self, submissions: List[MutableMapping]) -> None:
+        """Spool `update_global` style submissions, `llresponse` and `query`, for upload."""
+        created_at = self._now()
+        rows = []
+        for submission in submissions:
+            llresponse = submission.get("llresponse")
+            query = self.global_api.submission_query(llresponse, submission.get("query"))
+            if query is None:
+                continue
+            rows.append(
+                {"query": query, "data": encode_payload(llresponse._raw), "created_at": created_at}
+            )
+        if not rows:
+            return
+        await self.executor.executemany(GLOBAL_SPOOL_UPSERT, rows)
+        self._wakeup.set()
+
+    async def pending(self) -> int:
+        row = await self.executor.fetchone(GLOBAL_SPOOL_COUNT)
+        return row[0] if row else 0
+
+    async def _upload(
+        self, semaphore: asyncio.Semaphore, query: str, data: bytes
+    ) -> Optional[int]:
+        async with semaphore:
+            try:
+                return await self.global_api.submit(query, decode_payload(data), http=self.http)
+            except Exception as exc:
+                debug_exc_log(log, exc, "Failed to upload %r to the Global API", query)
+                return None
+
+    def _settle(self, done: List[str], retry: List[MutableMapping]) -> None:
+        with self.executor.database.transaction() as transaction:
+            if done:
+                transaction.executemany(GLOBAL_SPOOL_DELETE, [{"query": q} for q in done])
+            if retry:
+                transaction.executemany(GLOBAL_SPOOL_RESCHEDULE, retry)
+
+    async def drain(self) -> None:
+        """Upload every submission that is due, one batch at a time."""
+        async with self._drain_lock:
+            while not self._closing:
+                if not self.global_api.cog.global_api_user.get("can_post"):
+                    return
+                if await self.global_api._get_api_key() is None:
+                    return
+                if not self.global_api.breaker.available:
+                    return
+                rows: List[Tuple[str, bytes, int]] = await self.executor.fetchall(
+                    GLOBAL_SPOOL_FETCH_DUE, {"now": self._now(), "limit": self.batch_size}
+                )
+                if not rows:
+                    return
+                semaphore = asyncio.Semaphore(self.max_in_flight)
+                statuses = await asyncio.gather(
+                    *(self._upload(semaphore, query, data) for query, data, __ in rows)
+                )
+                now = self._now()
+                done, retry = [], []
+                for (query, __, attempts), status in zip(rows, statuses):
+                    if status is not None and 200 <= status < 300:
+                        self.uploaded += 1
+                        done.append(query)
+                    elif (
+                        status is not None and 400 <= status < 500 and status != 429
+                    ) or attempts + 1 >= _MAX_ATTEMPTS:
+                        self.dropped += 1
+                        done.append(query)
+                    else:
+                        self.retried += 1
+                        delay = min(_BACKOFF_BASE * 2 ** attempts, _BACKOFF_MAX)
+                        retry.append(
+                            {
+                                "query": query,
+                                "attempts": attempts + 1,
+                                "next_attempt": now + delay + random.randint(0, _BACKOFF_BASE),
+                            }
+                        )
+                await self.executor.write(self._settle, done, retry)
+                if IS_DEBUG:
+                    log.debug(
+                        "Global API spool batch: %d settled, %d scheduled for retry",
+                        len(done),
+                        len(retry),
+                    )
+                if len(rows) < self.batch_size:
+                    return
+                await asyncio.sleep(_BATCH_PAUSE)
+
+    async def close(self) -> None:
+        """Stop the background uploader, anything left in the spool is uploaded next start."""
+        self._closing = True
+        self._wakeup.set()
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await self._task
+            self._task = None
+        await self.http.close()
@@ -0,0 +1,224 @@
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+from bisect import bisect_left
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, Dict, List, Mapping, MutableMapping, Optional, Union
+import asyncio
+import contextlib
+import datetime
+import logging
+import time
+
+# Dependency Imports
+from yarl import URL
+import aiohttp
+
+try:
+    # Dependency Imports
+    from redbot import json
+except ImportError:
+    # Standard Library Imports
+    import json
+
+__all__ = ["HTTPClient", "ServiceProfile", "LatencyHistogram"]
+
+log = logging.getLogger("red.cogs.Music.api.HTTPClient")
+
+_CONNECTION_LIMIT = 100
+_CONNECTION_LIMIT_PER_HOST = 20
+_DNS_CACHE_TTL = 300
+_KEEPALIVE_TIMEOUT = 60
+# Upper bounds, in seconds, of the latency histogram buckets
+_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float("inf"))
+
+
+@dataclass(frozen=True)
+class ServiceProfile:
+    """Timeouts and retry policy for the requests made to one outbound service."""
+
+    total: Optional[float] = 30.0
+    connect: Optional[float] = 10.0
+    sock_read: Optional[float] = None
+    retries: int = 2
+    max_retry_after: float = 30.0
+
+    @property
+    def timeout(self) -> aiohttp.ClientTimeout:
+        return aiohttp.ClientTimeout(
+            total=self.total, connect=self.connect, sock_read=self.sock_read
+        )
+
+
+SERVICES: Mapping[str, ServiceProfile] = {
+    "default": ServiceProfile(),
+    "spotify": ServiceProfile(total=15.0, retries=3),
+    "youtube": ServiceProfile(total=10.0, retries=1),
+    # Lookups pass the `global_api_timeout` setting and go through a circuit breaker, retrying
+    # would defeat both. The timeout here bounds uploads, deletes and permission checks
+    "global": ServiceProfile(total=30.0, sock_read=15.0, retries=0),
+    "github": ServiceProfile(total=30.0, retries=2),
+    "lyrics": ServiceProfile(total=10.0, retries=0),
+    "discord": ServiceProfile(total=30.0, retries=1),
+    "download": ServiceProfile(total=None, sock_read=60.0, retries=1),
+    "stream": ServiceProfile(total=None, sock_read=15.0, retries=0),
+    # Large playlists can take a while to load
+    "lavalink": ServiceProfile(total=120.0, retries=1),
+}
+
+
+class LatencyHistogram:
+    """Cumulative request latency counts per bucket."""
+
+    def __init__(self):
+        self.counts: List[int] = [0] * len(_LATENCY_BUCKETS)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(_LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def quantile(self, q: float) -> float:
+        """The upper bound of the bucket holding the `q` quantile."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(_LATENCY_BUCKETS, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def as_dict(self) -> MutableMapping[str, Union[int, float, Dict[str, int]]]:
+        return {
+            "count": self.count,
+            "average": round(self.total / self.count, 4) if self.count else 0.0,
+            "p50": round(self.quantile(0.5), 4),
+            "p95": round(self.quantile(0.95), 4),
+            "max": round(self.max, 4),
+            "buckets": {
+                ("+Inf" if bound == float("inf") else str(bound)): count
+                for bound, count in zip(_LATENCY_BUCKETS, self.counts)
+            },
+        }
+
+
+class HTTPClient:
+    """The HTTP client every outbound API call of the cog goes through.
+
+    One session is shared by all services, its connector keeps connections alive, caches DNS
+    lookups and caps the connections opened to a single host.
+    Background work that shouldn't compete with user-facing requests for connections can use
+    its own client with lower `limit` and `limit_per_host`.
+    Each service gets its own timeouts from :data:`SERVICES`, 429 responses are retried after
+    their `Retry-After` delay and connection errors of idempotent requests are retried with
+    backoff.
+    """
+
+    def __init__(
+        self,
+        services: Mapping[str, ServiceProfile] = SERVICES,
+        limit: int = _CONNECTION_LIMIT,
+        limit_per_host: int = _CONNECTION_LIMIT_PER_HOST,
+    ):
+        self.services = services
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self._session: Optional[aiohttp.ClientSession] = None
+        self.latency: Dict[str, LatencyHistogram] = {}
+        self.retried: Dict[str, int] = {}
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """The shared session, created on first use so it's bound to the running loop."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.limit,
+                    limit_per_host=self.limit_per_host,
+                    ttl_dns_cache=_DNS_CACHE_TTL,
+                    keepalive_timeout=_KEEPALIVE_TIMEOUT,
+                    enable_cleanup_closed=True,
+                ),
+                json_serialize=json.dumps,
+            )
+        return self._session
+
+    def profile(self, service: str) -> ServiceProfile:
+        return self.services.get(service) or self.services["default"]
+
+    @staticmethod
+    def _retry_after(response: aiohttp.ClientResponse, attempt: int) -> float:
+        value = response.headers.get("Retry-After")
+        if value:
+            with contextlib.suppress(ValueError):
+                return max(0.0, float(value))
+            with contextlib.suppress(TypeError, ValueError):
+                retry_at = parsedate_to_datetime(value)
+                now = datetime.datetime.now(retry_at.tzinfo or datetime.timezone.utc)
+                return max(0.0, (retry_at - now).total_seconds())
+        return float(2 ** attempt)
+
+    def _observe(self, host: str, seconds: float) -> None:
+        histogram = self.latency.get(host)
+        if histogram is None:
+            histogram = self.latency[host] = LatencyHistogram()
+        histogram.observe(seconds)
+
+    @contextlib.asynccontextmanager
+    async def request(
+        self, service: str, method: str, url: Union[str, URL], **kwargs
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """Make a request to `service`, to be used as an async context manager.
+
+        A `timeout` passed in `kwargs` replaces the one of the service profile.
+        """
+        profile = self.profile(service)
+        kwargs.setdefault("timeout", profile.timeout)
+        host = URL(url).host or ""
+        idempotent = method.upper() in ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+        attempt = 0
+        while True:
+            start = time.monotonic()
+            try:
+                response = await self.session.request(method, url, **kwargs)
+            except aiohttp.ClientConnectionError:
+                if not idempotent or attempt >= profile.retries:
+                    raise
+                attempt += 1
+                self.retried[service] = self.retried.get(service, 0) + 1
+                await asyncio.sleep(2 ** (attempt - 1))
+                continue
+            self._observe(host, time.monotonic() - start)
+            if response.status == 429 and attempt < profile.retries:
+                delay = self._retry_after(response, attempt)
+                if delay <= profile.max_retry_after:
+                    response.release()
+                    attempt += 1
+                    self.retried[service] = self.retried.get(service, 0) + 1
+                    log.debug("Rate limited by %s, retrying in %.2fs", host, delay)
+                    await asyncio.sleep(delay)
+                    continue
+            break
+        try:
+            yield response
+        finally:
+            response.release()
+
+    def stats(self) -> MutableMapping[str, MutableMapping]:
+        return {
+            "latency": {host: h.as_dict() for host, h in self.latency.items()},
+            "retried": dict(self.retried),
+        }
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
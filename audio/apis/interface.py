@@ -3,10 +3,21 @@ from __future__ import annotations
 
 # Standard Library Imports
 from collections import namedtuple
-from typing import Callable, cast, List, MutableMapping, Optional, Tuple, TYPE_CHECKING, Union
+from typing import (
+    AsyncIterator,
+    Callable,
+    cast,
+    List,
+    MutableMapping,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
 import asyncio
 import contextlib
 import datetime
+import functools
 import logging
 import random
 import time
@@ -28,7 +39,7 @@ except ImportError:
 # Dependency Imports
 from redbot.core import commands, Config
 from redbot.core.bot import Red
-from redbot.core.commands import Cog, Context
+from redbot.core.commands import Cog
 from redbot.core.utils import AsyncIter
 from redbot.core.utils.dbtools import APSWConnectionWrapper
 
@@ -37,13 +48,24 @@ from ..audio_dataclasses import Query
 from ..audio_logging import debug_exc_log, IS_DEBUG
 from ..errors import DatabaseError, SpotifyFetchError, TrackEnqueueError, YouTubeApiError
 from ..utils import CacheLevel, Notifier
-from .api_utils import LavalinkCacheFetchForGlobalResult
+from .api_utils import (
+    copy_load_result,
+    LavalinkCacheFetchForGlobalResult,
+    SpotifyCollectionCacheFetchResult,
+)
+from .cache_maintenance import LocalCacheMaintenance
+from .db_executor import DatabaseExecutor
 from .global_db import GlobalCacheWrapper
+from .global_uploader import GlobalContributionUploader
+from .http_client import HTTPClient
 from .local_db import LocalCacheWrapper
+from .payload_codec import encode_listing
 from .persist_queue_wrapper import QueueInterface
 from .playlist_interface import get_playlist
 from .playlist_wrapper import PlaylistWrapper
+from .single_flight import SingleFlight
 from .spotify import SpotifyWrapper
+from .write_buffer import WriteBehindBuffer
 from .youtube import YouTubeWrapper
 
 if TYPE_CHECKING:
@@ -55,6 +77,13 @@ if TYPE_CHECKING:
 
 log = logging.getLogger("red.cogs.Music.api.AudioAPIInterface")
 _TOP_100_US = "https://www.youtube.com/playlist?list=PL4fGSI1pDJn5rWitrRWFKdm-ulaFiIyoK"
+# Largest page size the Spotify API allows for each paged query type
+_SPOTIFY_PAGE_LIMITS = {"album": 50, "playlist": 100}
+_SPOTIFY_PAGE_CONCURRENCY = 4
+# Tracks resolved ahead of the one being enqueued by spotify_enqueue
+_SPOTIFY_RESOLVE_WINDOW = 8
+_SPOTIFY_YOUTUBE_CONCURRENCY = 2
+_SPOTIFY_LAVALINK_CONCURRENCY = 4
 # TODO: Get random from global Cache
 
 
@@ -68,7 +97,7 @@ class AudioAPIInterface:
         self,
         bot: Red,
         config: Config,
-        session: aiohttp.ClientSession,
+        http: HTTPClient,
         conn: APSWConnectionWrapper,
         cog: Union[Music, Cog],
         cache: SettingCacheManager,
@@ -78,32 +107,55 @@ class AudioAPIInterface:
         self.conn = conn
         self.cog = cog
         self.config_cache = cache
+        self.db_executor = DatabaseExecutor(self.conn)
         self.spotify_api: SpotifyWrapper = SpotifyWrapper(
-            self.bot, self.config, session, self.cog, self.config_cache
+            self.bot, self.config, http, self.cog, self.config_cache
         )
         self.youtube_api: YouTubeWrapper = YouTubeWrapper(
-            self.bot, self.config, session, self.cog, self.config_cache
+            self.bot, self.config, http, self.cog, self.config_cache
         )
         self.local_cache_api = LocalCacheWrapper(
-            self.bot, self.config, self.conn, self.cog, self.config_cache
+            self.bot, self.config, self.conn, self.cog, self.config_cache, self.db_executor
         )
         self.global_cache_api = GlobalCacheWrapper(
-            self.bot, self.config, session, self.cog, self.config_cache
+            self.bot, self.config, http, self.cog, self.config_cache
         )
         self.persistent_queue_api = QueueInterface(
-            self.bot, self.config, self.conn, self.cog, self.config_cache
+            self.bot, self.config, self.conn, self.cog, self.config_cache, self.db_executor
         )
-        self._session: aiohttp.ClientSession = session
+        self.global_uploader = GlobalContributionUploader(self.global_cache_api, self.db_executor)
+        self.write_buffer = WriteBehindBuffer(self.local_cache_api)
+        self.cache_maintenance = LocalCacheMaintenance(self.local_cache_api, self.config_cache)
+        self._payload_migration: Optional[asyncio.Task] = None
+        self._track_loads = SingleFlight()
+        self.track_cache_hits = 0
+        self.http = http
         self._tasks: MutableMapping = {}
         self._lock: asyncio.Lock = asyncio.Lock()
 
     async def initialize(self) -> None:
         """Initialises the Local Cache connection."""
         await self.local_cache_api.lavalink.init()
+        await self.local_cache_api.lavalink.rebuild_autoplay_pool()
         await self.persistent_queue_api.init()
+        await self.global_uploader.init()
+        self.write_buffer.start()
+        self.global_uploader.start()
+        self.cache_maintenance.start()
+        self._payload_migration = asyncio.create_task(
+            self.local_cache_api.lavalink.migrate_payloads()
+        )
 
-    def close(self) -> None:
+    async def close(self) -> None:
         """Closes the Local Cache connection."""
+        if self._payload_migration is not None:
+            self._payload_migration.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await self._payload_migration
+        # Let the writer thread drain its queue without blocking the event loop
+        await asyncio.get_running_loop().run_in_executor(
+            None, functools.partial(self.db_executor.shutdown, wait=True)
+        )
         self.local_cache_api.lavalink.close()
 
     async def get_random_track_from_db(self, tries=0) -> Optional[MutableMapping]:
@@ -146,25 +198,19 @@ class AudioAPIInterface:
             return
         if action_type == "insert" and isinstance(data, list):
             for table, d in data:
-                if table == "lavalink":
-                    await self.local_cache_api.lavalink.insert(d)
-                elif table == "youtube":
-                    await self.local_cache_api.youtube.insert(d)
-                elif table == "spotify":
-                    await self.local_cache_api.spotify.insert(d)
-        elif action_type == "update" and isinstance(data, dict):
+                self.write_buffer.add_insert(table, d)
+        elif action_type == "update" and isinstance(data, list):
             for table, d in data:
-                if table == "lavalink":
-                    await self.local_cache_api.lavalink.update(data)
-                elif table == "youtube":
-                    await self.local_cache_api.youtube.update(data)
-                elif table == "spotify":
-                    await self.local_cache_api.spotify.update(data)
+                self.write_buffer.add_update(table, d)
         elif action_type == "global" and isinstance(data, list):
-            await asyncio.gather(*[self.global_cache_api.update_global(**d) for d in data])
+            await self.global_uploader.add_many(data)
 
     async def run_tasks(self, ctx: Optional[commands.Context] = None, message_id=None) -> None:
-        """Run tasks for a specific context."""
+        """Run tasks for a specific context.
+
+        Local cache writes are handed to the write-behind buffer as soon as they are appended,
+        so only the Global API submissions are left to run here.
+        """
         if message_id is not None:
             lock_id = message_id
         elif ctx is not None:
@@ -195,10 +241,10 @@ class AudioAPIInterface:
             if IS_DEBUG:
                 log.debug("Running pending writes to database")
             try:
-                tasks: MutableMapping = {"update": [], "insert": [], "global": []}
+                tasks: MutableMapping = {"global": []}
                 async for k, task in AsyncIter(self._tasks.items()):
                     async for t, args in AsyncIter(task.items()):
-                        tasks[t].append(args)
+                        tasks[t].extend(args)
                 self._tasks = {}
                 coro_tasks = [self.route_tasks(a, tasks[a]) for a in tasks]
 
@@ -209,12 +255,22 @@ class AudioAPIInterface:
             else:
                 if IS_DEBUG:
                     log.debug("Completed pending writes to database have finished")
+        await self.spotify_api.close()
+        await self.cache_maintenance.close()
+        await self.global_uploader.close()
+        await self.write_buffer.close()
 
     def append_task(self, ctx: commands.Context, event: str, task: Tuple, _id: int = None) -> None:
         """Add a task to the cache to be run later."""
+        if event == "insert":
+            self.write_buffer.add_insert(*task)
+            return
+        elif event == "update":
+            self.write_buffer.add_update(*task)
+            return
         lock_id = _id or ctx.message.id
         if lock_id not in self._tasks:
-            self._tasks[lock_id] = {"update": [], "insert": [], "global": []}
+            self._tasks[lock_id] = {"global": []}
         self._tasks[lock_id][event].append(task)
 
     async def fetch_spotify_query(
@@ -228,31 +284,23 @@ class AudioAPIInterface:
     ) -> List[str]:
         """Return youtube URLS for the spotify URL provided."""
         youtube_urls = []
-        tracks = await self.fetch_from_spotify_api(
-            query_type, uri, params=None, notifier=notifier, ctx=ctx
-        )
-        total_tracks = len(tracks)
+        total_tracks, pages = await self.fetch_spotify_pages(query_type, uri, notifier=notifier)
         database_entries = []
         track_count = 0
         time_now = int(datetime.datetime.now(datetime.timezone.utc).timestamp())
         youtube_cache = CacheLevel.set_youtube().is_subset(current_cache_level)
         youtube_api_error = None
         global_api = self.cog.global_api_user.get("can_read")
-        async for track in AsyncIter(tracks):
-            if isinstance(track, str):
-                break
-            elif isinstance(track, dict) and track.get("error", {}).get("message") == "invalid id":
-                continue
-            (
-                song_url,
-                track_info,
-                uri,
-                artist_name,
-                track_name,
-                _id,
-                _type,
-            ) = await self.spotify_api.get_spotify_track_info(track, ctx)
-
+        async for (
+            song_url,
+            track_info,
+            uri,
+            artist_name,
+            track_name,
+            _id,
+            _type,
+            isrc,
+        ), val in self._resolve_spotify_pages(ctx, pages, youtube_cache and not skip_youtube):
             database_entries.append(
                 {
                     "id": _id,
@@ -262,28 +310,19 @@ class AudioAPIInterface:
                     "artist_name": artist_name,
                     "song_url": song_url,
                     "track_info": track_info,
+                    "isrc": isrc,
                     "last_updated": time_now,
                     "last_fetched": time_now,
                 }
             )
-            if skip_youtube:
+            if skip_youtube or (val is None and not await self.youtube_api.quota.allow()):
+                # Lavalink searches YouTube for the track info when the Data API isn't used
                 youtube_urls.append(track_info)
             else:
-                val = None
-                if youtube_cache:
-                    try:
-                        (val, last_update) = await self.local_cache_api.youtube.fetch_one(
-                            {"track": track_info}
-                        )
-                    except Exception as exc:
-                        debug_exc_log(
-                            log, exc, "Failed to fetch %r from YouTube table", track_info
-                        )
-
                 if val is None:
                     try:
                         val = await self.fetch_youtube_query(
-                            ctx, track_info, current_cache_level=current_cache_level
+                            ctx, track_info, current_cache_level=current_cache_level, isrc=isrc
                         )
                     except YouTubeApiError as err:
                         val = None
@@ -310,72 +349,231 @@ class AudioAPIInterface:
             self.append_task(ctx, *task)
         return youtube_urls
 
-    async def fetch_from_spotify_api(
-        self,
-        query_type: str,
-        uri: str,
-        recursive: Union[str, bool] = False,
-        params: MutableMapping = None,
-        notifier: Optional[Notifier] = None,
-        ctx: Context = None,
-    ) -> Union[List[MutableMapping], List[str]]:
-        """Gets track info from spotify API."""
+    @staticmethod
+    def _spotify_page_tracks(query_type: str, results: MutableMapping) -> List[MutableMapping]:
+        """The tracks of a Spotify album or playlist page."""
+        tracks_raw = results.get("tracks", results).get("items", [])
+        if query_type == "album":
+            return tracks_raw
+        return [k["track"] for k in tracks_raw if k.get("track")]
 
-        if recursive is False:
-            (call, params) = self.spotify_api.spotify_format_call(query_type, uri)
-            results = await self.spotify_api.make_get_call(call, params)
-        else:
-            if isinstance(recursive, str):
-                results = await self.spotify_api.make_get_call(recursive, params)
-            else:
-                results = {}
+    @staticmethod
+    def _spotify_listing_track(track: MutableMapping) -> MutableMapping:
+        """The fields of a Spotify track kept in a stored collection listing."""
+        return {
+            "name": track.get("name"),
+            "artists": [{"name": artist.get("name")} for artist in track.get("artists") or []],
+            "external_urls": {"spotify": track.get("external_urls", {}).get("spotify")},
+            "uri": track.get("uri"),
+            "id": track.get("id"),
+            "type": track.get("type"),
+            "external_ids": {"isrc": (track.get("external_ids") or {}).get("isrc")},
+        }
+
+    async def _cached_spotify_collection(
+        self, query_type: str, uri: str
+    ) -> Tuple[MutableMapping, Optional[SpotifyCollectionCacheFetchResult]]:
+        """The row a new listing of a collection is stored as, and the stored listing if it
+        is still current.
+
+        Albums don't change, a playlist listing is current while its `snapshot_id` is.
+        """
+        collection = {"uri": f"spotify:{query_type}:{uri}", "snapshot_id": None}
+        cached = None
         try:
-            if results["error"]["status"] == 401 and not recursive:
+            cached = await self.local_cache_api.spotify_collections.fetch_one(collection["uri"])
+        except Exception as exc:
+            debug_exc_log(log, exc, "Failed to fetch %r from Spotify collections table", uri)
+        if query_type == "playlist":
+            collection["snapshot_id"] = await self.spotify_api.get_playlist_snapshot(uri)
+            if cached is not None and (
+                collection["snapshot_id"] is None
+                or cached.snapshot_id != collection["snapshot_id"]
+            ):
+                cached = None
+        return collection, cached
+
+    async def fetch_spotify_pages(
+        self, query_type: str, uri: str, notifier: Optional[Notifier] = None
+    ) -> Tuple[int, AsyncIterator[List[MutableMapping]]]:
+        """Fetch the first page of a Spotify query.
+
+        Returns the total number of tracks and an iterator over every page of tracks, in order.
+        The pages after the first are fetched concurrently as soon as this returns.
+        Album and playlist listings are reused from the local cache while they are current.
+        """
+        (call, params) = self.spotify_api.spotify_format_call(query_type, uri)
+        collection = None
+        if query_type in _SPOTIFY_PAGE_LIMITS:
+            params["limit"] = _SPOTIFY_PAGE_LIMITS[query_type]
+            current_cache_level = await self.config_cache.local_cache_level.get_global()
+            if CacheLevel.set_spotify().is_subset(current_cache_level):
+                collection, cached = await self._cached_spotify_collection(query_type, uri)
+                if cached is not None:
+                    self.append_task(
+                        None, "update", ("spotify_collections", {"uri": collection["uri"]})
+                    )
+                    return cached.total, self._iter_spotify_collection(
+                        cached.tracks, params["limit"], cached.total, notifier
+                    )
+                if query_type == "playlist" and collection["snapshot_id"] is None:
+                    collection = None
+        results = await self.spotify_api.make_get_call(call, params)
+        if "error" in results:
+            if results["error"].get("status") == 401:
                 raise SpotifyFetchError(
                     (
                         "The Spotify API key or client secret has not been set properly. "
                         "\nUse `{prefix}audioset spotifyapi` for instructions."
                     )
                 )
-            elif recursive:
-                return {"next": None}
-        except KeyError:
-            pass
-        if recursive:
-            return results
-        tracks = []
-        track_count = 0
-        total_tracks = results.get("tracks", results).get("total", 1)
-        while True:
-            new_tracks: List = []
-            if query_type == "track":
-                new_tracks = results
-                tracks.append(new_tracks)
-            elif query_type == "album":
-                tracks_raw = results.get("tracks", results).get("items", [])
-                if tracks_raw:
-                    new_tracks = tracks_raw
-                    tracks.extend(new_tracks)
-            else:
-                tracks_raw = results.get("tracks", results).get("items", [])
-                if tracks_raw:
-                    new_tracks = [k["track"] for k in tracks_raw if k.get("track")]
-                    tracks.extend(new_tracks)
-            track_count += len(new_tracks)
+            return 0, self._iter_spotify_pages(query_type, [], call, params, [], 0, notifier)
+        if query_type == "track":
+            return 1, self._iter_spotify_pages(
+                query_type, [results], call, params, [], 1, notifier
+            )
+        page = results.get("tracks", results)
+        total_tracks = page.get("total", 1)
+        limit = page.get("limit") or params.get("limit") or len(page.get("items", []))
+        offsets = []
+        if page.get("next") and limit:
+            offsets = list(range(page.get("offset", 0) + limit, total_tracks, limit))
+        return total_tracks, self._iter_spotify_pages(
+            query_type,
+            self._spotify_page_tracks(query_type, results),
+            call,
+            params,
+            offsets,
+            total_tracks,
+            notifier,
+            collection,
+        )
+
+    async def _iter_spotify_collection(
+        self,
+        tracks: List[MutableMapping],
+        page_size: int,
+        total_tracks: int,
+        notifier: Optional[Notifier],
+    ) -> AsyncIterator[List[MutableMapping]]:
+        for start in range(0, len(tracks), page_size):
+            page = tracks[start : start + page_size]
+            if notifier:
+                await notifier.notify_user(
+                    current=start + len(page), total=total_tracks, key="spotify"
+                )
+            yield page
+
+    async def _iter_spotify_pages(
+        self,
+        query_type: str,
+        first_page: List[MutableMapping],
+        call: str,
+        params: MutableMapping,
+        offsets: List[int],
+        total_tracks: int,
+        notifier: Optional[Notifier],
+        collection: Optional[MutableMapping] = None,
+    ) -> AsyncIterator[List[MutableMapping]]:
+        """Yield the pages of a Spotify query in order.
+
+        When `collection` is given the listing is stored once every page was fetched.
+        """
+        semaphore = asyncio.Semaphore(_SPOTIFY_PAGE_CONCURRENCY)
+
+        async def fetch_page(offset: int) -> MutableMapping:
+            async with semaphore:
+                return await self.spotify_api.make_get_call(call, {**params, "offset": offset})
+
+        pending = [asyncio.ensure_future(fetch_page(offset)) for offset in offsets]
+        track_count = len(first_page)
+        listing = (
+            [] if collection is None else [self._spotify_listing_track(t) for t in first_page]
+        )
+        try:
             if notifier:
                 await notifier.notify_user(current=track_count, total=total_tracks, key="spotify")
-            try:
-                if results.get("next") is None:
+            yield first_page
+            for task in pending:
+                results = await task
+                if "error" in results:
+                    if IS_DEBUG:
+                        log.debug("Spotify page failed, stopping: %r", results["error"])
                     break
-                results = await self.fetch_from_spotify_api(
-                    query_type, uri, results["next"], params, notifier=notifier
-                )
-                continue
-            except KeyError:
-                raise SpotifyFetchError(
-                    "This doesn't seem to be a valid Spotify playlist/album URL or code."
+                new_tracks = self._spotify_page_tracks(query_type, results)
+                track_count += len(new_tracks)
+                if collection is not None:
+                    listing.extend(self._spotify_listing_track(t) for t in new_tracks)
+                if notifier:
+                    await notifier.notify_user(
+                        current=track_count, total=total_tracks, key="spotify"
+                    )
+                yield new_tracks
+            else:
+                if collection is not None and listing:
+                    time_now = int(datetime.datetime.now(datetime.timezone.utc).timestamp())
+                    row = {
+                        **collection,
+                        "total": total_tracks,
+                        "tracks": encode_listing(listing),
+                        "last_updated": time_now,
+                        "last_fetched": time_now,
+                    }
+                    self.append_task(None, "insert", ("spotify_collections", [row]))
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def fetch_from_spotify_api(
+        self, query_type: str, uri: str, notifier: Optional[Notifier] = None
+    ) -> List[MutableMapping]:
+        """Gets track info from spotify API."""
+        __, pages = await self.fetch_spotify_pages(query_type, uri, notifier=notifier)
+        return [track async for page in pages for track in page]
+
+    async def _resolve_spotify_pages(
+        self,
+        ctx: commands.Context,
+        pages: AsyncIterator[List[MutableMapping]],
+        youtube_cache: bool,
+    ) -> AsyncIterator[Tuple[Tuple[str, ...], Optional[str]]]:
+        """Yield the track info of every Spotify track with its cached YouTube URL, if any.
+
+        The YouTube table is looked up once per page, as pages arrive, first by track info and
+        then by ISRC for the tracks that weren't found.
+        ISRC matches are skipped when lyrics are preferred, as they resolve to the recording.
+        """
+        prefer_lyrics = await self.cog.get_lyrics_status(ctx)
+        async for page in pages:
+            track_infos = []
+            stop = False
+            for track in page:
+                if isinstance(track, str):
+                    stop = True
+                    break
+                elif (
+                    isinstance(track, dict)
+                    and track.get("error", {}).get("message") == "invalid id"
+                ):
+                    continue
+                track_infos.append(await self.spotify_api.get_spotify_track_info(track, ctx))
+            cached_urls = {}
+            if youtube_cache and track_infos:
+                try:
+                    cached_urls = await self.local_cache_api.youtube.fetch_many(
+                        info[1] for info in track_infos
+                    )
+                except Exception as exc:
+                    debug_exc_log(log, exc, "Failed to fetch Spotify tracks from YouTube table")
+            cached_isrcs = {}
+            if youtube_cache and not prefer_lyrics:
+                cached_isrcs = await self.local_cache_api.youtube.fetch_many_isrc(
+                    info[7] for info in track_infos if info[1] not in cached_urls
                 )
-        return tracks
+            for track_info in track_infos:
+                yield track_info, cached_urls.get(track_info[1]) or cached_isrcs.get(track_info[7])
+            if stop:
+                return
 
     async def spotify_query(
         self,
@@ -436,6 +634,214 @@ class AudioAPIInterface:
             youtube_urls.append(val)
         return youtube_urls
 
+    async def _search_isrc(
+        self,
+        ctx: commands.Context,
+        player: lavalink.Player,
+        isrc: str,
+        track_info: str,
+        track_name: str,
+        artist_name: str,
+        youtube_cache: bool,
+    ) -> List[lavalink.Track]:
+        """Search YouTube through Lavalink for the recording with the given ISRC.
+
+        The first result is only used if it names the artist or the track, a search for an ISRC
+        nothing is tagged with returns unrelated videos.
+        """
+        try:
+            (result, called_api) = await self.fetch_track(
+                ctx,
+                player,
+                Query.process_input(f'ytsearch:"{isrc}"', self.cog.local_folder_current_path),
+                should_query_global=False,
+                bulk=True,
+            )
+        except (RuntimeError, TrackEnqueueError, aiohttp.ClientError, asyncio.TimeoutError) as exc:
+            debug_exc_log(log, exc, "Failed to search for ISRC %r", isrc)
+            return []
+        if not result or result.has_error or not result.tracks:
+            return []
+        track = result.tracks[0]
+        found = f"{track.title} {track.author}".lower()
+        if artist_name.lower() not in found and track_name.lower() not in found:
+            return []
+        if youtube_cache and track.uri:
+            time_now = int(datetime.datetime.now(datetime.timezone.utc).timestamp())
+            task = (
+                "insert",
+                (
+                    "youtube",
+                    [
+                        {
+                            "track_info": track_info,
+                            "track_url": track.uri,
+                            "isrc": isrc,
+                            "last_updated": time_now,
+                            "last_fetched": time_now,
+                        }
+                    ],
+                ),
+            )
+            self.append_task(ctx, *task)
+        return [track]
+
+    async def _resolve_spotify_track(
+        self,
+        ctx: commands.Context,
+        player: lavalink.Player,
+        track_info: str,
+        track_name: str,
+        artist_name: str,
+        isrc: Optional[str],
+        val: Optional[str],
+        pipeline: MutableMapping,
+        query_global: bool,
+        youtube_cache: bool,
+        current_cache_level: CacheLevel,
+        forced: bool,
+    ) -> Tuple[List[lavalink.Track], Optional[str], Optional[str]]:
+        """Resolve a single Spotify track to Lavalink tracks.
+
+        Tracks missing from the caches are searched by ISRC through Lavalink before falling
+        back to the YouTube Data API.
+        Returns the tracks found, the YouTube API error message, if any, and the title of the
+        error that should stop the remaining tracks from loading, if any.
+        """
+        llresponse = None
+        should_query_global = (
+            query_global and val is None and self.global_cache_api.breaker.available
+        )
+        if should_query_global:
+            llresponse = await self.global_cache_api.get_spotify(track_name, artist_name)
+            if llresponse:
+                if llresponse.get("loadType") == "V2_COMPACT":
+                    llresponse["loadType"] = "V2_COMPAT"
+                llresponse = LoadResult(llresponse)
+            val = llresponse or None
+        if val is None and isrc and not pipeline["prefer_lyrics"]:
+            async with pipeline["lavalink"]:
+                tracks = await self._search_isrc(
+                    ctx, player, isrc, track_info, track_name, artist_name, youtube_cache
+                )
+            if tracks:
+                return tracks, None, None
+        routed = False
+        if val is None and not pipeline["skip_youtube"]:
+            async with pipeline["youtube"]:
+                if not await self.youtube_api.quota.allow():
+                    # Keep what's left of the Data API quota, Lavalink searches YouTube instead
+                    val = track_info
+                    routed = True
+                elif not pipeline["skip_youtube"]:
+                    try:
+                        val = await self.fetch_youtube_query(
+                            ctx, track_info, current_cache_level=current_cache_level, isrc=isrc
+                        )
+                    except YouTubeApiError as err:
+                        pipeline["skip_youtube"] = True
+                        return [], err.message, None
+        if youtube_cache and val and llresponse is None and not routed:
+            task = ("update", ("youtube", {"track": track_info}))
+            self.append_task(ctx, *task)
+        if isinstance(llresponse, LoadResult):
+            return llresponse.tracks, None, None
+        elif not val:
+            return [], None, None
+        result = None
+        if should_query_global and not routed:
+            llresponse = await self.global_cache_api.get_call(val)
+            if llresponse:
+                if llresponse.get("loadType") == "V2_COMPACT":
+                    llresponse["loadType"] = "V2_COMPAT"
+                llresponse = LoadResult(llresponse)
+            result = llresponse or None
+        if not result:
+            try:
+                async with pipeline["lavalink"]:
+                    (result, called_api) = await self.fetch_track(
+                        ctx,
+                        player,
+                        Query.process_input(val, self.cog.local_folder_current_path),
+                        forced=forced,
+                        should_query_global=not should_query_global,
+                        bulk=True,
+                    )
+            except (RuntimeError, aiohttp.ServerDisconnectedError):
+                return [], None, "The connection was reset while loading the playlist."
+            except asyncio.TimeoutError:
+                return [], None, "Player timeout, skipping remaining tracks."
+        return result.tracks, None, None
+
+    async def _spotify_enqueue_pipeline(
+        self,
+        ctx: commands.Context,
+        player: lavalink.Player,
+        pages: AsyncIterator[List[MutableMapping]],
+        query_global: bool,
+        youtube_cache: bool,
+        current_cache_level: CacheLevel,
+        forced: bool,
+    ) -> AsyncIterator[
+        Tuple[Tuple[str, ...], Tuple[List[lavalink.Track], Optional[str], Optional[str]]]
+    ]:
+        """Resolve Spotify tracks concurrently and yield them in playlist order.
+
+        Up to `_SPOTIFY_RESOLVE_WINDOW` tracks are resolved ahead of the one being yielded,
+        YouTube Data API and Lavalink calls each have their own concurrency limit.
+        """
+        pipeline = {
+            "prefer_lyrics": await self.cog.get_lyrics_status(ctx),
+            "skip_youtube": False,
+            "youtube": asyncio.Semaphore(_SPOTIFY_YOUTUBE_CONCURRENCY),
+            "lavalink": asyncio.Semaphore(_SPOTIFY_LAVALINK_CONCURRENCY),
+        }
+        resolving: asyncio.Queue = asyncio.Queue(maxsize=_SPOTIFY_RESOLVE_WINDOW)
+
+        async def produce() -> None:
+            try:
+                async for info, val in self._resolve_spotify_pages(ctx, pages, youtube_cache):
+                    task = asyncio.ensure_future(
+                        self._resolve_spotify_track(
+                            ctx,
+                            player,
+                            info[1],
+                            info[4],
+                            info[3],
+                            info[7],
+                            val,
+                            pipeline,
+                            query_global,
+                            youtube_cache,
+                            current_cache_level,
+                            forced,
+                        )
+                    )
+                    await resolving.put((info, task))
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                await resolving.put(exc)
+                return
+            await resolving.put(None)
+
+        producer = asyncio.ensure_future(produce())
+        try:
+            while True:
+                item = await resolving.get()
+                if item is None:
+                    break
+                elif isinstance(item, Exception):
+                    raise item
+                info, task = item
+                yield info, await task
+        finally:
+            producer.cancel()
+            while not resolving.empty():
+                item = resolving.get_nowait()
+                if isinstance(item, tuple):
+                    item[1].cancel()
+
     async def spotify_enqueue(
         self,
         ctx: commands.Context,
@@ -482,7 +888,7 @@ class AudioAPIInterface:
         track_list: List = []
         has_not_allowed = False
         youtube_api_error = None
-        skip_youtube_api = False
+        resolved = None
         try:
             current_cache_level = await self.config_cache.local_cache_level.get_global()
             enqueued_tracks = 0
@@ -490,10 +896,9 @@ class AudioAPIInterface:
             queue_dur = await self.cog.queue_duration(ctx)
             queue_total_duration = self.cog.format_time(queue_dur)
             before_queue_length = len(player.queue)
-            tracks_from_spotify = await self.fetch_from_spotify_api(
-                query_type, uri, params=None, notifier=notifier
+            total_tracks, pages = await self.fetch_spotify_pages(
+                query_type, uri, notifier=notifier
             )
-            total_tracks = len(tracks_from_spotify)
             if total_tracks < 1 and notifier is not None:
                 lock(ctx, False)
                 embed3 = discord.Embed(
@@ -507,17 +912,27 @@ class AudioAPIInterface:
             time_now = int(datetime.datetime.now(datetime.timezone.utc).timestamp())
             youtube_cache = CacheLevel.set_youtube().is_subset(current_cache_level)
             spotify_cache = CacheLevel.set_spotify().is_subset(current_cache_level)
-            async for track_count, track in AsyncIter(tracks_from_spotify).enumerate(start=1):
-                (
-                    song_url,
-                    track_info,
-                    uri,
-                    artist_name,
-                    track_name,
-                    _id,
-                    _type,
-                ) = await self.spotify_api.get_spotify_track_info(track, ctx)
-
+            track_count = 0
+            resolved = self._spotify_enqueue_pipeline(
+                ctx,
+                player,
+                pages,
+                query_global=global_entry,
+                youtube_cache=youtube_cache,
+                current_cache_level=current_cache_level,
+                forced=forced,
+            )
+            async for (
+                song_url,
+                track_info,
+                uri,
+                artist_name,
+                track_name,
+                _id,
+                _type,
+                isrc,
+            ), (track_object, track_error, abort_title) in resolved:
+                track_count += 1
                 database_entries.append(
                     {
                         "id": _id,
@@ -527,86 +942,21 @@ class AudioAPIInterface:
                         "artist_name": artist_name,
                         "song_url": song_url,
                         "track_info": track_info,
+                        "isrc": isrc,
                         "last_updated": time_now,
                         "last_fetched": time_now,
                     }
                 )
-                val = None
-                llresponse = None
-                if youtube_cache:
-                    try:
-                        (val, last_updated) = await self.local_cache_api.youtube.fetch_one(
-                            {"track": track_info}
-                        )
-                    except Exception as exc:
-                        debug_exc_log(
-                            log, exc, "Failed to fetch %r from YouTube table", track_info
-                        )
-                should_query_global = globaldb_toggle and query_global and val is None
-                if should_query_global:
-                    llresponse = await self.global_cache_api.get_spotify(track_name, artist_name)
-                    if llresponse:
-                        if llresponse.get("loadType") == "V2_COMPACT":
-                            llresponse["loadType"] = "V2_COMPAT"
-                        llresponse = LoadResult(llresponse)
-                    val = llresponse or None
-                if val is None and not skip_youtube_api:
-                    try:
-                        val = await self.fetch_youtube_query(
-                            ctx, track_info, current_cache_level=current_cache_level
-                        )
-                    except YouTubeApiError as err:
-                        val = None
-                        youtube_api_error = err.message
-                        skip_youtube_api = True
-                if not youtube_api_error:
-                    if youtube_cache and val and llresponse is None:
-                        task = ("update", ("youtube", {"track": track_info}))
-                        self.append_task(ctx, *task)
-
-                    if isinstance(llresponse, LoadResult):
-                        track_object = llresponse.tracks
-                    elif val:
-                        result = None
-                        if should_query_global:
-                            llresponse = await self.global_cache_api.get_call(val)
-                            if llresponse:
-                                if llresponse.get("loadType") == "V2_COMPACT":
-                                    llresponse["loadType"] = "V2_COMPAT"
-                                llresponse = LoadResult(llresponse)
-                            result = llresponse or None
-                        if not result:
-                            try:
-                                (result, called_api) = await self.fetch_track(
-                                    ctx,
-                                    player,
-                                    Query.process_input(val, self.cog.local_folder_current_path),
-                                    forced=forced,
-                                    should_query_global=not should_query_global,
-                                )
-                            except (RuntimeError, aiohttp.ServerDisconnectedError):
-                                lock(ctx, False)
-                                error_embed = discord.Embed(
-                                    colour=await ctx.embed_colour(),
-                                    title="The connection was reset while loading the playlist.",
-                                )
-                                if notifier is not None:
-                                    await notifier.update_embed(error_embed)
-                                break
-                            except asyncio.TimeoutError:
-                                lock(ctx, False)
-                                error_embed = discord.Embed(
-                                    colour=await ctx.embed_colour(),
-                                    title="Player timeout, skipping remaining tracks.",
-                                )
-                                if notifier is not None:
-                                    await notifier.update_embed(error_embed)
-                                break
-                        track_object = result.tracks
-                    else:
-                        track_object = []
-                else:
+                if track_error and not youtube_api_error:
+                    youtube_api_error = track_error
+                if youtube_api_error:
                     track_object = []
+                elif abort_title is not None:
+                    lock(ctx, False)
+                    error_embed = discord.Embed(colour=await ctx.embed_colour(), title=abort_title)
+                    if notifier is not None:
+                        await notifier.update_embed(error_embed)
+                    break
                 if (track_count % 2 == 0) or (track_count == total_tracks):
                     key = "lavalink"
                     seconds = "???"
@@ -696,7 +1046,7 @@ class AudioAPIInterface:
 
                     if not player.current:
                         await player.play()
-            if enqueue and tracks_from_spotify:
+            if enqueue and track_count:
                 if total_tracks > enqueued_tracks:
                     maxlength_msg = " {bad_tracks} tracks cannot be queued.".format(
                         bad_tracks=(total_tracks - enqueued_tracks)
@@ -744,6 +1094,8 @@ class AudioAPIInterface:
             raise exc
         finally:
             lock(ctx, False)
+            if resolved is not None:
+                await resolved.aclose()
         return track_list
 
     async def fetch_youtube_query(
@@ -751,6 +1103,7 @@ class AudioAPIInterface:
         ctx: commands.Context,
         track_info: str,
         current_cache_level: CacheLevel = CacheLevel.none(),
+        isrc: Optional[str] = None,
     ) -> Optional[str]:
         """Call the Youtube API and returns the youtube URL that the query matched."""
         track_url = await self.youtube_api.get_call(track_info)
@@ -764,6 +1117,7 @@ class AudioAPIInterface:
                         {
                             "track_info": track_info,
                             "track_url": track_url,
+                            "isrc": isrc,
                             "last_updated": time_now,
                             "last_fetched": time_now,
                         }
@@ -807,6 +1161,7 @@ class AudioAPIInterface:
         forced: bool = False,
         lazy: bool = False,
         should_query_global: bool = True,
+        bulk: bool = False,
     ) -> Tuple[LoadResult, bool]:
         """A replacement for :code:`lavalink.Player.load_tracks`. This will try to get a valid
         cached entry first if not found or if in valid it will then call the lavalink API.
@@ -825,6 +1180,9 @@ class AudioAPIInterface:
             If set to True, it will not call the api if a track is not found.
         should_query_global:bool
             If the method should query the global database.
+        bulk:bool
+            If the call is one of many made for the same request, Lavalink loads for it wait
+            behind every interactive one.
 
         Returns
         -------
@@ -871,6 +1229,7 @@ class AudioAPIInterface:
             and not forced
             and not query.is_local
             and not query.is_spotify
+            and self.global_cache_api.breaker.available
         ):
             valid_global_entry = False
             with contextlib.suppress(Exception):
@@ -890,7 +1249,7 @@ class AudioAPIInterface:
                         log.debug("Querying Global DB api for %r", query)
                     results, called_api = results, False
         if valid_global_entry:
-            pass
+            self.track_cache_hits += 1
         elif lazy:
             called_api = False
         elif val and not forced and isinstance(val, dict):
@@ -902,23 +1261,74 @@ class AudioAPIInterface:
             called_api = False
             if results.has_error:
                 # If cached value has an invalid entry make a new call so that it gets updated
-                results, called_api = await self.fetch_track(ctx, player, query, forced=True)
+                return await self.fetch_track(ctx, player, query, forced=True, bulk=bulk)
+            self.track_cache_hits += 1
             valid_global_entry = False
         else:
-            if IS_DEBUG:
-                log.debug("Querying Lavalink api for %r", query_string)
-            called_api = True
-            try:
-                results = await player.load_tracks(query_string)
-            except KeyError:
-                results = None
-            except RuntimeError:
-                raise TrackEnqueueError
+            # Concurrent misses for the same query share one Lavalink call and one cache write
+            key = (query_string, forced)
+            joined = key in self._track_loads
+            results = await self._track_loads.do(
+                key,
+                functools.partial(
+                    self._load_tracks, ctx, player, query, query_string, cache_enabled, bulk
+                ),
+            )
+            if joined:
+                # Tracks are mutated once enqueued, every caller gets their own
+                results = LoadResult(copy_load_result(results._raw))
+            return results, True
         if results is None:
             results = LoadResult({"loadType": "LOAD_FAILED", "playlistInfo": {}, "tracks": []})
             valid_global_entry = False
+        self._store_track_results(
+            ctx, query, query_string, results, not valid_global_entry, cache_enabled
+        )
+        return results, called_api
+
+    async def _load_tracks(
+        self,
+        ctx: commands.Context,
+        player: lavalink.Player,
+        query: Query,
+        query_string: str,
+        cache_enabled: bool,
+        bulk: bool = False,
+    ) -> LoadResult:
+        """Load `query_string` from Lavalink and queue the cache writes for the result."""
+        if IS_DEBUG:
+            log.debug("Querying Lavalink api for %r", query_string)
+        try:
+            results = await self.cog.node_pool.load_tracks(
+                player,
+                query_string,
+                local=query.is_local,
+                guild_id=ctx.guild.id if ctx.guild else None,
+                bulk=bulk,
+            )
+        except KeyError:
+            results = None
+        except RuntimeError:
+            raise TrackEnqueueError
+        if results is None:
+            results = LoadResult({"loadType": "LOAD_FAILED", "playlistInfo": {}, "tracks": []})
+        self._store_track_results(ctx, query, query_string, results, True, cache_enabled)
+        return results
+
+    def _store_track_results(
+        self,
+        ctx: commands.Context,
+        query: Query,
+        query_string: str,
+        results: LoadResult,
+        update_global: bool,
+        cache_enabled: bool,
+    ) -> None:
+        """Queue the Global API submission and Lavalink table write for a load result."""
         update_global = (
-            globaldb_toggle and not valid_global_entry and self.global_cache_api.has_api_key
+            update_global
+            and self.cog.global_api_user.get("can_read")
+            and self.global_cache_api.has_api_key
         )
         with contextlib.suppress(Exception):
             if (
@@ -962,7 +1372,15 @@ class AudioAPIInterface:
                     "Failed to enqueue write task for %r to Lavalink table",
                     query_string,
                 )
-        return results, called_api
+
+    def fetch_track_stats(self) -> MutableMapping[str, int]:
+        """How often fetch_track was served from a cache, joined a load or called Lavalink."""
+        return {
+            "hits": self.track_cache_hits,
+            "joins": self._track_loads.coalesced,
+            "misses": self._track_loads.calls,
+            "in_flight": len(self._track_loads),
+        }
 
     async def autoplay(self, player: lavalink.Player, playlist_api: PlaylistWrapper):
         """Enqueue a random track."""
@@ -995,6 +1413,7 @@ class AudioAPIInterface:
                 cast(commands.Context, ctx(player.guild, player.guild, self.cog)),
                 player,
                 Query.process_input(_TOP_100_US, self.cog.local_folder_current_path),
+                bulk=True,
             )
             tracks = list(results.tracks)
         if tracks:
@@ -1053,5 +1472,6 @@ class AudioAPIInterface:
             if not player.current:
                 await player.play()
 
-    async def fetch_all_contribute(self) -> List[LavalinkCacheFetchForGlobalResult]:
-        return await self.local_cache_api.lavalink.fetch_all_for_global()
+    async def fetch_all_contribute(self) -> AsyncIterator[LavalinkCacheFetchForGlobalResult]:
+        async for entry in self.local_cache_api.lavalink.fetch_all_for_global():
+            yield entry
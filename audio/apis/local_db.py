@@ -3,11 +3,24 @@ from __future__ import annotations
 
 # Standard Library Imports
 from types import SimpleNamespace
-from typing import Callable, List, MutableMapping, Optional, Tuple, TYPE_CHECKING, Union
-import concurrent
+from typing import (
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
+import asyncio
 import contextlib
 import datetime
 import logging
+import math
 import random
 import time
 
@@ -15,49 +28,120 @@ import time
 from redbot.core import Config
 from redbot.core.bot import Red
 from redbot.core.commands import Cog
-from redbot.core.utils import AsyncIter
 from redbot.core.utils.dbtools import APSWConnectionWrapper
 
+try:
+    # Dependency Imports
+    from redbot import json
+except ImportError:
+    import json
+
 # Music Imports
-from ..audio_logging import debug_exc_log
+from ..audio_logging import debug_exc_log, IS_DEBUG
 from ..sql_statements import (
+    AUTOPLAY_POOL_CREATE_TABLE,
+    AUTOPLAY_POOL_DELETE_ALL,
+    AUTOPLAY_POOL_DELETE_SLOT,
+    AUTOPLAY_POOL_FETCH_SLOT,
+    AUTOPLAY_POOL_INSERT,
+    AUTOPLAY_POOL_MAX_SLOT,
+    AUTOPLAY_POOL_MOVE_SLOT,
+    AUTOPLAY_POOL_QUERY_SLOT,
+    AUTOPLAY_POOL_REBUILD,
     LAVALINK_CREATE_INDEX,
+    LAVALINK_CREATE_INDEX_LAST_FETCHED,
+    LAVALINK_CREATE_INDEX_LAST_UPDATED,
     LAVALINK_CREATE_TABLE,
-    LAVALINK_DELETE_OLD_ENTRIES,
+    LAVALINK_DELETE_LEAST_RECENT,
+    LAVALINK_DELETE_OLD_ENTRIES_BATCH,
     LAVALINK_FETCH_ALL_ENTRIES_GLOBAL,
+    LAVALINK_FETCH_UNSPLIT_PAYLOADS,
     LAVALINK_QUERY,
     LAVALINK_QUERY_ALL,
     LAVALINK_QUERY_LAST_FETCHED_RANDOM,
+    LAVALINK_QUERY_MANY,
+    LAVALINK_QUERY_SIZE,
     LAVALINK_UPDATE,
+    LAVALINK_UPDATE_PAYLOAD,
     LAVALINK_UPSERT,
     PRAGMA_FETCH_user_version,
     PRAGMA_SET_journal_mode,
     PRAGMA_SET_read_uncommitted,
     PRAGMA_SET_temp_store,
     PRAGMA_SET_user_version,
+    SPOTIFY_ADD_COLUMN_ISRC,
+    SPOTIFY_COLLECTIONS_CREATE_INDEX_LAST_FETCHED,
+    SPOTIFY_COLLECTIONS_CREATE_INDEX_LAST_UPDATED,
+    SPOTIFY_COLLECTIONS_CREATE_TABLE,
+    SPOTIFY_COLLECTIONS_DELETE_LEAST_RECENT,
+    SPOTIFY_COLLECTIONS_DELETE_OLD_ENTRIES_BATCH,
+    SPOTIFY_COLLECTIONS_QUERY,
+    SPOTIFY_COLLECTIONS_QUERY_SIZE,
+    SPOTIFY_COLLECTIONS_UPDATE,
+    SPOTIFY_COLLECTIONS_UPSERT,
     SPOTIFY_CREATE_INDEX,
+    SPOTIFY_CREATE_INDEX_ISRC,
+    SPOTIFY_CREATE_INDEX_LAST_FETCHED,
+    SPOTIFY_CREATE_INDEX_LAST_UPDATED,
+    SPOTIFY_CREATE_INDEX_URI,
     SPOTIFY_CREATE_TABLE,
-    SPOTIFY_DELETE_OLD_ENTRIES,
+    SPOTIFY_DELETE_LEAST_RECENT,
+    SPOTIFY_DELETE_OLD_ENTRIES_BATCH,
     SPOTIFY_QUERY,
     SPOTIFY_QUERY_ALL,
     SPOTIFY_QUERY_LAST_FETCHED_RANDOM,
+    SPOTIFY_QUERY_MANY,
+    SPOTIFY_QUERY_SIZE,
     SPOTIFY_UPDATE,
     SPOTIFY_UPSERT,
+    TRACKS_ADD_COLUMN_LAST_FETCHED,
+    TRACKS_CREATE_INDEX_LAST_FETCHED,
+    TRACKS_CREATE_INDEX_LAST_UPDATED,
+    TRACKS_CREATE_TABLE,
+    TRACKS_DELETE_LEAST_RECENT,
+    TRACKS_DELETE_OLD_ENTRIES_BATCH,
+    TRACKS_QUERY_MANY,
+    TRACKS_QUERY_SIZE,
+    TRACKS_SET_LAST_FETCHED,
+    TRACKS_UPDATE_LAST_FETCHED,
+    TRACKS_UPSERT,
+    YOUTUBE_ADD_COLUMN_ISRC,
     YOUTUBE_CREATE_INDEX,
+    YOUTUBE_CREATE_INDEX_ISRC,
+    YOUTUBE_CREATE_INDEX_LAST_FETCHED,
+    YOUTUBE_CREATE_INDEX_LAST_UPDATED,
     YOUTUBE_CREATE_TABLE,
-    YOUTUBE_DELETE_OLD_ENTRIES,
+    YOUTUBE_DELETE_LEAST_RECENT,
+    YOUTUBE_DELETE_OLD_ENTRIES_BATCH,
     YOUTUBE_QUERY,
     YOUTUBE_QUERY_ALL,
     YOUTUBE_QUERY_LAST_FETCHED_RANDOM,
+    YOUTUBE_QUERY_MANY,
+    YOUTUBE_QUERY_MANY_ISRC,
+    YOUTUBE_QUERY_SIZE,
     YOUTUBE_UPDATE,
     YOUTUBE_UPSERT,
 )
 from .api_utils import (
+    copy_load_result,
+    EvictionReport,
     LavalinkCacheFetchForGlobalResult,
     LavalinkCacheFetchResult,
     SpotifyCacheFetchResult,
+    SpotifyCollectionCacheFetchResult,
     YouTubeCacheFetchResult,
 )
+from .db_executor import DatabaseExecutor
+from .memory_cache import LRUCache, MISSING
+from .payload_codec import (
+    decode_track,
+    encode_track,
+    is_track_refs_payload,
+    join_payload,
+    payload_track_keys,
+    REFS_HEADER,
+    split_payload,
+)
 
 if TYPE_CHECKING:
 
@@ -67,7 +151,47 @@ if TYPE_CHECKING:
 
 log = logging.getLogger("red.cogs.Music.api.LocalDB")
 
-_SCHEMA_VERSION = 3
+_SCHEMA_VERSION = 10
+_FRONT_CACHE_SIZE = 4096
+_COLLECTIONS_FRONT_CACHE_SIZE = 32
+_PAYLOAD_MIGRATION_CHUNK = 250
+_AUTOPLAY_WINDOW_DAYS = 7
+_AUTOPLAY_SAMPLE_TRIES = 5
+_EVICTION_BATCH = 500
+_FETCH_MANY_CHUNK = 500
+_FETCH_ALL_PAGE = 500
+_EVICTION_PAUSE = 0.05
+
+# Statements run once when upgrading the local cache, keyed by the schema version adding them.
+# They run after the tables are created, so a new database goes through all of them.
+_MIGRATIONS: Mapping[int, Tuple[str, ...]] = {
+    6: (
+        LAVALINK_CREATE_INDEX_LAST_UPDATED,
+        YOUTUBE_CREATE_INDEX_LAST_UPDATED,
+        SPOTIFY_CREATE_INDEX_URI,
+        SPOTIFY_CREATE_INDEX_LAST_UPDATED,
+        TRACKS_CREATE_INDEX_LAST_UPDATED,
+    ),
+    7: (
+        YOUTUBE_CREATE_INDEX_LAST_FETCHED,
+        SPOTIFY_CREATE_INDEX_LAST_FETCHED,
+    ),
+    8: (
+        SPOTIFY_COLLECTIONS_CREATE_INDEX_LAST_UPDATED,
+        SPOTIFY_COLLECTIONS_CREATE_INDEX_LAST_FETCHED,
+    ),
+    9: (
+        SPOTIFY_ADD_COLUMN_ISRC,
+        YOUTUBE_ADD_COLUMN_ISRC,
+        SPOTIFY_CREATE_INDEX_ISRC,
+        YOUTUBE_CREATE_INDEX_ISRC,
+    ),
+    10: (
+        TRACKS_ADD_COLUMN_LAST_FETCHED,
+        TRACKS_SET_LAST_FETCHED,
+        TRACKS_CREATE_INDEX_LAST_FETCHED,
+    ),
+}
 
 
 class BaseWrapper:
@@ -78,11 +202,13 @@ class BaseWrapper:
         conn: APSWConnectionWrapper,
         cog: Union[Music, Cog],
         cache: SettingCacheManager,
+        executor: DatabaseExecutor,
     ):
         self.bot = bot
         self.config = config
         self.config_cache = cache
         self.database = conn
+        self.executor = executor
         self.statement = SimpleNamespace()
         self.statement.pragma_temp_store = PRAGMA_SET_temp_store
         self.statement.pragma_journal_mode = PRAGMA_SET_journal_mode
@@ -90,69 +216,217 @@ class BaseWrapper:
         self.statement.set_user_version = PRAGMA_SET_user_version
         self.statement.get_user_version = PRAGMA_FETCH_user_version
         self.fetch_result: Optional[Callable] = None
+        self.table_name: str = ""
+        self.upsert_keys: Tuple[str, ...] = ()
+        self.update_key: Optional[str] = None
+        self.front_cache_insert_key: Optional[str] = None
+        self.front_cache = LRUCache(_FRONT_CACHE_SIZE)
         self.cog = cog
 
     async def init(self) -> None:
         """Initialize the local cache"""
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(self.database.cursor().execute, self.statement.pragma_temp_store)
-            executor.submit(self.database.cursor().execute, self.statement.pragma_journal_mode)
-            executor.submit(self.database.cursor().execute, self.statement.pragma_read_uncommitted)
-            executor.submit(self.maybe_migrate)
-            executor.submit(self.database.cursor().execute, LAVALINK_CREATE_TABLE)
-            executor.submit(self.database.cursor().execute, LAVALINK_CREATE_INDEX)
-            executor.submit(self.database.cursor().execute, YOUTUBE_CREATE_TABLE)
-            executor.submit(self.database.cursor().execute, YOUTUBE_CREATE_INDEX)
-            executor.submit(self.database.cursor().execute, SPOTIFY_CREATE_TABLE)
-            executor.submit(self.database.cursor().execute, SPOTIFY_CREATE_INDEX)
-            await self.clean_up_old_entries()
+        for statement in (
+            self.statement.pragma_temp_store,
+            self.statement.pragma_journal_mode,
+            self.statement.pragma_read_uncommitted,
+        ):
+            await self.executor.execute(statement)
+        for statement in (
+            LAVALINK_CREATE_TABLE,
+            LAVALINK_CREATE_INDEX,
+            LAVALINK_CREATE_INDEX_LAST_FETCHED,
+            AUTOPLAY_POOL_CREATE_TABLE,
+            TRACKS_CREATE_TABLE,
+            YOUTUBE_CREATE_TABLE,
+            YOUTUBE_CREATE_INDEX,
+            SPOTIFY_CREATE_TABLE,
+            SPOTIFY_CREATE_INDEX,
+            SPOTIFY_COLLECTIONS_CREATE_TABLE,
+        ):
+            await self.executor.execute(statement)
+        await self.executor.write(self.maybe_migrate)
+        await self.clean_up_old_entries()
 
     def close(self) -> None:
         """Close the connection with the local cache"""
         with contextlib.suppress(Exception):
             self.database.close()
 
-    async def clean_up_old_entries(self) -> None:
-        """Delete entries older than x in the local cache tables"""
+    async def get_max_age(self) -> int:
+        """The timestamp before which entries are too old to be used"""
         max_age = await self.config_cache.local_cache_age.get_global()
         maxage = datetime.datetime.now(tz=datetime.timezone.utc) - datetime.timedelta(days=max_age)
-        maxage_int = int(time.mktime(maxage.timetuple()))
-        values = {"maxage": maxage_int}
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(self.database.cursor().execute, LAVALINK_DELETE_OLD_ENTRIES, values)
-            executor.submit(self.database.cursor().execute, YOUTUBE_DELETE_OLD_ENTRIES, values)
-            executor.submit(self.database.cursor().execute, SPOTIFY_DELETE_OLD_ENTRIES, values)
+        return int(time.mktime(maxage.timetuple()))
+
+    async def clean_up_old_entries(self) -> None:
+        """Delete entries older than x in the local cache tables"""
+        values = {"maxage": await self.get_max_age()}
+        for statement in (
+            LAVALINK_DELETE_OLD_ENTRIES_BATCH,
+            TRACKS_DELETE_OLD_ENTRIES_BATCH,
+            YOUTUBE_DELETE_OLD_ENTRIES_BATCH,
+            SPOTIFY_DELETE_OLD_ENTRIES_BATCH,
+            SPOTIFY_COLLECTIONS_DELETE_OLD_ENTRIES_BATCH,
+        ):
+            try:
+                await self._delete_in_batches(statement, values)
+            except Exception as exc:
+                debug_exc_log(log, exc, "Failed to delete old entries from the local cache")
+
+    def _delete_batch(self, statement: str, values: MutableMapping) -> int:
+        self.database.cursor().execute(statement, values)
+        return self.database.changes()
+
+    async def _delete_in_batches(
+        self, statement: str, values: MutableMapping, limit: Optional[int] = None
+    ) -> int:
+        """Run a batched DELETE until it removes nothing or `limit` rows are gone.
+
+        Each batch is its own transaction on the writer thread, so other writes queued behind
+        it only wait for a single batch.
+        """
+        deleted = 0
+        while limit is None or deleted < limit:
+            batch = _EVICTION_BATCH if limit is None else min(_EVICTION_BATCH, limit - deleted)
+            removed = await self.executor.write(
+                self._delete_batch, statement, {**values, "limit": batch}
+            )
+            deleted += removed
+            if removed < batch:
+                break
+            await asyncio.sleep(_EVICTION_PAUSE)
+        return deleted
+
+    async def _evict_table(
+        self, table: str, statement: SimpleNamespace, maxage: int, max_rows: int, max_bytes: int
+    ) -> EvictionReport:
+        report = EvictionReport(table=table)
+        rows, size = await self.executor.fetchone(statement.query_size)
+        original_size = size
+        report.expired = await self._delete_in_batches(
+            statement.delete_old_batch, {"maxage": maxage}
+        )
+        if report.expired:
+            rows, size = await self.executor.fetchone(statement.query_size)
+        excess = 0
+        if max_rows and rows > max_rows:
+            excess = rows - max_rows
+        if max_bytes and size > max_bytes:
+            excess = max(excess, math.ceil(rows * (size - max_bytes) / size))
+        if excess:
+            report.evicted = await self._delete_in_batches(
+                statement.delete_least_recent, {}, limit=excess
+            )
+            rows, size = await self.executor.fetchone(statement.query_size)
+        report.rows, report.size = rows, size
+        report.reclaimed_bytes = max(0, original_size - size)
+        return report
+
+    async def evict(self, maxage: int, max_rows: int, max_bytes: int) -> List[EvictionReport]:
+        """Delete expired entries, then the least recently used ones above the size caps"""
+        report = await self._evict_table(
+            self.table_name, self.statement, maxage, max_rows, max_bytes
+        )
+        if report.expired or report.evicted:
+            self.front_cache.clear()
+        return [report]
 
     def maybe_migrate(self) -> None:
-        """Maybe migrate Database schema for the local cache"""
+        """Maybe migrate Database schema for the local cache.
+
+        This is blocking, it is meant to be run on the database writer thread.
+        """
         current_version = 0
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            for future in concurrent.futures.as_completed(
-                [executor.submit(self.database.cursor().execute, self.statement.get_user_version)]
-            ):
-                try:
-                    row_result = future.result()
-                    current_version = row_result.fetchone()
-                    break
-                except Exception as exc:
-                    debug_exc_log(log, exc, "Failed to completed fetch from database")
-            if isinstance(current_version, tuple):
-                current_version = current_version[0]
-            if current_version == _SCHEMA_VERSION:
-                return
-            executor.submit(
-                self.database.cursor().execute,
-                self.statement.set_user_version,
-                {"version": _SCHEMA_VERSION},
+        try:
+            current_version = (
+                self.database.cursor().execute(self.statement.get_user_version).fetchone()
+            )
+        except Exception as exc:
+            debug_exc_log(log, exc, "Failed to completed fetch from database")
+        if isinstance(current_version, tuple):
+            current_version = current_version[0]
+        if current_version == _SCHEMA_VERSION:
+            return
+        # Version 4 stores Lavalink payloads in the compact format from `payload_codec`,
+        # version 5 moves their tracks into the tracks table.
+        # Rows written by older versions are converted by `LavalinkTableWrapper.migrate_payloads`
+        try:
+            with self.database.transaction() as transaction:
+                for version, statements in sorted(_MIGRATIONS.items()):
+                    if current_version >= version:
+                        continue
+                    for statement in statements:
+                        transaction.execute(statement)
+                transaction.execute(self.statement.set_user_version)
+        except Exception as exc:
+            debug_exc_log(
+                log, exc, "Failed to migrate the local cache from version %s", current_version
             )
 
     async def insert(self, values: List[MutableMapping]) -> None:
         """Insert an entry into the local cache"""
+        if not values:
+            return
         try:
-            with self.database.transaction() as transaction:
-                transaction.executemany(self.statement.upsert, values)
+            await self.executor.write(self._write_batch, values, [])
         except Exception as exc:
             debug_exc_log(log, exc, "Error during table insert")
+        self.invalidate_front_cache(values)
+
+    def _write_batch(self, inserts: List[MutableMapping], updates: List[MutableMapping]) -> None:
+        with self.database.transaction() as transaction:
+            if inserts:
+                transaction.executemany(self.statement.upsert, inserts)
+            if updates:
+                transaction.executemany(self.statement.update, updates)
+
+    async def write_batch(
+        self, inserts: List[MutableMapping], updates: List[MutableMapping]
+    ) -> None:
+        """Apply a batch of inserts and `last_fetched` updates in a single transaction"""
+        if not inserts and not updates:
+            return
+        await self.executor.write(self._write_batch, inserts, updates)
+        self.invalidate_front_cache(inserts)
+
+    def invalidate_front_cache(self, rows: List[MutableMapping]) -> None:
+        """Drop the in-memory entries for rows that were just written"""
+        if self.front_cache_insert_key is None:
+            return
+        for row in rows:
+            self.front_cache.invalidate(row.get(self.front_cache_insert_key))
+
+    def _join_rows(self, rows: List[tuple]) -> List[tuple]:
+        return rows
+
+    def _read_rows(self, statement: str, values: Optional[MutableMapping] = None) -> List[tuple]:
+        return self._join_rows(self.database.cursor().execute(statement, values).fetchall())
+
+    def _read_page(
+        self, statement: str, values: MutableMapping
+    ) -> Tuple[Optional[int], List[tuple]]:
+        rows = self.database.cursor().execute(statement, values).fetchall()
+        if not rows:
+            return None, []
+        return rows[-1][0], self._join_rows([row[1:] for row in rows])
+
+    async def _iter_rows(
+        self, statement: str, page_size: int = _FETCH_ALL_PAGE
+    ) -> AsyncIterator[tuple]:
+        """Page through a table in rowid order so only one page is held in memory at a time"""
+        last_rowid = 0
+        while True:
+            try:
+                last_rowid, rows = await self.executor.read(
+                    self._read_page, statement, {"last_rowid": last_rowid, "limit": page_size}
+                )
+            except Exception as exc:
+                debug_exc_log(log, exc, "Failed to completed fetch from database")
+                return
+            if last_rowid is None:
+                return
+            for row in rows:
+                yield row
 
     async def update(self, values: MutableMapping) -> None:
         """Update an entry of the local cache"""
@@ -160,8 +434,7 @@ class BaseWrapper:
         try:
             time_now = int(datetime.datetime.now(datetime.timezone.utc).timestamp())
             values["last_fetched"] = time_now
-            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-                executor.submit(self.database.cursor().execute, self.statement.update, values)
+            await self.executor.execute(self.statement.update, values)
         except Exception as exc:
             debug_exc_log(log, exc, "Error during table update")
 
@@ -175,42 +448,82 @@ class BaseWrapper:
         maxage = datetime.datetime.now(tz=datetime.timezone.utc) - datetime.timedelta(days=max_age)
         maxage_int = int(time.mktime(maxage.timetuple()))
         values.update({"maxage": maxage_int})
+        key = values.get(self.update_key)
+        cached = self.front_cache.get(key)
+        if cached is None:
+            return None
+        elif cached is not MISSING:
+            if cached.last_updated > maxage_int:
+                return cached
+            self.front_cache.invalidate(key)
         row = None
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            for future in concurrent.futures.as_completed(
-                [executor.submit(self.database.cursor().execute, self.statement.get_one, values)]
-            ):
-                try:
-                    row_result = future.result()
-                    row = row_result.fetchone()
-                except Exception as exc:
-                    debug_exc_log(log, exc, "Failed to completed fetch from database")
+        try:
+            rows = await self.executor.read(self._read_rows, self.statement.get_one, values)
+            row = rows[0] if rows else None
+        except Exception as exc:
+            debug_exc_log(log, exc, "Failed to completed fetch from database")
+            return None
         if not row:
+            self.front_cache.set_negative(key)
             return None
         if self.fetch_result is None:
             return None
-        return self.fetch_result(*row)
+        result = self.fetch_result(*row)
+        if isinstance(result.last_updated, int):
+            self.front_cache.set(key, result, ttl=result.last_updated - maxage_int)
+        return result
 
-    async def _fetch_all(
-        self, values: MutableMapping
-    ) -> List[Union[LavalinkCacheFetchResult, SpotifyCacheFetchResult, YouTubeCacheFetchResult]]:
-        """Get all entries from the local cache"""
-        output = []
-        row_result = []
+    async def _fetch_many(
+        self, keys: Iterable[str]
+    ) -> Dict[
+        str, Union[LavalinkCacheFetchResult, SpotifyCacheFetchResult, YouTubeCacheFetchResult]
+    ]:
+        """Get the entries of every key found in the local cache, in chunked queries"""
+        output = {}
         if self.fetch_result is None:
-            return []
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            for future in concurrent.futures.as_completed(
-                [executor.submit(self.database.cursor().execute, self.statement.get_all, values)]
-            ):
-                try:
-                    row_result = future.result()
-                except Exception as exc:
-                    debug_exc_log(log, exc, "Failed to completed fetch from database")
-        async for row in AsyncIter(row_result):
-            output.append(self.fetch_result(*row))
+            return output
+        maxage = await self.get_max_age()
+        pending = []
+        for key in dict.fromkeys(keys):
+            cached = self.front_cache.get(key)
+            if cached is None:
+                continue
+            elif cached is not MISSING and cached.last_updated > maxage:
+                output[key] = cached
+            else:
+                pending.append(key)
+        for start in range(0, len(pending), _FETCH_MANY_CHUNK):
+            chunk = pending[start : start + _FETCH_MANY_CHUNK]
+            try:
+                rows = await self.executor.read(
+                    self._read_rows,
+                    self.statement.get_many,
+                    {"keys": json.dumps(chunk), "maxage": maxage},
+                )
+            except Exception as exc:
+                debug_exc_log(log, exc, "Failed to completed fetch from database")
+                continue
+            for key, *row in rows:
+                result = self.fetch_result(*row)
+                output[key] = result
+                if isinstance(result.last_updated, int):
+                    self.front_cache.set(key, result, ttl=result.last_updated - maxage)
+            for key in chunk:
+                if key not in output:
+                    self.front_cache.set_negative(key)
         return output
 
+    async def _fetch_all(
+        self, page_size: int = _FETCH_ALL_PAGE
+    ) -> AsyncIterator[
+        Union[LavalinkCacheFetchResult, SpotifyCacheFetchResult, YouTubeCacheFetchResult]
+    ]:
+        """Iterate over all entries from the local cache"""
+        if self.fetch_result is None:
+            return
+        async for row in self._iter_rows(self.statement.get_all, page_size):
+            yield self.fetch_result(*row)
+
     async def _fetch_random(
         self, values: MutableMapping
     ) -> Optional[
@@ -218,20 +531,11 @@ class BaseWrapper:
     ]:
         """Get a random entry from the local cache"""
         row = None
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            for future in concurrent.futures.as_completed(
-                [
-                    executor.submit(
-                        self.database.cursor().execute, self.statement.get_random, values
-                    )
-                ]
-            ):
-                try:
-                    row_result = future.result()
-                    rows = row_result.fetchall()
-                    row = random.choice(rows) if rows else None
-                except Exception as exc:
-                    debug_exc_log(log, exc, "Failed to completed random fetch from database")
+        try:
+            rows = await self.executor.read(self._read_rows, self.statement.get_random, values)
+            row = random.choice(rows) if rows else None
+        except Exception as exc:
+            debug_exc_log(log, exc, "Failed to completed random fetch from database")
         if not row:
             return None
         if self.fetch_result is None:
@@ -247,14 +551,23 @@ class YouTubeTableWrapper(BaseWrapper):
         conn: APSWConnectionWrapper,
         cog: Union[Music, Cog],
         cache: SettingCacheManager,
+        executor: DatabaseExecutor,
     ):
-        super().__init__(bot, config, conn, cog, cache)
+        super().__init__(bot, config, conn, cog, cache, executor)
         self.statement.upsert = YOUTUBE_UPSERT
         self.statement.update = YOUTUBE_UPDATE
         self.statement.get_one = YOUTUBE_QUERY
+        self.statement.get_many = YOUTUBE_QUERY_MANY
         self.statement.get_all = YOUTUBE_QUERY_ALL
         self.statement.get_random = YOUTUBE_QUERY_LAST_FETCHED_RANDOM
+        self.statement.delete_old_batch = YOUTUBE_DELETE_OLD_ENTRIES_BATCH
+        self.statement.delete_least_recent = YOUTUBE_DELETE_LEAST_RECENT
+        self.statement.query_size = YOUTUBE_QUERY_SIZE
+        self.table_name = "youtube"
         self.fetch_result = YouTubeCacheFetchResult
+        self.upsert_keys = ("track_info", "track_url")
+        self.update_key = "track"
+        self.front_cache_insert_key = "track_info"
 
     async def fetch_one(
         self, values: MutableMapping
@@ -265,12 +578,37 @@ class YouTubeTableWrapper(BaseWrapper):
             return None, None
         return result.query, result.updated_on
 
-    async def fetch_all(self, values: MutableMapping) -> List[YouTubeCacheFetchResult]:
-        """Get all entries from the Youtube table"""
-        result = await self._fetch_all(values)
-        if result and isinstance(result[0], YouTubeCacheFetchResult):
-            return result
-        return []
+    async def fetch_many(self, tracks: Iterable[str]) -> Dict[str, str]:
+        """Get the YouTube URL of every track found in the Youtube table"""
+        results = await self._fetch_many(tracks)
+        return {k: r.query for k, r in results.items() if isinstance(r.query, str)}
+
+    async def fetch_many_isrc(self, isrcs: Iterable[Optional[str]]) -> Dict[str, str]:
+        """Get the YouTube URL stored for every ISRC found in the Youtube table"""
+        output = {}
+        maxage = await self.get_max_age()
+        pending = list(dict.fromkeys(isrc for isrc in isrcs if isrc))
+        for start in range(0, len(pending), _FETCH_MANY_CHUNK):
+            chunk = pending[start : start + _FETCH_MANY_CHUNK]
+            try:
+                rows = await self.executor.fetchall(
+                    YOUTUBE_QUERY_MANY_ISRC, {"keys": json.dumps(chunk), "maxage": maxage}
+                )
+            except Exception as exc:
+                debug_exc_log(log, exc, "Failed to completed fetch from database")
+                continue
+            for isrc, youtube_url, __ in rows:
+                if isinstance(youtube_url, str):
+                    output[isrc] = youtube_url
+        return output
+
+    async def fetch_all(
+        self, page_size: int = _FETCH_ALL_PAGE
+    ) -> AsyncIterator[YouTubeCacheFetchResult]:
+        """Iterate over all entries from the Youtube table"""
+        async for result in self._fetch_all(page_size):
+            if isinstance(result, YouTubeCacheFetchResult):
+                yield result
 
     async def fetch_random(self, values: MutableMapping) -> Optional[str]:
         """Get a random entry from the Youtube table"""
@@ -288,14 +626,23 @@ class SpotifyTableWrapper(BaseWrapper):
         conn: APSWConnectionWrapper,
         cog: Union[Music, Cog],
         cache: SettingCacheManager,
+        executor: DatabaseExecutor,
     ):
-        super().__init__(bot, config, conn, cog, cache)
+        super().__init__(bot, config, conn, cog, cache, executor)
         self.statement.upsert = SPOTIFY_UPSERT
         self.statement.update = SPOTIFY_UPDATE
         self.statement.get_one = SPOTIFY_QUERY
+        self.statement.get_many = SPOTIFY_QUERY_MANY
         self.statement.get_all = SPOTIFY_QUERY_ALL
         self.statement.get_random = SPOTIFY_QUERY_LAST_FETCHED_RANDOM
+        self.statement.delete_old_batch = SPOTIFY_DELETE_OLD_ENTRIES_BATCH
+        self.statement.delete_least_recent = SPOTIFY_DELETE_LEAST_RECENT
+        self.statement.query_size = SPOTIFY_QUERY_SIZE
+        self.table_name = "spotify"
         self.fetch_result = SpotifyCacheFetchResult
+        self.upsert_keys = ("id", "type", "uri")
+        self.update_key = "uri"
+        self.front_cache_insert_key = "uri"
 
     async def fetch_one(
         self, values: MutableMapping
@@ -306,12 +653,18 @@ class SpotifyTableWrapper(BaseWrapper):
             return None, None
         return result.query, result.updated_on
 
-    async def fetch_all(self, values: MutableMapping) -> List[SpotifyCacheFetchResult]:
-        """Get all entries from the Spotify table"""
-        result = await self._fetch_all(values)
-        if result and isinstance(result[0], SpotifyCacheFetchResult):
-            return result
-        return []
+    async def fetch_many(self, uris: Iterable[str]) -> Dict[str, str]:
+        """Get the track info of every URI found in the Spotify table"""
+        results = await self._fetch_many(uris)
+        return {k: r.query for k, r in results.items() if isinstance(r.query, str)}
+
+    async def fetch_all(
+        self, page_size: int = _FETCH_ALL_PAGE
+    ) -> AsyncIterator[SpotifyCacheFetchResult]:
+        """Iterate over all entries from the Spotify table"""
+        async for result in self._fetch_all(page_size):
+            if isinstance(result, SpotifyCacheFetchResult):
+                yield result
 
     async def fetch_random(self, values: MutableMapping) -> Optional[str]:
         """Get a random entry from the Spotify table"""
@@ -321,6 +674,44 @@ class SpotifyTableWrapper(BaseWrapper):
         return result.query
 
 
+class SpotifyCollectionsTableWrapper(BaseWrapper):
+    """The expanded track listings of Spotify playlists and albums.
+
+    Playlist listings are stored with their `snapshot_id`, so they can be reused for as long as
+    the playlist is unchanged.
+    """
+
+    def __init__(
+        self,
+        bot: Red,
+        config: Config,
+        conn: APSWConnectionWrapper,
+        cog: Union[Music, Cog],
+        cache: SettingCacheManager,
+        executor: DatabaseExecutor,
+    ):
+        super().__init__(bot, config, conn, cog, cache, executor)
+        self.statement.upsert = SPOTIFY_COLLECTIONS_UPSERT
+        self.statement.update = SPOTIFY_COLLECTIONS_UPDATE
+        self.statement.get_one = SPOTIFY_COLLECTIONS_QUERY
+        self.statement.delete_old_batch = SPOTIFY_COLLECTIONS_DELETE_OLD_ENTRIES_BATCH
+        self.statement.delete_least_recent = SPOTIFY_COLLECTIONS_DELETE_LEAST_RECENT
+        self.statement.query_size = SPOTIFY_COLLECTIONS_QUERY_SIZE
+        self.table_name = "spotify_collections"
+        self.fetch_result = SpotifyCollectionCacheFetchResult
+        self.upsert_keys = ("uri",)
+        self.update_key = "uri"
+        self.front_cache_insert_key = "uri"
+        self.front_cache = LRUCache(_COLLECTIONS_FRONT_CACHE_SIZE)
+
+    async def fetch_one(self, uri: str) -> Optional[SpotifyCollectionCacheFetchResult]:
+        """Get the stored listing of a Spotify collection"""
+        result = await self._fetch_one({"uri": uri})
+        if not result or not isinstance(result.tracks, list):
+            return None
+        return result
+
+
 class LavalinkTableWrapper(BaseWrapper):
     def __init__(
         self,
@@ -329,16 +720,173 @@ class LavalinkTableWrapper(BaseWrapper):
         conn: APSWConnectionWrapper,
         cog: Union[Music, Cog],
         cache: SettingCacheManager,
+        executor: DatabaseExecutor,
     ):
-        super().__init__(bot, config, conn, cog, cache)
+        super().__init__(bot, config, conn, cog, cache, executor)
         self.statement.upsert = LAVALINK_UPSERT
         self.statement.update = LAVALINK_UPDATE
         self.statement.get_one = LAVALINK_QUERY
+        self.statement.get_many = LAVALINK_QUERY_MANY
         self.statement.get_all = LAVALINK_QUERY_ALL
         self.statement.get_random = LAVALINK_QUERY_LAST_FETCHED_RANDOM
+        self.statement.delete_old_batch = LAVALINK_DELETE_OLD_ENTRIES_BATCH
+        self.statement.delete_least_recent = LAVALINK_DELETE_LEAST_RECENT
+        self.statement.query_size = LAVALINK_QUERY_SIZE
+        self.table_name = "lavalink"
         self.statement.get_all_global = LAVALINK_FETCH_ALL_ENTRIES_GLOBAL
         self.fetch_result = LavalinkCacheFetchResult
+        self.upsert_keys = ("query",)
+        self.update_key = "query"
+        self.front_cache_insert_key = "query"
+        self.front_cache = LRUCache(_FRONT_CACHE_SIZE // 4)
         self.fetch_for_global: Optional[Callable] = LavalinkCacheFetchForGlobalResult
+        self.track_statement = SimpleNamespace()
+        self.track_statement.delete_old_batch = TRACKS_DELETE_OLD_ENTRIES_BATCH
+        self.track_statement.delete_least_recent = TRACKS_DELETE_LEAST_RECENT
+        self.track_statement.query_size = TRACKS_QUERY_SIZE
+
+    async def evict(self, maxage: int, max_rows: int, max_bytes: int) -> List[EvictionReport]:
+        """Evict from the Lavalink table, then from the tracks it references.
+
+        A single entry can reference many tracks, so the tracks table is only held to the size
+        cap. Tracks share the `last_fetched` of the most recently used entry referencing them,
+        so the tracks of entries still in use are evicted last. Tracks no longer referenced
+        are removed once they are older than the max age.
+        """
+        reports = await super().evict(maxage, max_rows, max_bytes)
+        reports.append(
+            await self._evict_table("tracks", self.track_statement, maxage, 0, max_bytes)
+        )
+        return reports
+
+    @staticmethod
+    def _split_rows(
+        rows: List[MutableMapping], last_updated_key: str = "last_updated"
+    ) -> Tuple[List[MutableMapping], List[MutableMapping]]:
+        """Move the tracks of each payload into rows for the tracks table"""
+        split_rows = []
+        tracks: MutableMapping[str, MutableMapping] = {}
+        for row in rows:
+            data = row.get("data")
+            if data is None or is_track_refs_payload(data):
+                split_rows.append(row)
+                continue
+            try:
+                payload, row_tracks = split_payload(data)
+                for key, track in row_tracks:
+                    tracks[key] = {
+                        "key": key,
+                        "data": encode_track(track),
+                        "last_updated": row.get(last_updated_key),
+                        "last_fetched": row.get("last_fetched", row.get(last_updated_key)),
+                    }
+            except Exception as exc:
+                debug_exc_log(
+                    log, exc, "Failed to split Lavalink payload for %r", row.get("query")
+                )
+                split_rows.append(row)
+                continue
+            split_rows.append({**row, "data": payload})
+        return split_rows, list(tracks.values())
+
+    def _write_batch(self, inserts: List[MutableMapping], updates: List[MutableMapping]) -> None:
+        inserts, tracks = self._split_rows(inserts)
+        with self.database.transaction() as transaction:
+            if tracks:
+                transaction.executemany(TRACKS_UPSERT, tracks)
+            if inserts:
+                transaction.executemany(self.statement.upsert, inserts)
+            if updates:
+                transaction.executemany(self.statement.update, updates)
+                self._touch_tracks(transaction, updates)
+            played = [{"query": row["query"]} for row in (*inserts, *updates) if row.get("query")]
+            if played:
+                transaction.executemany(AUTOPLAY_POOL_INSERT, played)
+
+    @staticmethod
+    def _touch_tracks(transaction, updates: List[MutableMapping]) -> None:
+        """Carry the `last_fetched` of updated entries over to the tracks they reference"""
+        last_fetched = {row["query"]: row["last_fetched"] for row in updates}
+        touched = []
+        for query, data, __ in transaction.execute(
+            LAVALINK_QUERY_MANY, {"keys": json.dumps(list(last_fetched)), "maxage": 0}
+        ).fetchall():
+            if is_track_refs_payload(data):
+                touched.append(
+                    {
+                        "keys": json.dumps(payload_track_keys(data)),
+                        "last_fetched": last_fetched[query],
+                    }
+                )
+        if touched:
+            transaction.executemany(TRACKS_UPDATE_LAST_FETCHED, touched)
+
+    def _join_rows(self, rows: List[tuple]) -> List[tuple]:
+        keys = {
+            key
+            for row in rows
+            for value in row
+            if is_track_refs_payload(value)
+            for key in payload_track_keys(value)
+        }
+        if not keys:
+            return rows
+        tracks = {
+            key: decode_track(data)
+            for key, data in self.database.cursor().execute(
+                TRACKS_QUERY_MANY, {"keys": json.dumps(list(keys))}
+            )
+        }
+        output = []
+        for row in rows:
+            try:
+                output.append(
+                    tuple(
+                        join_payload(value, tracks) if is_track_refs_payload(value) else value
+                        for value in row
+                    )
+                )
+            except KeyError:
+                # A referenced track aged out of the tracks table, treat the entry as missing
+                continue
+        return output
+
+    def _migrate_payloads(self, rows: List[tuple]) -> int:
+        values = [
+            {"rowid": rowid, "data": data, "last_updated": last_updated}
+            for rowid, data, last_updated in rows
+        ]
+        values, tracks = self._split_rows(values)
+        values = [row for row in values if is_track_refs_payload(row["data"])]
+        with self.database.transaction() as transaction:
+            if tracks:
+                transaction.executemany(TRACKS_UPSERT, tracks)
+            if values:
+                transaction.executemany(LAVALINK_UPDATE_PAYLOAD, values)
+        return len(values)
+
+    async def migrate_payloads(self, chunk_size: int = _PAYLOAD_MIGRATION_CHUNK) -> int:
+        """Move the tracks of rows written by older versions into the tracks table,
+        one chunk at a time"""
+        migrated = 0
+        last_rowid = 0
+        while True:
+            try:
+                rows = await self.executor.fetchall(
+                    LAVALINK_FETCH_UNSPLIT_PAYLOADS,
+                    {"last_rowid": last_rowid, "limit": chunk_size, "header": REFS_HEADER},
+                )
+                if not rows:
+                    break
+                last_rowid = rows[-1][0]
+                migrated += await self.executor.write(self._migrate_payloads, rows)
+            except Exception as exc:
+                debug_exc_log(log, exc, "Failed to migrate Lavalink payloads")
+                break
+            await asyncio.sleep(0)
+        if IS_DEBUG and migrated:
+            log.debug("Re-encoded %d Lavalink cache entries", migrated)
+        return migrated
 
     async def fetch_one(
         self, values: MutableMapping
@@ -347,39 +895,108 @@ class LavalinkTableWrapper(BaseWrapper):
         result = await self._fetch_one(values)
         if not result or not isinstance(result.query, dict):
             return None, None
-        return result.query, result.updated_on
+        return copy_load_result(result.query), result.updated_on
 
-    async def fetch_all(self, values: MutableMapping) -> List[LavalinkCacheFetchResult]:
-        """Get all entries from the Lavalink table"""
-        result = await self._fetch_all(values)
-        if result and isinstance(result[0], LavalinkCacheFetchResult):
-            return result
-        return []
+    async def fetch_many(self, queries: Iterable[str]) -> Dict[str, MutableMapping]:
+        """Get the LoadResult of every query found in the Lavalink table"""
+        results = await self._fetch_many(queries)
+        return {
+            k: copy_load_result(r.query) for k, r in results.items() if isinstance(r.query, dict)
+        }
 
-    async def fetch_random(self, values: MutableMapping) -> Optional[MutableMapping]:
-        """Get a random entry from the Lavalink table"""
-        result = await self._fetch_random(values)
-        if not result or not isinstance(result.query, dict):
+    async def fetch_all(
+        self, page_size: int = _FETCH_ALL_PAGE
+    ) -> AsyncIterator[LavalinkCacheFetchResult]:
+        """Iterate over all entries from the Lavalink table"""
+        async for result in self._fetch_all(page_size):
+            if isinstance(result, LavalinkCacheFetchResult):
+                yield result
+
+    def _rebuild_autoplay_pool(self, values: MutableMapping) -> None:
+        with self.database.transaction() as transaction:
+            transaction.execute(AUTOPLAY_POOL_DELETE_ALL)
+            transaction.execute(AUTOPLAY_POOL_REBUILD, values)
+
+    async def rebuild_autoplay_pool(self) -> None:
+        """Refill the autoplay pool with every entry played in the autoplay window"""
+        try:
+            values = await self._autoplay_window()
+            await self.executor.write(self._rebuild_autoplay_pool, values)
+        except Exception as exc:
+            debug_exc_log(log, exc, "Failed to rebuild the autoplay pool")
+
+    async def _autoplay_window(self) -> MutableMapping:
+        now = datetime.datetime.now(tz=datetime.timezone.utc)
+        day = now - datetime.timedelta(days=_AUTOPLAY_WINDOW_DAYS)
+        max_age = await self.config_cache.local_cache_age.get_global()
+        maxage = now - datetime.timedelta(days=max_age)
+        return {"day": int(day.timestamp()), "maxage": int(time.mktime(maxage.timetuple()))}
+
+    def _sample_autoplay_pool(self) -> Optional[tuple]:
+        (max_slot,) = self.database.cursor().execute(AUTOPLAY_POOL_MAX_SLOT).fetchone()
+        if not max_slot:
             return None
-        return result.query
+        slot = random.randint(1, max_slot)
+        rows = self._read_rows(AUTOPLAY_POOL_QUERY_SLOT, {"slot": slot})
+        if rows:
+            return rows[0]
+        # The entry references tracks that no longer exist
+        rows = self.database.cursor().execute(AUTOPLAY_POOL_QUERY_SLOT, {"slot": slot}).fetchall()
+        # An empty tuple means the slot was emptied by an eviction since `max(slot)` was read
+        return (rows[0][0], None, None, None) if rows else ()
 
-    async def fetch_all_for_global(self) -> List[LavalinkCacheFetchForGlobalResult]:
-        """Get all entries from the Lavalink table"""
-        output: List[LavalinkCacheFetchForGlobalResult] = []
-        row_result = []
-        if self.fetch_for_global is None:
-            return []
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            for future in concurrent.futures.as_completed(
-                [executor.submit(self.database.cursor().execute, self.statement.get_all_global)]
+    def _evict_from_autoplay_pool(self, query: str) -> None:
+        with self.database.transaction() as transaction:
+            row = transaction.execute(AUTOPLAY_POOL_FETCH_SLOT, {"query": query}).fetchone()
+            if not row:
+                return
+            (max_slot,) = transaction.execute(AUTOPLAY_POOL_MAX_SLOT).fetchone()
+            transaction.execute(AUTOPLAY_POOL_DELETE_SLOT, {"slot": row[0]})
+            if max_slot != row[0]:
+                transaction.execute(
+                    AUTOPLAY_POOL_MOVE_SLOT, {"slot": row[0], "last_slot": max_slot}
+                )
+
+    async def fetch_random(self, values: MutableMapping) -> Optional[MutableMapping]:
+        """Get a random entry played after `values["day"]` from the Lavalink table.
+
+        Each slot of the autoplay pool holds one recently played query, so a sample is a lookup
+        of a random slot. Entries which are no longer eligible are evicted and the sample retried.
+        """
+        for __ in range(_AUTOPLAY_SAMPLE_TRIES):
+            try:
+                row = await self.executor.read(self._sample_autoplay_pool)
+            except Exception as exc:
+                debug_exc_log(log, exc, "Failed to completed random fetch from database")
+                return None
+            if row is None:
+                return None
+            if not row:
+                continue
+            query, data, last_updated, last_fetched = row
+            if (
+                data is not None
+                and (last_fetched or 0) > values["day"]
+                and (last_updated or 0) > values["maxage"]
             ):
-                try:
-                    row_result = future.result()
-                except Exception as exc:
-                    debug_exc_log(log, exc, "Failed to completed fetch from database")
-        async for row in AsyncIter(row_result):
-            output.append(self.fetch_for_global(*row))
-        return output
+                result = self.fetch_result(data, last_updated)
+                if isinstance(result.query, dict):
+                    return result.query
+            try:
+                await self.executor.write(self._evict_from_autoplay_pool, query)
+            except Exception as exc:
+                debug_exc_log(log, exc, "Failed to evict %r from the autoplay pool", query)
+        return None
+
+    async def fetch_all_for_global(
+        self, page_size: int = _FETCH_ALL_PAGE
+    ) -> AsyncIterator[LavalinkCacheFetchForGlobalResult]:
+        """Iterate over all entries from the Lavalink table, their payloads are only decoded
+        when accessed"""
+        if self.fetch_for_global is None:
+            return
+        async for row in self._iter_rows(self.statement.get_all_global, page_size):
+            yield self.fetch_for_global(*row)
 
 
 class LocalCacheWrapper:
@@ -392,18 +1009,37 @@ class LocalCacheWrapper:
         conn: APSWConnectionWrapper,
         cog: Union[Music, Cog],
         cache: SettingCacheManager,
+        executor: DatabaseExecutor,
     ):
         self.bot = bot
         self.config = config
         self.database = conn
         self.cog = cog
         self.config_cache = cache
+        self.executor = executor
         self.lavalink: LavalinkTableWrapper = LavalinkTableWrapper(
-            bot, config, conn, self.cog, self.config_cache
+            bot, config, conn, self.cog, self.config_cache, self.executor
         )
         self.spotify: SpotifyTableWrapper = SpotifyTableWrapper(
-            bot, config, conn, self.cog, self.config_cache
+            bot, config, conn, self.cog, self.config_cache, self.executor
         )
         self.youtube: YouTubeTableWrapper = YouTubeTableWrapper(
-            bot, config, conn, self.cog, self.config_cache
+            bot, config, conn, self.cog, self.config_cache, self.executor
         )
+        self.spotify_collections: SpotifyCollectionsTableWrapper = SpotifyCollectionsTableWrapper(
+            bot, config, conn, self.cog, self.config_cache, self.executor
+        )
+
+    def clear_front_cache(self) -> None:
+        """Forget every in-memory entry, called when the cache settings change"""
+        for table in (self.lavalink, self.spotify, self.youtube, self.spotify_collections):
+            table.front_cache.clear()
+
+    def front_cache_stats(self) -> MutableMapping[str, MutableMapping[str, Union[int, float]]]:
+        """Hit and miss counters of the in-memory cache of each table"""
+        return {
+            "lavalink": self.lavalink.front_cache.stats(),
+            "spotify": self.spotify.front_cache.stats(),
+            "youtube": self.youtube.front_cache.stats(),
+            "spotify_collections": self.spotify_collections.front_cache.stats(),
+        }
@@ -0,0 +1,86 @@
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+from collections import OrderedDict
+from typing import Any, Hashable, MutableMapping, Optional, Tuple, Union
+import time
+
+__all__ = ["MISSING", "LRUCache"]
+
+MISSING = object()
+
+
+class LRUCache:
+    """A bounded in-memory LRU cache with per-entry expiry.
+
+    Negative entries (a known miss) are stored as :code:`None` so repeated misses for the same
+    key do not need to go back to the backing store.
+    """
+
+    def __init__(self, max_size: int, negative_ttl: float = 60.0):
+        self.max_size = max(1, max_size)
+        self.negative_ttl = negative_ttl
+        self._entries: OrderedDict[Hashable, Tuple[Optional[float], Any]] = OrderedDict()
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, count=False) is not MISSING
+
+    def get(self, key: Hashable, count: bool = True) -> Any:
+        """Return the cached value, :code:`None` for a negative entry or :data:`MISSING`."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at is None or expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                if count:
+                    if value is None:
+                        self.negative_hits += 1
+                    else:
+                        self.hits += 1
+                return value
+            del self._entries[key]
+        if count:
+            self.misses += 1
+        return MISSING
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store `value` for `ttl` seconds, or until evicted if `ttl` is :code:`None`."""
+        if ttl is not None and ttl <= 0:
+            self._entries.pop(key, None)
+            return
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def set_negative(self, key: Hashable) -> None:
+        """Remember that `key` has no value for :attr:`negative_ttl` seconds."""
+        self.set(key, None, ttl=self.negative_ttl)
+
+    def invalidate(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> MutableMapping[str, Union[int, float]]:
+        lookups = self.hits + self.negative_hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round((self.hits + self.negative_hits) / lookups, 4) if lookups else 0.0,
+        }
@@ -0,0 +1,410 @@
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+from dataclasses import dataclass, field
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    MutableMapping,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
+import asyncio
+import contextlib
+import logging
+import time
+
+# Dependency Imports
+from yarl import URL
+import aiohttp
+import discord
+
+try:
+    # Dependency Imports
+    from redbot import json
+except ImportError:
+    import json
+
+# My Modded Imports
+from lavalink.rest_api import LoadResult, LoadType, reformat_query
+import lavalink
+
+# Music Imports
+from ..audio_logging import debug_exc_log, IS_DEBUG
+from .fair_share import FairShareLimiter
+from .http_client import LatencyHistogram
+
+if TYPE_CHECKING:
+
+    # Music Imports
+    from .http_client import HTTPClient
+
+__all__ = ["NodePool", "PooledNode"]
+
+log = logging.getLogger("red.cogs.Music.api.NodePool")
+
+_REBALANCE_INTERVAL = 300
+_FAILOVER_CONCURRENCY = 5
+# Track loads running at once over every node
+_REST_CONCURRENCY = 6
+# How much more loaded than the least loaded node a node has to be before players are moved
+_REBALANCE_MARGIN = 5.0
+
+
+@dataclass
+class PooledNode:
+    """A connected Lavalink node and the placement settings it was configured with."""
+
+    name: str
+    node: lavalink.node.Node
+    region: str = ""
+    shard_id: int = -1
+    search_only: bool = False
+    rest_uri: str = ""
+    password: str = ""
+    in_flight: int = field(default=0, init=False)
+    loads: int = field(default=0, init=False)
+    failures: int = field(default=0, init=False)
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram, init=False)
+
+    @property
+    def ready(self) -> bool:
+        return self.node.ready
+
+    @property
+    def guild_ids(self):
+        return self.node.player_manager.guild_ids
+
+    @property
+    def players(self) -> List[lavalink.Player]:
+        return list(self.node.player_manager.players)
+
+    def serves(self, channel: discord.VoiceChannel) -> bool:
+        """Whether players for `channel` may be placed on this node."""
+        if self.search_only or not self.ready:
+            return False
+        return self.shard_id < 0 or channel.guild.shard_id == self.shard_id
+
+
+class NodePool:
+    """Every Lavalink node the cog is connected to.
+
+    New players are placed on the least loaded node, scored from its live stats the way the
+    Lavalink clients do: players, CPU load and the frames it failed to send.
+    Nodes set to a voice region are preferred for channels in that region, nodes set to a shard
+    only get players of guilds on that shard and search only nodes never get players.
+    Idle players are moved off nodes that became a lot busier than the others.
+    When a node loses its connection its players are moved to the others, with their track,
+    position and filters.
+    Track loads go to the search only nodes when there are any, so resolving playlists doesn't
+    take CPU and bandwidth from the nodes streaming audio.
+    """
+
+    def __init__(
+        self,
+        http: HTTPClient,
+        rebalance_interval: float = _REBALANCE_INTERVAL,
+        rebalance_margin: float = _REBALANCE_MARGIN,
+    ):
+        self.http = http
+        self.limiter = FairShareLimiter(_REST_CONCURRENCY)
+        self.rebalance_interval = rebalance_interval
+        self.rebalance_margin = rebalance_margin
+        self._nodes: Dict[str, PooledNode] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.placed = 0
+        self.moved = 0
+        self.fallbacks = 0
+        self.failovers = 0
+        self.last_recovery: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __iter__(self):
+        return iter(list(self._nodes.values()))
+
+    def add(
+        self,
+        name: str,
+        node: lavalink.node.Node,
+        region: Optional[str] = None,
+        shard_id: Union[int, str, None] = -1,
+        search_only: bool = False,
+        rest_uri: str = "",
+        password: str = "",
+    ) -> PooledNode:
+        try:
+            shard_id = int(shard_id)
+        except (TypeError, ValueError):
+            shard_id = -1
+        pooled = PooledNode(
+            name, node, (region or "").lower(), shard_id, bool(search_only), rest_uri, password
+        )
+        self._nodes[name] = pooled
+        return pooled
+
+    def clear(self) -> None:
+        self._nodes.clear()
+
+    def get(self, name: str) -> Optional[PooledNode]:
+        return self._nodes.get(name)
+
+    def node_of(self, guild_id: int) -> Optional[PooledNode]:
+        """The node the player of `guild_id` is on."""
+        for pooled in self._nodes.values():
+            if guild_id in pooled.guild_ids:
+                return pooled
+        return None
+
+    @staticmethod
+    def penalty(pooled: PooledNode) -> float:
+        """How loaded a node is, roughly in players."""
+        penalty = float(len(pooled.guild_ids))
+        stats = pooled.node.stats
+        if stats is None:
+            return penalty
+        penalty += 1.05 ** (100 * stats.system_load) * 10 - 10
+        if stats.frames_deficit != -1:
+            penalty += 1.03 ** (500 * stats.frames_deficit / 3000) * 600 - 600
+            penalty += (1.03 ** (500 * stats.frames_nulled / 3000) * 300 - 300) * 2
+        return penalty
+
+    @staticmethod
+    def _region(channel: discord.VoiceChannel) -> str:
+        region = getattr(channel, "rtc_region", None) or getattr(channel.guild, "region", None)
+        return str(region).lower() if region else ""
+
+    def candidates(self, channel: discord.VoiceChannel) -> List[PooledNode]:
+        """The nodes a player for `channel` may be placed on, region affinity applied."""
+        nodes = [pooled for pooled in self._nodes.values() if pooled.serves(channel)]
+        region = self._region(channel)
+        preferred = [pooled for pooled in nodes if pooled.region and pooled.region == region]
+        return preferred or [pooled for pooled in nodes if not pooled.region] or nodes
+
+    def select(self, channel: discord.VoiceChannel) -> Optional[PooledNode]:
+        """The node a new player for `channel` should be placed on."""
+        current = self.node_of(channel.guild.id)
+        if current is not None:
+            return current
+        candidates = self.candidates(channel)
+        if not candidates:
+            return None
+        return min(candidates, key=self.penalty)
+
+    async def connect(
+        self, channel: discord.VoiceChannel, deafen: bool = False
+    ) -> lavalink.Player:
+        """A replacement for :code:`lavalink.connect` placing the player on the best node."""
+        pooled = self.select(channel) if len(self._nodes) > 1 else None
+        if pooled is None:
+            return await lavalink.connect(channel, deafen=deafen)
+        self.placed += 1
+        if IS_DEBUG:
+            log.debug("Placing the player of %s on node %s", channel.guild.id, pooled.name)
+        return await pooled.node.player_manager.create_player(channel, deafen=deafen)
+
+    def search_node(self) -> Optional[PooledNode]:
+        """The ready search only node with the fewest loads in flight."""
+        nodes = [
+            pooled
+            for pooled in self._nodes.values()
+            if pooled.search_only and pooled.ready and pooled.rest_uri
+        ]
+        if not nodes:
+            return None
+        return min(nodes, key=lambda pooled: (pooled.in_flight, pooled.latency.quantile(0.5)))
+
+    async def _load_from(self, pooled: PooledNode, query: str) -> LoadResult:
+        url = URL(pooled.rest_uri) / "loadtracks"
+        identifier = reformat_query(query)
+        pooled.in_flight += 1
+        start = time.monotonic()
+        try:
+            async with self.http.request(
+                "lavalink",
+                "GET",
+                url,
+                params={"identifier": identifier},
+                headers={"Authorization": pooled.password},
+            ) as r:
+                r.raise_for_status()
+                data = await r.json(content_type=None, loads=json.loads)
+        except Exception:
+            pooled.failures += 1
+            raise
+        finally:
+            pooled.in_flight -= 1
+        pooled.loads += 1
+        pooled.latency.observe(time.monotonic() - start)
+        if isinstance(data, list):
+            data = {"loadType": LoadType.V2_COMPAT, "tracks": data}
+        data["query"] = query
+        data["encodedquery"] = str(url.with_query(identifier=identifier))
+        return LoadResult(data)
+
+    async def load_tracks(
+        self,
+        player: lavalink.Player,
+        query: str,
+        local: bool = False,
+        guild_id: Optional[int] = None,
+        bulk: bool = False,
+    ) -> LoadResult:
+        """A replacement for :code:`lavalink.Player.load_tracks` using a search only node.
+
+        Local tracks are only on the nodes playing them, so they are always loaded by `player`,
+        as is everything else when no search only node is ready or the load failed.
+        Loads wait for their turn in :attr:`limiter`, `bulk` loads after every interactive one.
+        """
+        async with self.limiter.slot(guild_id, bulk=bulk):
+            pooled = None if local else self.search_node()
+            if pooled is not None:
+                try:
+                    return await self._load_from(pooled, query)
+                except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as exc:
+                    self.fallbacks += 1
+                    debug_exc_log(
+                        log, exc, "Failed to load %r from the %s node", query, pooled.name
+                    )
+            return await player.load_tracks(query)
+
+    @staticmethod
+    def is_idle(player: lavalink.Player) -> bool:
+        return not (player.is_playing or player.is_auto_playing or player.current or player.queue)
+
+    def plan_rebalance(self) -> List[Tuple[lavalink.Player, PooledNode]]:
+        """Idle players to move off overloaded nodes and where to move them."""
+        nodes = [
+            pooled for pooled in self._nodes.values() if pooled.ready and not pooled.search_only
+        ]
+        if len(nodes) < 2:
+            return []
+        load = {pooled.name: self.penalty(pooled) for pooled in nodes}
+        moves = []
+        for source in sorted(nodes, key=lambda pooled: load[pooled.name], reverse=True):
+            for player in source.players:
+                if not self.is_idle(player) or player.channel is None:
+                    continue
+                targets = [
+                    pooled for pooled in self.candidates(player.channel) if pooled is not source
+                ]
+                if not targets:
+                    continue
+                target = min(targets, key=lambda pooled: load[pooled.name])
+                if load[source.name] - load[target.name] <= self.rebalance_margin:
+                    continue
+                moves.append((player, target))
+                load[source.name] -= 1
+                load[target.name] += 1
+        return moves
+
+    async def failover(
+        self,
+        failed: PooledNode,
+        move: Callable[[lavalink.Player, PooledNode], Awaitable[None]],
+    ) -> int:
+        """Move every player of `failed` to the least loaded healthy node."""
+        started = time.monotonic()
+        players = [player for player in failed.players if player.channel is not None]
+        load = {pooled.name: self.penalty(pooled) for pooled in self._nodes.values()}
+        plan = []
+        for player in players:
+            targets = [
+                pooled for pooled in self.candidates(player.channel) if pooled is not failed
+            ]
+            if not targets:
+                continue
+            target = min(targets, key=lambda pooled: load[pooled.name])
+            load[target.name] += 1
+            plan.append((player, target))
+        semaphore = asyncio.Semaphore(_FAILOVER_CONCURRENCY)
+
+        async def _move(player: lavalink.Player, target: PooledNode) -> bool:
+            async with semaphore:
+                try:
+                    await move(player, target)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as exc:
+                    log.warning(
+                        "Failed to move the player of %s off the %s node: %s",
+                        player.channel.guild.id,
+                        failed.name,
+                        exc,
+                    )
+                    debug_exc_log(log, exc, "Failed to move the player")
+                    return False
+            if IS_DEBUG:
+                log.debug(
+                    "Moved the player of %s to the %s node %.2fs after the %s node went down",
+                    player.channel.guild.id,
+                    target.name,
+                    time.monotonic() - started,
+                    failed.name,
+                )
+            return True
+
+        moved = sum(await asyncio.gather(*(_move(player, target) for player, target in plan)))
+        self.failovers += 1
+        self.moved += moved
+        self.last_recovery = time.monotonic() - started
+        log.info(
+            "Moved %d of %d players off the %s node in %.2fs",
+            moved,
+            len(players),
+            failed.name,
+            self.last_recovery,
+        )
+        return moved
+
+    def start(self, move: Callable[[lavalink.Player, PooledNode], Awaitable[None]]) -> None:
+        """Start rebalancing, `move` moves a player to another node."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(move))
+
+    async def _run(self, move: Callable[[lavalink.Player, PooledNode], Awaitable[None]]) -> None:
+        while True:
+            await asyncio.sleep(self.rebalance_interval)
+            for player, target in self.plan_rebalance():
+                try:
+                    await move(player, target)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as exc:
+                    debug_exc_log(
+                        log, exc, "Failed to move the player of %s", player.channel.guild.id
+                    )
+                else:
+                    self.moved += 1
+
+    def stats(self) -> List[MutableMapping[str, Union[str, int, float, bool]]]:
+        return [
+            {
+                "name": pooled.name,
+                "ready": pooled.ready,
+                "players": len(pooled.guild_ids),
+                "penalty": round(self.penalty(pooled), 2),
+                "region": pooled.region,
+                "shard_id": pooled.shard_id,
+                "search_only": pooled.search_only,
+                "rest_in_flight": pooled.in_flight,
+                "rest_loads": pooled.loads,
+                "rest_failures": pooled.failures,
+                "rest_p50": round(pooled.latency.quantile(0.5), 3),
+                "rest_p95": round(pooled.latency.quantile(0.95), 3),
+            }
+            for pooled in self._nodes.values()
+        ]
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await self._task
+            self._task = None
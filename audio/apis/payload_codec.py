@@ -0,0 +1,185 @@
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+from typing import List, MutableMapping, Tuple, Union
+from urllib.parse import urlparse
+import base64
+import struct
+import zlib
+
+try:
+    # Dependency Imports
+    from redbot import json
+except ImportError:
+    # Standard Library Imports
+    import json
+
+__all__ = [
+    "PAYLOAD_MAGIC",
+    "REFS_HEADER",
+    "encode_payload",
+    "decode_payload",
+    "is_encoded_payload",
+    "is_track_refs_payload",
+    "encode_track",
+    "decode_track",
+    "track_key",
+    "split_payload",
+    "payload_track_keys",
+    "join_payload",
+    "encode_listing",
+    "decode_listing",
+]
+
+# Layout of an encoded LoadResult:
+#   magic (3 bytes) | version (1 byte) | track count (uint32)
+#   version 1, for each track: blob length (uint32) | raw track blob
+#   version 2, for each track: key length (uint32) | utf-8 key into the tracks table
+#   zlib compressed JSON of the LoadResult with the tracks removed
+# Rows of the tracks table are encoded as: blob length (uint32) | raw track blob | zlib JSON
+# Spotify collection listings are a zlib compressed JSON array
+PAYLOAD_MAGIC = b"LLP"
+_INLINE_VERSION = 1
+_REFS_VERSION = 2
+_HEADER = struct.Struct(">3sBI")
+_LENGTH = struct.Struct(">I")
+_COMPRESSION_LEVEL = 6
+REFS_HEADER = PAYLOAD_MAGIC + bytes([_REFS_VERSION])
+
+
+def is_encoded_payload(data: Union[bytes, str, None]) -> bool:
+    return isinstance(data, (bytes, memoryview)) and bytes(data[:3]) == PAYLOAD_MAGIC
+
+
+def is_track_refs_payload(data: Union[bytes, str, None]) -> bool:
+    return isinstance(data, (bytes, memoryview)) and bytes(data[:4]) == REFS_HEADER
+
+
+def _load(data: Union[str, MutableMapping]) -> MutableMapping:
+    if isinstance(data, str):
+        return json.loads(data)
+    return data
+
+
+def _compress(data: MutableMapping) -> bytes:
+    return zlib.compress(json.dumps(data).encode("utf-8"), _COMPRESSION_LEVEL)
+
+
+def _decompress(data: bytes) -> MutableMapping:
+    return json.loads(zlib.decompress(data).decode("utf-8"))
+
+
+def _pack_chunks(version: int, chunks: List[bytes], info: MutableMapping) -> bytes:
+    parts = [_HEADER.pack(PAYLOAD_MAGIC, version, len(chunks))]
+    for chunk in chunks:
+        parts.append(_LENGTH.pack(len(chunk)))
+        parts.append(chunk)
+    parts.append(_compress(info))
+    return b"".join(parts)
+
+
+def _unpack_chunks(data: Union[bytes, memoryview]) -> Tuple[int, List[bytes], MutableMapping]:
+    data = bytes(data)
+    magic, version, count = _HEADER.unpack_from(data)
+    if magic != PAYLOAD_MAGIC or version not in (_INLINE_VERSION, _REFS_VERSION):
+        raise ValueError("Unsupported Lavalink payload format.")
+    offset = _HEADER.size
+    chunks: List[bytes] = []
+    for __ in range(count):
+        (length,) = _LENGTH.unpack_from(data, offset)
+        offset += _LENGTH.size
+        chunks.append(data[offset : offset + length])
+        offset += length
+    return version, chunks, _decompress(data[offset:])
+
+
+def encode_payload(data: Union[str, MutableMapping]) -> bytes:
+    """Encode a Lavalink LoadResult with its tracks inlined."""
+    data = _load(data)
+    blobs: List[bytes] = []
+    stripped_tracks = []
+    for track in data.get("tracks") or []:
+        track = dict(track)
+        blobs.append(base64.b64decode(track.pop("track", "") or ""))
+        stripped_tracks.append(track)
+    return _pack_chunks(_INLINE_VERSION, blobs, {**data, "tracks": stripped_tracks})
+
+
+def decode_payload(data: Union[bytes, memoryview]) -> MutableMapping:
+    """Decode a payload produced by :func:`encode_payload` back into a LoadResult."""
+    version, blobs, result = _unpack_chunks(data)
+    if version != _INLINE_VERSION:
+        raise ValueError("Payload references the tracks table, use `join_payload` instead.")
+    result["tracks"] = [
+        {"track": base64.b64encode(blob).decode("ascii"), **track}
+        for blob, track in zip(blobs, result.get("tracks") or [])
+    ]
+    return result
+
+
+def track_key(track: MutableMapping) -> str:
+    """The key of a track in the tracks table, `source:identifier`."""
+    info = track.get("info") or {}
+    source = info.get("sourceName")
+    if not source:
+        source = urlparse(info.get("uri") or "").netloc or "unknown"
+    return "{}:{}".format(source, info.get("identifier") or track.get("track"))
+
+
+def encode_track(track: MutableMapping) -> bytes:
+    """Encode a single track for the tracks table."""
+    track = dict(track)
+    blob = base64.b64decode(track.pop("track", "") or "")
+    return _LENGTH.pack(len(blob)) + blob + _compress(track)
+
+
+def decode_track(data: Union[bytes, memoryview]) -> MutableMapping:
+    """Decode a row of the tracks table back into a Lavalink track."""
+    data = bytes(data)
+    (length,) = _LENGTH.unpack_from(data)
+    offset = _LENGTH.size
+    blob = data[offset : offset + length]
+    return {
+        "track": base64.b64encode(blob).decode("ascii"),
+        **_decompress(data[offset + length :]),
+    }
+
+
+def split_payload(
+    data: Union[str, bytes, MutableMapping]
+) -> Tuple[bytes, List[Tuple[str, MutableMapping]]]:
+    """Split a LoadResult into a payload of track keys and the tracks it references."""
+    if is_encoded_payload(data):
+        data = decode_payload(data)
+    data = _load(data)
+    tracks = [(track_key(track), track) for track in data.get("tracks") or []]
+    info = {k: v for k, v in data.items() if k != "tracks"}
+    return _pack_chunks(_REFS_VERSION, [key.encode("utf-8") for key, __ in tracks], info), tracks
+
+
+def payload_track_keys(data: Union[bytes, memoryview]) -> List[str]:
+    """The track keys referenced by a payload produced by :func:`split_payload`."""
+    return [key.decode("utf-8") for key in _unpack_chunks(data)[1]]
+
+
+def join_payload(
+    data: Union[bytes, memoryview], tracks: MutableMapping[str, MutableMapping]
+) -> MutableMapping:
+    """Rebuild a LoadResult from a payload of track keys and the referenced tracks.
+
+    Raises :class:`KeyError` if a referenced track is missing.
+    """
+    __, keys, result = _unpack_chunks(data)
+    result["tracks"] = [dict(tracks[key.decode("utf-8")]) for key in keys]
+    return result
+
+
+def encode_listing(tracks: List[MutableMapping]) -> bytes:
+    """Encode the track listing of a Spotify collection."""
+    return zlib.compress(json.dumps(tracks).encode("utf-8"), _COMPRESSION_LEVEL)
+
+
+def decode_listing(data: Union[bytes, memoryview]) -> List[MutableMapping]:
+    """Decode a listing produced by :func:`encode_listing`."""
+    return json.loads(zlib.decompress(bytes(data)).decode("utf-8"))
@@ -4,7 +4,6 @@ from __future__ import annotations
 # Standard Library Imports
 from types import SimpleNamespace
 from typing import List, MutableMapping, Optional, TYPE_CHECKING
-import concurrent
 import logging
 
 try:
@@ -24,6 +23,8 @@ from ..audio_logging import debug_exc_log
 from ..sql_statements import (
     HANDLE_DISCORD_DATA_DELETION_QUERY,
     PLAYLIST_CREATE_INDEX,
+    PLAYLIST_CREATE_INDEX_DELETED,
+    PLAYLIST_CREATE_INDEX_SCOPE,
     PLAYLIST_CREATE_TABLE,
     PLAYLIST_DELETE,
     PLAYLIST_DELETE_SCHEDULED,
@@ -41,6 +42,7 @@ from ..sql_statements import (
 )
 from ..utils import PlaylistScope
 from .api_utils import PlaylistFetchResult
+from .db_executor import DatabaseExecutor
 
 log = logging.getLogger("red.cogs.Music.api.Playlists")
 
@@ -53,10 +55,16 @@ if TYPE_CHECKING:
 
 class PlaylistWrapper:
     def __init__(
-        self, bot: Red, config: Config, conn: APSWConnectionWrapper, cache: SettingCacheManager
+        self,
+        bot: Red,
+        config: Config,
+        conn: APSWConnectionWrapper,
+        cache: SettingCacheManager,
+        executor: DatabaseExecutor,
     ):
         self.bot = bot
         self.database = conn
+        self.executor = executor
         self.config = config
         self.config_cache = cache
         self.statement = SimpleNamespace()
@@ -82,12 +90,16 @@ class PlaylistWrapper:
 
     async def init(self) -> None:
         """Initialize the Playlist table."""
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(self.database.cursor().execute, self.statement.pragma_temp_store)
-            executor.submit(self.database.cursor().execute, self.statement.pragma_journal_mode)
-            executor.submit(self.database.cursor().execute, self.statement.pragma_read_uncommitted)
-            executor.submit(self.database.cursor().execute, self.statement.create_table)
-            executor.submit(self.database.cursor().execute, self.statement.create_index)
+        for statement in (
+            self.statement.pragma_temp_store,
+            self.statement.pragma_journal_mode,
+            self.statement.pragma_read_uncommitted,
+            self.statement.create_table,
+            self.statement.create_index,
+            PLAYLIST_CREATE_INDEX_SCOPE,
+            PLAYLIST_CREATE_INDEX_DELETED,
+        ):
+            await self.executor.execute(statement)
 
     @staticmethod
     def get_scope_type(scope: str) -> int:
@@ -102,30 +114,16 @@ class PlaylistWrapper:
     async def fetch(self, scope: str, playlist_id: int, scope_id: int) -> PlaylistFetchResult:
         """Fetch a single playlist."""
         scope_type = self.get_scope_type(scope)
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            for future in concurrent.futures.as_completed(
-                [
-                    executor.submit(
-                        self.database.cursor().execute,
-                        self.statement.get_one,
-                        (
-                            {
-                                "playlist_id": playlist_id,
-                                "scope_id": scope_id,
-                                "scope_type": scope_type,
-                            }
-                        ),
-                    )
-                ]
-            ):
-                try:
-                    row_result = future.result()
-                except Exception as exc:
-                    debug_exc_log(log, exc, "Failed to completed playlist fetch from database")
-            row = row_result.fetchone()
-            if row:
-                row = PlaylistFetchResult(*row)
+        row = None
+        try:
+            row = await self.executor.fetchone(
+                self.statement.get_one,
+                {"playlist_id": playlist_id, "scope_id": scope_id, "scope_type": scope_type},
+            )
+        except Exception as exc:
+            debug_exc_log(log, exc, "Failed to completed playlist fetch from database")
+        if row:
+            row = PlaylistFetchResult(*row)
         return row
 
     async def fetch_all(
@@ -134,43 +132,19 @@ class PlaylistWrapper:
         """Fetch all playlists."""
         scope_type = self.get_scope_type(scope)
         output = []
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        try:
             if author_id is not None:
-                for future in concurrent.futures.as_completed(
-                    [
-                        executor.submit(
-                            self.database.cursor().execute,
-                            self.statement.get_all_with_filter,
-                            (
-                                {
-                                    "scope_type": scope_type,
-                                    "scope_id": scope_id,
-                                    "author_id": author_id,
-                                }
-                            ),
-                        )
-                    ]
-                ):
-                    try:
-                        row_result = future.result()
-                    except Exception as exc:
-                        debug_exc_log(log, exc, "Failed to completed playlist fetch from database")
-                        return []
+                row_result = await self.executor.fetchall(
+                    self.statement.get_all_with_filter,
+                    {"scope_type": scope_type, "scope_id": scope_id, "author_id": author_id},
+                )
             else:
-                for future in concurrent.futures.as_completed(
-                    [
-                        executor.submit(
-                            self.database.cursor().execute,
-                            self.statement.get_all,
-                            ({"scope_type": scope_type, "scope_id": scope_id}),
-                        )
-                    ]
-                ):
-                    try:
-                        row_result = future.result()
-                    except Exception as exc:
-                        debug_exc_log(log, exc, "Failed to completed playlist fetch from database")
-                        return []
+                row_result = await self.executor.fetchall(
+                    self.statement.get_all, {"scope_type": scope_type, "scope_id": scope_id}
+                )
+        except Exception as exc:
+            debug_exc_log(log, exc, "Failed to completed playlist fetch from database")
+            return []
         async for row in AsyncIter(row_result):
             output.append(PlaylistFetchResult(*row))
         return output
@@ -187,60 +161,43 @@ class PlaylistWrapper:
             playlist_id = -1
 
         output = []
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            for future in concurrent.futures.as_completed(
-                [
-                    executor.submit(
-                        self.database.cursor().execute,
-                        self.statement.get_all_converter,
-                        (
-                            {
-                                "scope_type": scope_type,
-                                "playlist_name": playlist_name,
-                                "playlist_id": playlist_id,
-                            }
-                        ),
-                    )
-                ]
-            ):
-                try:
-                    row_result = future.result()
-                except Exception as exc:
-                    debug_exc_log(log, exc, "Failed to completed fetch from database")
+        row_result = []
+        try:
+            row_result = await self.executor.fetchall(
+                self.statement.get_all_converter,
+                {
+                    "scope_type": scope_type,
+                    "playlist_name": playlist_name,
+                    "playlist_id": playlist_id,
+                },
+            )
+        except Exception as exc:
+            debug_exc_log(log, exc, "Failed to completed fetch from database")
 
-            async for row in AsyncIter(row_result):
-                output.append(PlaylistFetchResult(*row))
+        async for row in AsyncIter(row_result):
+            output.append(PlaylistFetchResult(*row))
         return output
 
     async def delete(self, scope: str, playlist_id: int, scope_id: int):
         """Deletes a single playlists."""
         scope_type = self.get_scope_type(scope)
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(
-                self.database.cursor().execute,
-                self.statement.delete,
-                ({"playlist_id": playlist_id, "scope_id": scope_id, "scope_type": scope_type}),
-            )
+        await self.executor.execute(
+            self.statement.delete,
+            {"playlist_id": playlist_id, "scope_id": scope_id, "scope_type": scope_type},
+        )
 
     async def delete_scheduled(self):
         """Clean up database from all deleted playlists."""
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(self.database.cursor().execute, self.statement.delete_scheduled)
+        await self.executor.execute(self.statement.delete_scheduled)
 
     async def drop(self, scope: str):
         """Delete all playlists in a scope."""
         scope_type = self.get_scope_type(scope)
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(
-                self.database.cursor().execute,
-                self.statement.delete_scope,
-                ({"scope_type": scope_type}),
-            )
+        await self.executor.execute(self.statement.delete_scope, {"scope_type": scope_type})
 
     async def create_table(self):
         """Create the playlist table."""
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(self.database.cursor().execute, PLAYLIST_CREATE_TABLE)
+        await self.executor.execute(PLAYLIST_CREATE_TABLE)
 
     async def upsert(
         self,
@@ -254,25 +211,18 @@ class PlaylistWrapper:
     ):
         """Insert or update a playlist into the database."""
         scope_type = self.get_scope_type(scope)
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(
-                self.database.cursor().execute,
-                self.statement.upsert,
-                {
-                    "scope_type": str(scope_type),
-                    "playlist_id": int(playlist_id),
-                    "playlist_name": str(playlist_name),
-                    "scope_id": int(scope_id),
-                    "author_id": int(author_id),
-                    "playlist_url": playlist_url,
-                    "tracks": json.dumps(tracks),
-                },
-            )
+        await self.executor.execute(
+            self.statement.upsert,
+            {
+                "scope_type": str(scope_type),
+                "playlist_id": int(playlist_id),
+                "playlist_name": str(playlist_name),
+                "scope_id": int(scope_id),
+                "author_id": int(author_id),
+                "playlist_url": playlist_url,
+                "tracks": json.dumps(tracks),
+            },
+        )
 
     async def handle_playlist_user_id_deletion(self, user_id: int):
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(
-                self.database.cursor().execute,
-                self.statement.drop_user_playlists,
-                {"user_id": user_id},
-            )
+        await self.executor.execute(self.statement.drop_user_playlists, {"user_id": user_id})
@@ -0,0 +1,50 @@
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+import asyncio
+
+__all__ = ["SingleFlight"]
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Coalesces concurrent calls for the same key into a single call.
+
+    The first caller for a key starts the call, every caller arriving while it is still running
+    awaits the same result, or exception, instead of starting its own.
+    The call runs as its own task so a caller being cancelled doesn't cancel it for the others.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._calls
+
+    def _forget(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._calls.get(key) is future:
+            del self._calls[key]
+        if not future.cancelled():
+            # Retrieve the exception so it isn't reported as never retrieved when every
+            # caller went away before the call finished.
+            future.exception()
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """Await `func()`, or the call already running for `key`."""
+        future = self._calls.get(key)
+        if future is None:
+            self.calls += 1
+            future = asyncio.ensure_future(func())
+            self._calls[key] = future
+            future.add_done_callback(lambda f: self._forget(key, f))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(future)
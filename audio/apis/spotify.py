@@ -6,10 +6,6 @@ from typing import List, Mapping, MutableMapping, Optional, Tuple, TYPE_CHECKING
 import base64
 import contextlib
 import logging
-import time
-
-# Dependency Imports
-import aiohttp
 
 try:
     # Dependency Imports
@@ -25,6 +21,8 @@ from redbot.core.utils import AsyncIter
 
 # Music Imports
 from ..errors import SpotifyFetchError
+from .http_client import HTTPClient
+from .spotify_token import SpotifyTokenManager
 
 if TYPE_CHECKING:
 
@@ -50,15 +48,15 @@ class SpotifyWrapper:
         self,
         bot: Red,
         config: Config,
-        session: aiohttp.ClientSession,
+        http: HTTPClient,
         cog: Union["Music", Cog],
         cache: SettingCacheManager,
     ):
         self.bot = bot
         self.config = config
-        self.session = session
+        self.http = http
         self.config_cache = cache
-        self.spotify_token: Optional[MutableMapping] = None
+        self.token_manager = SpotifyTokenManager(self.request_access_token)
         self.client_id: Optional[str] = None
         self.client_secret: Optional[str] = None
         self._token: Mapping[str, str] = {}
@@ -90,13 +88,9 @@ class SpotifyWrapper:
         uri = track_data["uri"]
         _id = track_data["id"]
         _type = track_data["type"]
+        isrc = (track_data.get("external_ids") or {}).get("isrc")
 
-        return song_url, track_info, uri, artist_name, track_name, _id, _type
-
-    @staticmethod
-    async def is_access_token_valid(token: MutableMapping) -> bool:
-        """Check if current token is not too old."""
-        return (token["expires_at"] - int(time.time())) < 60
+        return song_url, track_info, uri, artist_name, track_name, _id, _type, isrc
 
     @staticmethod
     def make_auth_header(
@@ -116,7 +110,7 @@ class SpotifyWrapper:
         """Make a GET request to the spotify API."""
         if params is None:
             params = {}
-        async with self.session.request("GET", url, params=params, headers=headers) as r:
+        async with self.http.request("spotify", "GET", url, params=params, headers=headers) as r:
             data = await r.json(loads=json.loads)
             if r.status != 200:
                 log.debug("Issue making GET request to %r: [%d] %r", url, r.status, data)
@@ -124,6 +118,7 @@ class SpotifyWrapper:
 
     async def update_token(self, new_token: Mapping[str, str]):
         self._token = new_token
+        self.token_manager.invalidate()
 
     async def get_token(self) -> None:
         """Get the stored spotify tokens."""
@@ -150,24 +145,14 @@ class SpotifyWrapper:
 
     async def get_access_token(self) -> Optional[str]:
         """Get the access_token."""
-        if self.spotify_token and not await self.is_access_token_valid(self.spotify_token):
-            return self.spotify_token["access_token"]
-        token = await self.request_access_token()
-        if token is None:
-            log.debug("Requested a token from Spotify, did not end up getting one.")
-        try:
-            token["expires_at"] = int(time.time()) + int(token["expires_in"])
-        except KeyError:
-            return None
-        self.spotify_token = token
-        log.debug("Created a new access token for Spotify: %s", token)
-        return self.spotify_token["access_token"]
+        header = await self.token_manager.get_header()
+        return header["Authorization"][len("Bearer ") :] if header else None
 
     async def post(
         self, url: str, payload: MutableMapping, headers: MutableMapping = None
     ) -> MutableMapping:
         """Make a POST call to spotify."""
-        async with self.session.post(url, data=payload, headers=headers) as r:
+        async with self.http.request("spotify", "POST", url, data=payload, headers=headers) as r:
             data = await r.json(loads=json.loads)
             if r.status != 200:
                 log.debug("Issue making POST request to %r: [%d] %r", url, r.status, data)
@@ -175,8 +160,24 @@ class SpotifyWrapper:
 
     async def make_get_call(self, url: str, params: MutableMapping) -> MutableMapping:
         """Make a Get call to spotify."""
-        token = await self.get_access_token()
-        return await self.get(url, params=params, headers={"Authorization": f"Bearer {token}"})
+        headers = self.token_manager.cached_header()
+        if headers is None:
+            headers = await self.token_manager.refresh()
+        result = await self.get(url, params=params, headers=headers)
+        if isinstance(result.get("error"), dict) and result["error"].get("status") == 401:
+            # The token was revoked or the credentials changed, the next call gets a new one
+            self.token_manager.invalidate()
+        return result
+
+    async def close(self) -> None:
+        await self.token_manager.close()
+
+    async def get_playlist_snapshot(self, key: str) -> Optional[str]:
+        """Get the `snapshot_id` of a playlist, which changes whenever the playlist does."""
+        result = await self.make_get_call(
+            f"{PLAYLISTS_ENDPOINT}/{key}", params={"fields": "snapshot_id"}
+        )
+        return result.get("snapshot_id")
 
     async def get_categories(self, ctx: Context = None) -> List[MutableMapping]:
         """Get the spotify categories."""
@@ -0,0 +1,136 @@
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+from typing import Awaitable, Callable, Mapping, MutableMapping, Optional, Union
+import asyncio
+import contextlib
+import logging
+import time
+
+# Music Imports
+from ..audio_logging import debug_exc_log, IS_DEBUG
+
+__all__ = ["SpotifyTokenManager"]
+
+log = logging.getLogger("red.cogs.Music.api.SpotifyToken")
+
+# A token this close to expiry isn't handed out anymore
+_MIN_VALIDITY = 60
+# How long before expiry the token is renewed in the background
+_RENEW_AHEAD = 300
+# How long to wait before retrying a failed background renewal
+_RENEW_RETRY = 30
+
+
+class SpotifyTokenManager:
+    """Keeps a Spotify client credentials access token.
+
+    `request_token` makes the token request and returns the decoded response, with the
+    `access_token` and its lifetime in `expires_in` seconds.
+    Concurrent callers share a single refresh made under a lock, and once a token is known it is
+    renewed `renew_ahead` seconds before it expires, so :meth:`cached_header` can serve the
+    Authorization header without awaiting anything.
+    """
+
+    def __init__(
+        self,
+        request_token: Callable[[], Awaitable[Optional[Mapping]]],
+        min_validity: float = _MIN_VALIDITY,
+        renew_ahead: float = _RENEW_AHEAD,
+        retry_after: float = _RENEW_RETRY,
+    ):
+        self.request_token = request_token
+        self.min_validity = min_validity
+        self.renew_ahead = max(renew_ahead, min_validity)
+        self.retry_after = retry_after
+        self._lock = asyncio.Lock()
+        self._header: Optional[Mapping[str, str]] = None
+        self._expires_at = 0.0
+        self._renew_task: Optional[asyncio.Task] = None
+        self.refreshes = 0
+        self.failures = 0
+
+    @property
+    def valid(self) -> bool:
+        return self._header is not None and time.monotonic() < self._expires_at - self.min_validity
+
+    def cached_header(self) -> Optional[Mapping[str, str]]:
+        """The Authorization header of the current token, None if there's no usable token."""
+        return self._header if self.valid else None
+
+    async def get_header(self) -> Optional[Mapping[str, str]]:
+        """The Authorization header, refreshing the token first if needed."""
+        header = self.cached_header()
+        if header is None:
+            header = await self.refresh()
+        return header
+
+    async def refresh(self, force: bool = False) -> Optional[Mapping[str, str]]:
+        """Request a new token, callers waiting on the lock reuse the token it returns."""
+        async with self._lock:
+            if not force and self.valid:
+                return self._header
+            started = time.monotonic()
+            token = await self.request_token()
+            try:
+                access_token = token["access_token"]
+                expires_in = float(token["expires_in"])
+            except (KeyError, TypeError, ValueError):
+                self.failures += 1
+                log.debug("Requested a token from Spotify, did not end up getting one.")
+                return None
+            self.refreshes += 1
+            self._header = {"Authorization": f"Bearer {access_token}"}
+            self._expires_at = started + expires_in
+            if IS_DEBUG:
+                log.debug("Created a new access token for Spotify, valid for %ds", expires_in)
+            self._schedule(max(0.0, expires_in - self.renew_ahead))
+            return self._header
+
+    def _schedule(self, delay: float) -> None:
+        if self._renew_task is not None and not self._renew_task.done():
+            if self._renew_task is asyncio.current_task():
+                # Renewing from inside the task, the new one replaces it once this returns
+                self._renew_task = None
+            else:
+                self._renew_task.cancel()
+        self._renew_task = asyncio.create_task(self._renew(delay))
+
+    async def _renew(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        try:
+            header = await self.refresh(force=True)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            debug_exc_log(log, exc, "Failed to renew the Spotify access token")
+            header = None
+        if header is None and self._header is not None:
+            # Keep trying while the current token lasts, after that the next call refreshes it
+            remaining = self._expires_at - time.monotonic()
+            if remaining > self.retry_after:
+                self._schedule(self.retry_after)
+
+    def invalidate(self) -> None:
+        """Forget the current token, when the credentials change or Spotify rejected it."""
+        self._header = None
+        self._expires_at = 0.0
+        if self._renew_task is not None:
+            self._renew_task.cancel()
+            self._renew_task = None
+
+    def stats(self) -> MutableMapping[str, Union[bool, int, float]]:
+        return {
+            "valid": self.valid,
+            "expires_in": round(max(0.0, self._expires_at - time.monotonic()), 1),
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+        }
+
+    async def close(self) -> None:
+        if self._renew_task is not None:
+            self._renew_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await self._renew_task
+            self._renew_task = None
@@ -0,0 +1,146 @@
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+from collections import defaultdict
+from typing import DefaultDict, Dict, Hashable, List, MutableMapping, Optional, TYPE_CHECKING
+import asyncio
+import contextlib
+import datetime
+import logging
+
+# Music Imports
+from ..audio_logging import debug_exc_log, IS_DEBUG
+
+if TYPE_CHECKING:
+
+    # Music Imports
+    from .local_db import BaseWrapper, LocalCacheWrapper
+
+log = logging.getLogger("red.cogs.Music.api.WriteBuffer")
+
+_FLUSH_INTERVAL = 2.0
+_FLUSH_MAX_ROWS = 500
+
+
+class WriteBehindBuffer:
+    """Coalesces local cache writes from every guild into batched transactions.
+
+    Inserts are keyed on the table's unique columns and `last_fetched` bumps on the lookup key,
+    so repeated writes for the same entry collapse into a single row.
+    Pending writes are flushed every `flush_interval` seconds, or as soon as `max_rows` rows are
+    waiting, with one transaction per table.
+    """
+
+    def __init__(
+        self,
+        local_cache: LocalCacheWrapper,
+        flush_interval: float = _FLUSH_INTERVAL,
+        max_rows: int = _FLUSH_MAX_ROWS,
+    ):
+        self.tables: Dict[str, BaseWrapper] = {
+            "lavalink": local_cache.lavalink,
+            "youtube": local_cache.youtube,
+            "spotify": local_cache.spotify,
+            "spotify_collections": local_cache.spotify_collections,
+        }
+        self.flush_interval = flush_interval
+        self.max_rows = max_rows
+        self._inserts: DefaultDict[str, Dict[Hashable, MutableMapping]] = defaultdict(dict)
+        self._updates: DefaultDict[str, Dict[Hashable, MutableMapping]] = defaultdict(dict)
+        self._pending = 0
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+        self.flushed_rows = 0
+        self.coalesced_rows = 0
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def start(self) -> None:
+        self._closing = False
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while not self._closing:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            self._wakeup.clear()
+            await self.flush()
+
+    def _track_pending(self, added: bool) -> None:
+        if added:
+            self._pending += 1
+        else:
+            self.coalesced_rows += 1
+        if self._pending >= self.max_rows:
+            self._wakeup.set()
+
+    def add_insert(self, table: str, rows: List[MutableMapping]) -> None:
+        """Queue rows to be upserted into `table`."""
+        wrapper = self.tables.get(table)
+        if wrapper is None:
+            return
+        pending = self._inserts[table]
+        for row in rows:
+            key = tuple(row.get(k) for k in wrapper.upsert_keys)
+            added = key not in pending
+            pending[key] = row
+            self._track_pending(added)
+
+    def add_update(self, table: str, values: MutableMapping) -> None:
+        """Queue a `last_fetched` bump for an entry of `table`."""
+        wrapper = self.tables.get(table)
+        if wrapper is None or wrapper.update_key is None:
+            return
+        key = values.get(wrapper.update_key)
+        time_now = int(datetime.datetime.now(datetime.timezone.utc).timestamp())
+        pending = self._updates[table]
+        existing = pending.get(key)
+        if existing is not None:
+            existing["last_fetched"] = max(existing["last_fetched"], time_now)
+            self._track_pending(False)
+            return
+        pending[key] = {**values, "last_fetched": time_now}
+        self._track_pending(True)
+
+    async def flush(self) -> None:
+        """Write every pending row to the database."""
+        async with self._flush_lock:
+            if not self._pending:
+                return
+            inserts, self._inserts = self._inserts, defaultdict(dict)
+            updates, self._updates = self._updates, defaultdict(dict)
+            self._pending = 0
+            for table, wrapper in self.tables.items():
+                table_inserts = list(inserts.get(table, {}).values())
+                table_updates = list(updates.get(table, {}).values())
+                if not table_inserts and not table_updates:
+                    continue
+                try:
+                    await wrapper.write_batch(table_inserts, table_updates)
+                except Exception as exc:
+                    debug_exc_log(log, exc, "Failed batched writes to the %s table", table)
+                else:
+                    self.flushed_rows += len(table_inserts) + len(table_updates)
+                    if IS_DEBUG:
+                        log.debug(
+                            "Flushed %d inserts and %d updates to the %s table",
+                            len(table_inserts),
+                            len(table_updates),
+                            table,
+                        )
+
+    async def close(self) -> None:
+        """Stop the background flusher and write whatever is left."""
+        self._closing = True
+        self._wakeup.set()
+        if self._task is not None:
+            with contextlib.suppress(Exception):
+                await self._task
+            self._task = None
+        await self.flush()
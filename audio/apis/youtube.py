@@ -5,9 +5,6 @@ from __future__ import annotations
 from typing import Mapping, Optional, TYPE_CHECKING, Union
 import logging
 
-# Dependency Imports
-import aiohttp
-
 try:
     # Dependency Imports
     from redbot import json
@@ -21,6 +18,8 @@ from redbot.core.commands import Cog
 
 # Music Imports
 from ..errors import YouTubeApiError
+from .http_client import HTTPClient
+from .youtube_quota import YouTubeQuotaAccountant
 
 if TYPE_CHECKING:
 
@@ -40,17 +39,18 @@ class YouTubeWrapper:
         self,
         bot: Red,
         config: Config,
-        session: aiohttp.ClientSession,
+        http: HTTPClient,
         cog: Union[Music, Cog],
         cache: SettingCacheManager,
     ):
         self.bot = bot
         self.config = config
-        self.session = session
+        self.http = http
         self.config_cache = cache
         self.api_key: Optional[str] = None
         self._token: Mapping[str, str] = {}
         self.cog = cog
+        self.quota = YouTubeQuotaAccountant(config, cache)
 
     async def update_token(self, new_token: Mapping[str, str]):
         self._token = new_token
@@ -73,7 +73,11 @@ class YouTubeWrapper:
             "maxResults": 1,
             "type": "video",
         }
-        async with self.session.request("GET", SEARCH_ENDPOINT, params=params) as r:
+        async with self.http.request("youtube", "GET", SEARCH_ENDPOINT, params=params) as r:
+            if r.status == 403 and r.reason in ["Forbidden", "quotaExceeded"]:
+                await self.quota.exhausted()
+            else:
+                await self.quota.record("search")
             if r.status == 400:
                 if r.reason == "Bad Request":
                     raise YouTubeApiError(
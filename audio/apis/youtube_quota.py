@@ -0,0 +1,119 @@
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+from typing import Mapping, MutableMapping, Optional, TYPE_CHECKING, Union
+import datetime
+import logging
+
+# Dependency Imports
+from redbot.core import Config
+
+try:
+    # Standard Library Imports
+    from zoneinfo import ZoneInfo
+
+    _QUOTA_TIMEZONE = ZoneInfo("America/Los_Angeles")
+except Exception:
+    # Without zoneinfo or tzdata, Pacific Standard Time is close enough
+    _QUOTA_TIMEZONE = datetime.timezone(datetime.timedelta(hours=-8))
+
+if TYPE_CHECKING:
+
+    # Music Imports
+    from ..core.utilities import SettingCacheManager
+
+__all__ = ["YouTubeQuotaAccountant", "QUOTA_COSTS"]
+
+log = logging.getLogger("red.cogs.Music.api.YouTubeQuota")
+
+# Units of quota each YouTube Data API operation costs
+QUOTA_COSTS: Mapping[str, int] = {"search": 100}
+
+
+class YouTubeQuotaAccountant:
+    """Tracks the YouTube Data API quota spent today.
+
+    YouTube resets quotas at midnight Pacific Time, the units spent since are persisted so a
+    reload doesn't forget them.
+    Once `youtube_quota_threshold` percent of the `youtube_quota_budget` is spent,
+    :meth:`allow` returns False so searches can go through Lavalink instead.
+    """
+
+    def __init__(self, config: Config, cache: SettingCacheManager):
+        self.config = config
+        self.config_cache = cache
+        self.day: Optional[str] = None
+        self.spent = 0
+        self.calls = 0
+        self.routed = 0
+
+    @staticmethod
+    def _today() -> str:
+        return datetime.datetime.now(_QUOTA_TIMEZONE).date().isoformat()
+
+    @property
+    def reset_at(self) -> datetime.datetime:
+        """When the quota is next reset, in UTC."""
+        now = datetime.datetime.now(_QUOTA_TIMEZONE)
+        midnight = datetime.datetime.combine(
+            now.date() + datetime.timedelta(days=1), datetime.time(), tzinfo=_QUOTA_TIMEZONE
+        )
+        return midnight.astimezone(datetime.timezone.utc)
+
+    async def _load(self) -> None:
+        if self.day is None:
+            usage = await self.config.youtube_quota_usage()
+            self.day = usage.get("day")
+            self.spent = usage.get("spent", 0)
+        today = self._today()
+        if self.day != today:
+            self.day = today
+            self.spent = 0
+
+    async def _save(self) -> None:
+        await self.config.youtube_quota_usage.set({"day": self.day, "spent": self.spent})
+
+    async def remaining(self) -> int:
+        await self._load()
+        return max(0, await self.config_cache.youtube_quota_budget.get_global() - self.spent)
+
+    async def allow(self, operation: str = "search") -> bool:
+        """Whether `operation` can be made without crossing the routing threshold."""
+        await self._load()
+        budget = await self.config_cache.youtube_quota_budget.get_global()
+        threshold = await self.config_cache.youtube_quota_threshold.get_global()
+        if self.spent + QUOTA_COSTS.get(operation, 1) <= budget * threshold / 100:
+            return True
+        self.routed += 1
+        return False
+
+    async def record(self, operation: str = "search") -> None:
+        """Record a call made to the Data API."""
+        await self._load()
+        self.spent += QUOTA_COSTS.get(operation, 1)
+        self.calls += 1
+        await self._save()
+
+    async def exhausted(self) -> None:
+        """Record that YouTube refused a call because the daily quota ran out."""
+        await self._load()
+        budget = await self.config_cache.youtube_quota_budget.get_global()
+        if self.spent < budget:
+            log.info("YouTube Data API quota ran out after %d of %d units", self.spent, budget)
+            self.spent = budget
+            await self._save()
+
+    async def stats(self) -> MutableMapping[str, Union[str, int]]:
+        await self._load()
+        return {
+            "day": self.day,
+            "spent": self.spent,
+            "budget": await self.config_cache.youtube_quota_budget.get_global(),
+            "threshold": await self.config_cache.youtube_quota_threshold.get_global(),
+            "calls": self.calls,
+            "routed": self.routed,
+            "reset_in": int(
+                (self.reset_at - datetime.datetime.now(datetime.timezone.utc)).total_seconds()
+            ),
+        }
@@ -12,17 +12,11 @@ from redbot.core import Config
 from redbot.core.bot import Red
 from redbot.core.commands import Cog
 from redbot.core.data_manager import cog_data_path
-import aiohttp
 import discord
 
-try:
-    # Dependency Imports
-    from redbot import json
-except ImportError:
-    # Standard Library Imports
-    import json
-
 # Music Imports
+from ..apis.http_client import HTTPClient
+from ..apis.node_pool import NodePool
 from ..utils import PlaylistScope
 from . import commands, events, tasks, utilities
 from .cog_utils import CompositeMetaClass
@@ -71,7 +65,8 @@ class Music(
             add_reactions=True,
         )
 
-        self.session = aiohttp.ClientSession(json_serialize=json.dumps)
+        self.http_client = HTTPClient()
+        self.node_pool = NodePool(self.http_client)
         self.cog_ready_event = asyncio.Event()
         self._ws_resume = defaultdict(asyncio.Event)
         self._ws_op_codes = defaultdict(asyncio.LifoQueue)
@@ -125,6 +120,11 @@ class Music(
             owner_notification=0,
             cache_level=0,
             cache_age=365,
+            cache_max_rows=0,
+            cache_max_size=0,
+            youtube_quota_budget=10_000,
+            youtube_quota_threshold=90,
+            youtube_quota_usage={},
             auto_deafen=True,
             daily_playlists=False,
             daily_playlists_override=False,
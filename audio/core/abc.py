@@ -14,7 +14,6 @@ from redbot.core import commands, Config
 from redbot.core.bot import Red
 from redbot.core.commands import Context
 from redbot.core.utils.dbtools import APSWConnectionWrapper
-import aiohttp
 import discord
 
 # My Modded Imports
@@ -25,7 +24,9 @@ import lavalink
 if TYPE_CHECKING:
 
     # Music Imports
+    from ..apis.http_client import HTTPClient
     from ..apis.interface import AudioAPIInterface
+    from ..apis.node_pool import NodePool, PooledNode
     from ..apis.playlist_interface import Playlist
     from ..apis.playlist_wrapper import PlaylistWrapper
     from ..audio_dataclasses import LocalPath, Query
@@ -46,7 +47,8 @@ class MixinMeta(ABC):
     playlist_api: Optional["PlaylistWrapper"]
     local_folder_current_path: Optional[Path]
     db_conn: Optional[APSWConnectionWrapper]
-    session: aiohttp.ClientSession
+    http_client: HTTPClient
+    node_pool: NodePool
     config_cache: SettingCacheManager
 
     skip_votes: MutableMapping[int, Set[int]]
@@ -124,6 +126,20 @@ class MixinMeta(ABC):
     async def lavalink_attempt_connect(self, timeout: int = 50) -> None:
         raise NotImplementedError()
 
+    @abstractmethod
+    async def lavalink_connect_pool(self, primary: lavalink.node.Node, timeout: int = 50) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def lavalink_node_state_handler(
+        self, name: str, next_state: lavalink.enums.NodeState, old_state: lavalink.enums.NodeState
+    ) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def lavalink_move_player(self, player: lavalink.Player, pooled: PooledNode) -> None:
+        raise NotImplementedError()
+
     @abstractmethod
     async def player_automated_timer(self) -> None:
         raise NotImplementedError()
@@ -553,6 +569,6 @@ class MixinMeta(ABC):
     def is_slash_compatible() -> bool:
         raise NotImplementedError()
 
-    @staticmethod
-    async def get_lyrics_string(artist_song: str) -> Tuple[str, str, str, str]:
+    @abstractmethod
+    async def get_lyrics_string(self, artist_song: str) -> Tuple[str, str, str, str]:
         raise NotImplementedError()
@@ -622,6 +622,24 @@ class AudioSetCommands(MixinMeta, ABC, metaclass=CompositeMetaClass):
                 youtube_status=ENABLED_TITLE if has_youtube_cache else DISABLED_TITLE,
                 lavalink_status=ENABLED_TITLE if has_lavalink_cache else DISABLED_TITLE,
             )
+            for table, stats in self.api_interface.local_cache_api.front_cache_stats().items():
+                msg += "Memory {table}: [{hit_rate}% hits, {size}/{max_size} entries]\n".format(
+                    table=table.replace("_", " ").title(),
+                    hit_rate=round(stats["hit_rate"] * 100, 1),
+                    size=humanize_number(stats["size"]),
+                    max_size=humanize_number(stats["max_size"]),
+                )
+            for kind, stats in self.api_interface.db_executor.stats().items():
+                msg += (
+                    "Database {kind}: [{pending} queued, avg {avg}ms, max {max}ms, "
+                    "{failed} failed]\n"
+                ).format(
+                    kind="reads: " if kind == "read" else "writes:",
+                    pending=humanize_number(stats["pending"]),
+                    avg=stats["average_ms"],
+                    max=stats["max_ms"],
+                    failed=humanize_number(stats["failed"]),
+                )
             await self.send_embed_msg(
                 ctx, title="Cache Settings", description=box(msg, lang="ini"), no_embed=True
             )
@@ -672,6 +690,7 @@ class AudioSetCommands(MixinMeta, ABC, metaclass=CompositeMetaClass):
             ctx, title="Cache Settings", description=box(msg, lang="ini"), no_embed=True
         )
         await self.config_cache.local_cache_level.set_global(newcache.value)
+        self.api_interface.local_cache_api.clear_front_cache()
 
     @command_audioset_global.command(name="cacheage")
     async def command_audioset_cacheage(self, ctx: commands.Context, age: int):
@@ -689,6 +708,84 @@ class AudioSetCommands(MixinMeta, ABC, metaclass=CompositeMetaClass):
             age = 7
         msg += "I've set the cache age to {age} days".format(age=age)
         await self.config_cache.local_cache_age.set_global(age)
+        self.api_interface.local_cache_api.clear_front_cache()
+        await self.send_embed_msg(ctx, title="Setting Changed", description=msg)
+
+    @command_audioset_global.command(name="cachelimit")
+    async def command_audioset_cachelimit(
+        self, ctx: commands.Context, max_entries: int, max_megabytes: int
+    ):
+        """Sets the maximum size of each local cache table.
+
+        When a table holds more than `max_entries` entries or `max_megabytes` MiB of data, the
+        least recently used entries are removed during the hourly cache maintenance.
+        Use 0 to remove a limit.
+        """
+        if max_entries < 0 or max_megabytes < 0:
+            return await self.send_embed_msg(
+                ctx,
+                title="Invalid Limit",
+                description="Cache limits cannot be negative, use 0 to remove a limit.",
+            )
+        await self.config_cache.local_cache_max_rows.set_global(max_entries)
+        await self.config_cache.local_cache_max_size.set_global(max_megabytes)
+        msg = "Each cache table is now limited to {entries} entries and {size}.".format(
+            entries=humanize_number(max_entries) if max_entries else "unlimited",
+            size="{} MiB".format(humanize_number(max_megabytes))
+            if max_megabytes
+            else "unlimited size",
+        )
+        await self.send_embed_msg(ctx, title="Setting Changed", description=msg)
+
+    @command_audioset_global.command(name="cachetrim")
+    async def command_audioset_cachetrim(self, ctx: commands.Context):
+        """Remove expired and excess entries from the local cache now."""
+        async with ctx.typing():
+            reports = await self.api_interface.cache_maintenance.run_once()
+        msg = "".join(
+            "{table:<10} removed {expired} expired and {evicted} excess entries, "
+            "{rows} entries ({size:.2f} MiB) left\n".format(
+                table=report.table,
+                expired=humanize_number(report.expired),
+                evicted=humanize_number(report.evicted),
+                rows=humanize_number(report.rows),
+                size=report.size / 1024 / 1024,
+            )
+            for report in reports
+        )
+        reclaimed = sum(report.reclaimed_bytes for report in reports) / 1024 / 1024
+        msg += "\nReclaimed {:.2f} MiB.".format(reclaimed)
+        await self.send_embed_msg(
+            ctx, title="Cache Trimmed", description=box(msg, lang="ini"), no_embed=True
+        )
+
+    @command_audioset_global.command(name="youtubequota")
+    async def command_audioset_youtubequota(
+        self, ctx: commands.Context, daily_budget: int, threshold: int
+    ):
+        """Sets the daily YouTube Data API quota budget and the routing threshold.
+
+        Once `threshold` percent of the `daily_budget` units is spent, Spotify tracks are
+        searched through Lavalink instead of the YouTube Data API until the quota resets at
+        midnight Pacific Time.
+        The default budget is 10000 units, a search costs 100.
+        """
+        if daily_budget < 0:
+            return await self.send_embed_msg(
+                ctx, title="Invalid Budget", description="The quota budget cannot be negative."
+            )
+        if not 0 <= threshold <= 100:
+            return await self.send_embed_msg(
+                ctx,
+                title="Invalid Threshold",
+                description="The threshold must be a percentage between 0 and 100.",
+            )
+        await self.config_cache.youtube_quota_budget.set_global(daily_budget)
+        await self.config_cache.youtube_quota_threshold.set_global(threshold)
+        msg = (
+            "YouTube searches will go through Lavalink once {threshold}% "
+            "of {budget} quota units are spent."
+        ).format(threshold=threshold, budget=humanize_number(daily_budget))
         await self.send_embed_msg(ctx, title="Setting Changed", description=msg)
 
     @command_audioset_global.group(name="globalapi")
@@ -830,23 +927,48 @@ class AudioSetCommands(MixinMeta, ABC, metaclass=CompositeMetaClass):
             auto_lyrics=enabled if auto_lyrics else disabled,
         )
 
+        max_rows = await self.config_cache.local_cache_max_rows.get_global()
+        max_size = await self.config_cache.local_cache_max_size.get_global()
+        breaker = self.api_interface.global_cache_api.breaker.stats()
+        circuit = "{state}, {errors}% errors, p95 {p95}s".format(
+            state=breaker["state"],
+            errors=round(breaker["error_rate"] * 100),
+            p95=breaker["p95_latency"],
+        )
+        if breaker["retry_in"]:
+            circuit += ", retry in {}".format(self.get_time_string(int(breaker["retry_in"])))
+        quota = await self.api_interface.youtube_api.quota.stats()
+        youtube_quota = "{spent}/{budget} units, route at {threshold}%, reset in {reset}".format(
+            spent=humanize_number(quota["spent"]),
+            budget=humanize_number(quota["budget"]),
+            threshold=quota["threshold"],
+            reset=self.get_time_string(quota["reset_in"]),
+        )
         msg += (
             "\n---"
             + "Cache Settings"
             + "---        \n"
             + "Max age:                [{max_age}]\n"
+            + "Max entries per table:  [{max_rows}]\n"
+            + "Max size per table:     [{max_size}]\n"
             + "Local Spotify cache:    [{spotify_status}]\n"
             + "Local Youtube cache:    [{youtube_status}]\n"
             + "Local Lavalink cache:   [{lavalink_status}]\n"
             + "Global cache status:    [{global_cache}]\n"
             + "Global timeout:         [{num_seconds}]\n"
+            + "Global circuit:         [{circuit}]\n"
+            + "YouTube quota:          [{youtube_quota}]\n"
         ).format(
             max_age=str(await self.config_cache.local_cache_age.get_global()) + " " + "days",
+            max_rows=humanize_number(max_rows) if max_rows else "Unlimited",
+            max_size="{} MiB".format(humanize_number(max_size)) if max_size else "Unlimited",
             spotify_status=ENABLED_TITLE if has_spotify_cache else DISABLED_TITLE,
             youtube_status=ENABLED_TITLE if has_youtube_cache else DISABLED_TITLE,
             lavalink_status=ENABLED_TITLE if has_lavalink_cache else DISABLED_TITLE,
             global_cache=ENABLED_TITLE if global_api_enabled else DISABLED_TITLE,
             num_seconds=self.get_time_string(global_api_get_timeout),
+            circuit=circuit,
+            youtube_quota=youtube_quota,
         )
 
         await self.send_embed_msg(ctx, description=box(msg, lang="ini"), no_embed=True)
@@ -2060,21 +2182,98 @@ class AudioSetCommands(MixinMeta, ABC, metaclass=CompositeMetaClass):
     async def command_audioset_lavalink_node(self, ctx: commands.Context):
         """Configure node specific settings.
 
-        Note: Currently `node` may only be set to "primary".
+        Players are spread over every node that was added, the least loaded node gets new players.
         """
 
+    @command_audioset_lavalink_node.command(name="add")
+    async def command_audioset_lavalink_node_add(
+        self, ctx: commands.Context, node: str, host: str, password: str
+    ):
+        """Add an external node to connect to alongside the primary one.
+
+        `host` must start with `https://` or `http://` and may include the port.
+        """
+        if node in await self.config_cache.node_config.get_all_identifiers():
+            return await self.send_embed_msg(
+                ctx,
+                title="Setting Not Changed",
+                description="{node} already exists.".format(node=node),
+            )
+        url = urlparse(host)
+        if url.scheme not in ["https", "http"] or not url.hostname:
+            return await self.send_embed_msg(
+                ctx,
+                title="Setting Not Changed",
+                description=(
+                    "`{rest_uri}` is not valid, it must start with `https://` or `http://`"
+                ).format(rest_uri=host),
+            )
+        final_host = f"{url.scheme}://{url.hostname}"
+        final_port = url.port or (443 if url.scheme == "https" else 80)
+        await self.config_cache.node_config.add_node(
+            node_identifier=node,
+            host=final_host,
+            port=final_port,
+            rest_uri=f"{final_host}:{final_port}",
+            password=password,
+        )
+        await self.send_embed_msg(
+            ctx,
+            title="Setting Changed",
+            description="Node {node} added, connecting to `{rest_uri}`.".format(
+                node=node, rest_uri=f"{final_host}:{final_port}"
+            ),
+        )
+        with contextlib.suppress(discord.HTTPException):
+            await ctx.message.delete()
+        try:
+            self.lavalink_restart_connect()
+        except ProcessLookupError:
+            await self.send_embed_msg(
+                ctx,
+                title="Failed To Shutdown Lavalink",
+                description="Please reload Music (`{prefix}reload audio`).".format(
+                    prefix=ctx.prefix
+                ),
+            )
+
+    @command_audioset_lavalink_node.command(name="remove", aliases=["delete"])
+    async def command_audioset_lavalink_node_remove(self, ctx: commands.Context, node: str):
+        """Remove an external node, its players move to the remaining nodes on reconnect."""
+        if node == "primary":
+            return await self.send_embed_msg(
+                ctx, title="Setting Not Changed", description="The primary node can't be removed."
+            )
+        if node not in (nodes := await self.config_cache.node_config.get_all_identifiers()):
+            return await self.send_embed_msg(
+                ctx,
+                title="Setting Not Changed",
+                description="{node} doesn't exist.\nAvailable nodes: {nodes}.".format(
+                    nodes=humanize_list(list(nodes), style="or"), node=node
+                ),
+            )
+        await self.config_cache.node_config.delete_node(node_identifier=node)
+        await self.send_embed_msg(
+            ctx, title="Setting Changed", description="Node {node} removed.".format(node=node)
+        )
+        try:
+            self.lavalink_restart_connect()
+        except ProcessLookupError:
+            await self.send_embed_msg(
+                ctx,
+                title="Failed To Shutdown Lavalink",
+                description="Please reload Music (`{prefix}reload audio`).".format(
+                    prefix=ctx.prefix
+                ),
+            )
+
     # noinspection HttpUrlsUsage
     @command_audioset_lavalink_node.command(name="host")
     async def command_audioset_lavalink_node_host(
         self, ctx: commands.Context, host: str, node: str = "primary"
     ):
-        """Set the node host.
-
-        Note: Currently `node` may only be set to "primary".
-        """
-        if node not in (  # TODO: Reenable when LL.py is merged in
-            nodes := await self.config_cache.node_config.get_all_identifiers()
-        ):
+        """Set the node host."""
+        if node not in (nodes := await self.config_cache.node_config.get_all_identifiers()):
             return await self.send_embed_msg(
                 ctx,
                 title="Setting Not Changed",
@@ -2301,9 +2500,7 @@ class AudioSetCommands(MixinMeta, ABC, metaclass=CompositeMetaClass):
                 ),
             )
 
-    @command_audioset_lavalink_node.command(
-        name="region", enabled=False
-    )  # TODO: Reenable when LL.py is merged in
+    @command_audioset_lavalink_node.command(name="region")
     async def command_audioset_lavalink_node_region(
         self, ctx: commands.Context, region: str = None, node: str = "primary"
     ):
@@ -2342,13 +2539,11 @@ class AudioSetCommands(MixinMeta, ABC, metaclass=CompositeMetaClass):
                 ),
             )
 
-    @command_audioset_lavalink_node.command(
-        name="shard", enabled=False
-    )  # TODO: Reenable when LL.py is merged in
+    @command_audioset_lavalink_node.command(name="shard")
     async def command_audioset_lavalink_node_shard(
-        self, ctx: commands.Context, shard_id: str = None, node: str = "primary"
+        self, ctx: commands.Context, shard_id: int = None, node: str = "primary"
     ):
-        """Set the Discord voice region for the node."""
+        """Set the only shard the node serves, leave empty to serve every shard."""
         if node not in (nodes := await self.config_cache.node_config.get_all_identifiers()):
             return await self.send_embed_msg(
                 ctx,
@@ -2390,9 +2585,7 @@ class AudioSetCommands(MixinMeta, ABC, metaclass=CompositeMetaClass):
                 ),
             )
 
-    @command_audioset_lavalink_node.command(
-        name="search", enabled=False
-    )  # TODO: Reenable when LL.py is merged in
+    @command_audioset_lavalink_node.command(name="search")
     async def command_audioset_lavalink_node_search(
         self, ctx: commands.Context, node: str = "primary"
     ):
@@ -3051,7 +3244,7 @@ class AudioSetCommands(MixinMeta, ABC, metaclass=CompositeMetaClass):
     async def command_audioset_lavalink_managed_downloader_check(self, ctx: commands.Context):
         """See the latest version of Red's Lavalink server."""
 
-        name, tag, url, date = await get_latest_lavalink_release(date=True)
+        name, tag, url, date = await get_latest_lavalink_release(self.http_client, date=True)
         version, build = tag.split("_")
         msg = "----" + "Release Builds" + "----        \n"
         msg += "Release Version:  [{version}]\n".format(version=version)
@@ -3062,7 +3255,7 @@ class AudioSetCommands(MixinMeta, ABC, metaclass=CompositeMetaClass):
         if await self.config_cache.managed_lavalink_meta.get_global_stable():
             with contextlib.suppress(Exception):
                 alpha_name, alpha_tag, alpha_url, alpha_date = await get_latest_lavalink_release(
-                    False, date=True
+                    self.http_client, False, date=True
                 )
                 alpha_version, alpha_build = alpha_tag.split("_")
                 if int(alpha_build) > int(build):
@@ -3262,6 +3455,64 @@ class AudioSetCommands(MixinMeta, ABC, metaclass=CompositeMetaClass):
 
         await menu(ctx, servers_embed, DEFAULT_CONTROLS)
 
+    @command_audioset_lavalink.command(name="nodes")
+    async def command_audioset_lavalink_nodes(self, ctx: commands.Context):
+        """Show the load of every connected node and its track loading latency."""
+        nodes = self.node_pool.stats()
+        if not nodes:
+            return await self.send_embed_msg(ctx, title="Not connected to any node.")
+        msg = ""
+        for node in nodes:
+            msg += (
+                "[{name}]{role}\n"
+                "Status:          [{status}]\n"
+                "Players:         [{players}]\n"
+                "Load score:      [{penalty}]\n"
+                "Loads in flight: [{in_flight}]\n"
+                "Track loads:     [{loads}, {failures} failed]\n"
+                "Load latency:    [p50 {p50}s, p95 {p95}s]\n\n"
+            ).format(
+                name=node["name"],
+                role=" search only" if node["search_only"] else "",
+                status="Ready" if node["ready"] else "Not ready",
+                players=humanize_number(node["players"]),
+                penalty=node["penalty"],
+                in_flight=node["rest_in_flight"],
+                loads=humanize_number(node["rest_loads"]),
+                failures=humanize_number(node["rest_failures"]),
+                p50=node["rest_p50"],
+                p95=node["rest_p95"],
+            )
+        msg += "Loads that fell back to the playing node: {}\n".format(
+            humanize_number(self.node_pool.fallbacks)
+        )
+        lookups = self.api_interface.fetch_track_stats()
+        msg += (
+            "Track lookups: {hits} cached, {joins} joined a running load, {misses} loaded, "
+            "{in_flight} loading\n"
+        ).format(
+            hits=humanize_number(lookups["hits"]),
+            joins=humanize_number(lookups["joins"]),
+            misses=humanize_number(lookups["misses"]),
+            in_flight=humanize_number(lookups["in_flight"]),
+        )
+        limiter = self.node_pool.limiter.stats()
+        msg += "Track loads running: {running}, waiting: {queued}\n".format(
+            running=limiter["running"], queued=limiter["queued"]
+        )
+        if ctx.guild:
+            waits = self.node_pool.limiter.stats(ctx.guild.id)
+            msg += "This server waited p50 {p50}s, p95 {p95}s over {count} loads\n".format(
+                p50=waits["p50"], p95=waits["p95"], count=humanize_number(waits["count"])
+            )
+        if self.node_pool.last_recovery is not None:
+            msg += "Node failures: {failovers}, last recovered in {seconds:.2f}s".format(
+                failovers=humanize_number(self.node_pool.failovers),
+                seconds=self.node_pool.last_recovery,
+            )
+        for page in pagify(msg, delims=["\n\n"], page_length=1900):
+            await ctx.send(box(page, lang="ini"))
+
     @command_audioset_lavalink.group(name="disconnect", aliases=["dc", "kill"])
     async def command_audioset_lavalink_disconnect(self, ctx: commands.Context):
         """Disconnect players."""
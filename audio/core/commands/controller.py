@@ -617,7 +617,7 @@ class PlayerControllerCommands(MixinMeta, ABC, metaclass=CompositeMetaClass):
                     description="I don't have permission to connect and speak in your channel.",
                 )
             if not self._player_check(ctx):
-                player = await lavalink.connect(
+                player = await self.node_pool.connect(
                     ctx.author.voice.channel,
                     deafen=await self.config_cache.auto_deafen.get_context_value(ctx.guild),
                 )
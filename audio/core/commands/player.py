@@ -95,7 +95,7 @@ class PlayerCommands(MixinMeta, ABC, metaclass=CompositeMetaClass):
                                 "I don't have permission to connect and speak in your channel."
                             ),
                         )
-                    await lavalink.connect(
+                    await self.node_pool.connect(
                         ctx.author.voice.channel,
                         deafen=await self.config_cache.auto_deafen.get_context_value(ctx.guild),
                     )
@@ -212,7 +212,7 @@ class PlayerCommands(MixinMeta, ABC, metaclass=CompositeMetaClass):
                             "I don't have permission to connect and speak in your channel."
                         ),
                     )
-                await lavalink.connect(
+                await self.node_pool.connect(
                     ctx.author.voice.channel,
                     deafen=await self.config_cache.auto_deafen.get_context_value(ctx.guild),
                 )
@@ -490,7 +490,7 @@ class PlayerCommands(MixinMeta, ABC, metaclass=CompositeMetaClass):
                             "I don't have permission to connect and speak in your channel."
                         ),
                     )
-                await lavalink.connect(
+                await self.node_pool.connect(
                     ctx.author.voice.channel,
                     deafen=await self.config_cache.auto_deafen.get_context_value(ctx.guild),
                 )
@@ -618,7 +618,7 @@ class PlayerCommands(MixinMeta, ABC, metaclass=CompositeMetaClass):
                             "I don't have permission to connect and speak in your channel."
                         ),
                     )
-                await lavalink.connect(
+                await self.node_pool.connect(
                     ctx.author.voice.channel,
                     deafen=await self.config_cache.auto_deafen.get_context_value(ctx.guild),
                 )
@@ -747,7 +747,7 @@ class PlayerCommands(MixinMeta, ABC, metaclass=CompositeMetaClass):
                             "I don't have permission to connect and speak in your channel."
                         ),
                     )
-                await lavalink.connect(
+                await self.node_pool.connect(
                     ctx.author.voice.channel,
                     deafen=await self.config_cache.auto_deafen.get_context_value(ctx.guild),
                 )
@@ -1048,7 +1048,7 @@ class PlayerCommands(MixinMeta, ABC, metaclass=CompositeMetaClass):
                             "I don't have permission to connect and speak in your channel."
                         ),
                     )
-                await lavalink.connect(
+                await self.node_pool.connect(
                     ctx.author.voice.channel,
                     deafen=await self.config_cache.auto_deafen.get_context_value(ctx.guild),
                 )
@@ -1884,7 +1884,7 @@ class PlaylistCommands(MixinMeta, ABC, metaclass=CompositeMetaClass):
                     ctx, title="Only Red playlist files can be uploaded."
                 )
             try:
-                async with self.session.request("GET", file_url) as r:
+                async with self.http_client.request("discord", "GET", file_url) as r:
                     uploaded_playlist = await r.json(
                         content_type="text/plain", encoding="utf-8", loads=json.loads
                     )
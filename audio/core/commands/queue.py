@@ -333,7 +333,7 @@ class QueueCommands(MixinMeta, ABC, metaclass=CompositeMetaClass):
                     title="Unable To Shuffle Queue",
                     description="I don't have permission to connect and speak in your channel.",
                 )
-            player = await lavalink.connect(
+            player = await self.node_pool.connect(
                 vc,
                 deafen=await self.config_cache.auto_deafen.get_context_value(ctx.guild),
             )
@@ -267,7 +267,6 @@ class DpyEvents(MixinMeta, ABC, metaclass=CompositeMetaClass):
             return
 
         self.bot.dispatch("red_audio_unload", self)
-        self.session.detach()
         self.bot.loop.create_task(self._close_database())
         if self.player_automated_timer_task:
             self.player_automated_timer_task.cancel()
@@ -4,15 +4,20 @@ from __future__ import annotations
 # Standard Library Imports
 from abc import ABC
 import asyncio
+import contextlib
+import functools
 import logging
 
 # Dependency Imports
 from redbot.core import data_manager
+import discord
 
 # My Modded Imports
 import lavalink
 
 # Music Imports
+from ...apis.node_pool import PooledNode
+from ...audio_logging import debug_exc_log
 from ...errors import LavalinkDownloadFailed, ShouldAutoRecover
 from ...manager import ServerManager
 from ..abc import MixinMeta
@@ -20,6 +25,30 @@ from ..cog_utils import CompositeMetaClass
 
 log = logging.getLogger("red.cogs.Music.cog.Tasks.lavalink")
 
+# Values the cog stores on a player, carried over when it moves to another node
+_PLAYER_STORE_KEYS = (
+    "notify_channel",
+    "notify_message",
+    "np_message",
+    "eq_message",
+    "autoplay_notified",
+    "playing_song",
+    "requester",
+    "prev_song",
+    "prev_requester",
+)
+# Filters besides the volume and equalizer, carried over when a player moves to another node
+_PLAYER_FILTERS = (
+    "karaoke",
+    "timescale",
+    "tremolo",
+    "vibrato",
+    "rotation",
+    "distortion",
+    "low_pass",
+    "channel_mix",
+)
+
 
 class LavalinkTasks(MixinMeta, ABC, metaclass=CompositeMetaClass):
     def lavalink_restart_connect(self) -> None:
@@ -37,6 +66,8 @@ class LavalinkTasks(MixinMeta, ABC, metaclass=CompositeMetaClass):
 
     async def lavalink_attempt_connect(self, timeout: int = 50) -> None:
         self.lavalink_connection_aborted = False
+        await self.node_pool.close()
+        self.node_pool.clear()
         max_retries = 5
         retry_count = 0
         lazy_external = False
@@ -53,7 +84,9 @@ class LavalinkTasks(MixinMeta, ABC, metaclass=CompositeMetaClass):
                 break
             if self.player_manager is not None:
                 await self.player_manager.shutdown()
-            self.player_manager = ServerManager(host, password, port, self.config_cache)
+            self.player_manager = ServerManager(
+                host, password, port, self.config_cache, self.http_client
+            )
             try:
                 await self.player_manager.start(java_exec)
             except ShouldAutoRecover:
@@ -107,7 +140,7 @@ class LavalinkTasks(MixinMeta, ABC, metaclass=CompositeMetaClass):
             if lavalink.node._nodes:
                 await lavalink.node.disconnect()
             try:
-                await lavalink.initialize(
+                primary = await lavalink.initialize(
                     bot=self.bot,
                     host=host,
                     password=password,
@@ -152,6 +185,140 @@ class LavalinkTasks(MixinMeta, ABC, metaclass=CompositeMetaClass):
                     "See above tracebacks for details."
                 )
             return
+        await self.lavalink_connect_pool(primary, timeout)
         if managed is False:
             await asyncio.sleep(5)
         self._restore_task = asyncio.create_task(self.restore_players())
+
+    async def _pool_node(self, name: str, node: lavalink.node.Node) -> PooledNode:
+        node.register_state_handler(functools.partial(self.lavalink_node_state_handler, name))
+        return self.node_pool.add(
+            name,
+            node,
+            region=await self.config_cache.node_config.get_region(node_identifier=name),
+            shard_id=await self.config_cache.node_config.get_shard_id(node_identifier=name),
+            search_only=await self.config_cache.node_config.get_search_only(node_identifier=name),
+            rest_uri=await self.config_cache.node_config.get_rest_uri(node_identifier=name),
+            password=await self.config_cache.node_config.get_password(node_identifier=name),
+        )
+
+    async def _connect_node(self, name: str, timeout: int = 50) -> lavalink.node.Node:
+        """Connect a node besides the primary one.
+
+        :code:`lavalink.initialize` registers the library's event listeners every time it is
+        called, so the node is created and connected the way it does without registering them
+        again. Events of every node are dispatched to the listeners the primary node registered.
+        """
+        node = lavalink.node.Node(
+            event_handler=lavalink.lavalink.dispatch,
+            host=await self.config_cache.node_config.get_host(node_identifier=name),
+            password=await self.config_cache.node_config.get_password(node_identifier=name),
+            port=await self.config_cache.node_config.get_port(node_identifier=name),
+            user_id=self.bot.user.id,
+            num_shards=self.bot.shard_count or 1,
+            resume_key=f"Red-Core-Audio-{self.bot.user.id}-{data_manager.instance_name}-{name}",
+            node_name=await self.config_cache.node_config.get_identifier(node_identifier=name),
+            rest_uri=await self.config_cache.node_config.get_rest_uri(node_identifier=name),
+            bot=self.bot,
+        )
+        await node.connect(timeout=timeout)
+        return node
+
+    async def lavalink_connect_pool(self, primary: lavalink.node.Node, timeout: int = 50) -> None:
+        """Connect every configured node besides the primary one and add them to the pool."""
+        await self._pool_node("primary", primary)
+        for name in sorted(await self.config_cache.node_config.get_all_identifiers()):
+            if name == "primary":
+                continue
+            try:
+                node = await self._connect_node(name, timeout)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                host = await self.config_cache.node_config.get_host(node_identifier=name)
+                log.warning("Unable to connect to the %s node (%s), skipping it.", name, host)
+                debug_exc_log(log, exc, "Failed to connect to the %s node", name)
+                continue
+            await self._pool_node(name, node)
+        if len(self.node_pool) > 1:
+            log.info("Connected to %d Lavalink nodes.", len(self.node_pool))
+        self.node_pool.start(self.lavalink_move_player)
+
+    async def lavalink_node_state_handler(
+        self, name: str, next_state: lavalink.enums.NodeState, old_state: lavalink.enums.NodeState
+    ) -> None:
+        """Move the players of a node that lost its connection to the healthy nodes."""
+        if next_state != lavalink.enums.NodeState.RECONNECTING or self.cog_cleaned_up:
+            return
+        pooled = self.node_pool.get(name)
+        if pooled is None or not pooled.players:
+            return
+        log.warning("Lost the connection to the %s node, moving its players.", name)
+        await self.node_pool.failover(pooled, self.lavalink_move_player)
+
+    async def _retire_player(self, player: lavalink.Player) -> None:
+        """Drop a player from its node without leaving the voice channel."""
+        try:
+            await player.node.destroy_guild(player.channel.guild.id)
+        except Exception as exc:
+            # The node may be gone already, there is nothing left to destroy on it
+            debug_exc_log(log, exc, "Failed to destroy the player of %s", player.channel.guild.id)
+        with contextlib.suppress(Exception):
+            await player.node.player_manager.remove_player(player)
+
+    async def lavalink_move_player(self, player: lavalink.Player, pooled: PooledNode) -> None:
+        """Move a player to another node, resuming its track where it was.
+
+        The new player is set up and playing before the old one is dropped, so a move that
+        fails leaves the old player alone. The guild is then left to the node reconnecting and
+        :meth:`restore_players`.
+        """
+        channel: discord.VoiceChannel = player.channel
+        current = player.current
+        position = player.position
+        paused = player.paused
+        queue = list(player.queue)
+        volume = player.volume
+        equalizer = player.equalizer
+        filters = {
+            name: value
+            for name in _PLAYER_FILTERS
+            if (value := getattr(player, name, None)) is not None
+        }
+        stored = {key: player.fetch(key) for key in _PLAYER_STORE_KEYS}
+        repeat, shuffle, shuffle_bumped = player.repeat, player.shuffle, player.shuffle_bumped
+
+        new_player = None
+        try:
+            new_player = await pooled.node.player_manager.create_player(
+                channel,
+                deafen=await self.config_cache.auto_deafen.get_context_value(channel.guild),
+            )
+            for key, value in stored.items():
+                new_player.store(key, value)
+            new_player.repeat = repeat
+            new_player.shuffle = shuffle
+            new_player.shuffle_bumped = shuffle_bumped
+            new_player.queue = queue
+            await new_player.set_volume(volume)
+            await new_player.set_equalizer(equalizer=equalizer)
+            if filters:
+                await new_player.set_filters(**filters)
+            if current is not None:
+                await new_player.resume(current, start=position, replace=True)
+                if paused:
+                    await new_player.pause()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            log.warning(
+                "Failed to move the player of %s to the %s node, restoring it instead.",
+                channel.guild.id,
+                pooled.name,
+            )
+            if new_player is not None:
+                await self._retire_player(new_player)
+            if self._restore_task is None or self._restore_task.done():
+                self._restore_task = asyncio.create_task(self.restore_players())
+            raise
+        await self._retire_player(player)
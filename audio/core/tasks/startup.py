@@ -88,13 +88,17 @@ class StartUpTasks(MixinMeta, ABC, metaclass=CompositeMetaClass):
             self.api_interface = AudioAPIInterface(
                 self.bot,
                 self.config,
-                self.session,
+                self.http_client,
                 self.db_conn,
                 self.bot.get_cog("Music"),
                 self.config_cache,
             )
             self.playlist_api = PlaylistWrapper(
-                self.bot, self.config, self.db_conn, self.config_cache
+                self.bot,
+                self.config,
+                self.db_conn,
+                self.config_cache,
+                self.api_interface.db_executor,
             )
             await self.playlist_api.init()
             await self.api_interface.initialize()
@@ -174,7 +178,7 @@ class StartUpTasks(MixinMeta, ABC, metaclass=CompositeMetaClass):
                             if not (perms.connect and perms.speak):
                                 vc = None
                                 break
-                            player = await lavalink.connect(vc, deafen=auto_deafen)
+                            player = await self.node_pool.connect(vc, deafen=auto_deafen)
                             player.store("notify_channel", notify_channel_id)
                             break
                         except IndexError:
@@ -248,7 +252,7 @@ class StartUpTasks(MixinMeta, ABC, metaclass=CompositeMetaClass):
                         if not (perms.connect and perms.speak):
                             vc = None
                             break
-                        player = await lavalink.connect(vc, deafen=auto_deafen)
+                        player = await self.node_pool.connect(vc, deafen=auto_deafen)
                         player.store("notify_channel", notify_channel_id)
                         break
                     except IndexError:
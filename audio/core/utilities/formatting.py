@@ -101,7 +101,7 @@ class FormattingUtilities(MixinMeta, ABC, metaclass=CompositeMetaClass):
                     description = "Please check your console or logs for details."
                 return await self.send_embed_msg(ctx, title=msg, description=description)
             try:
-                await lavalink.connect(
+                await self.node_pool.connect(
                     ctx.author.voice.channel,
                     deafen=await self.config_cache.auto_deafen.get_context_value(ctx.guild),
                 )
@@ -74,7 +74,7 @@ class LocalTrackUtilities(MixinMeta, ABC, metaclass=CompositeMetaClass):
         async for local_file in AsyncIter(await self.get_all_localtrack_folder_tracks(ctx, query)):
             with contextlib.suppress(IndexError, TrackEnqueueError):
                 trackdata, called_api = await self.api_interface.fetch_track(
-                    ctx, player, local_file
+                    ctx, player, local_file, bulk=True
                 )
                 local_tracks.append(trackdata.tracks[0])
         return local_tracks
@@ -7,7 +7,6 @@ from typing import Tuple
 
 # Dependency Imports
 from bs4 import BeautifulSoup
-from requests_futures.sessions import FuturesSession
 
 # Music Imports
 from ..abc import MixinMeta
@@ -17,8 +16,7 @@ from ..cog_utils import CompositeMetaClass
 class LyricUtilities(MixinMeta, ABC, metaclass=CompositeMetaClass):
     """Base class to hold all Lyric utility methods"""
 
-    @staticmethod
-    async def get_lyrics_string(artist_song: str) -> Tuple[str, str, str, str]:
+    async def get_lyrics_string(self, artist_song: str) -> Tuple[str, str, str, str]:
         percents = {
             " ": "+",
             "!": "%21",
@@ -43,10 +41,11 @@ class LyricUtilities(MixinMeta, ABC, metaclass=CompositeMetaClass):
             if char in percents:
                 char = percents[char]
             searchquery += char
-        session = FuturesSession()
-        future = session.get("https://google.com/search?q=" + searchquery + "+lyrics")
-        response_one = future.result()
-        soup = BeautifulSoup(response_one.text, "html.parser")
+        async with self.http_client.request(
+            "lyrics", "GET", "https://google.com/search?q=" + searchquery + "+lyrics"
+        ) as response:
+            text = await response.text()
+        soup = BeautifulSoup(text, "html.parser")
         bouncer = "Our systems have detected unusual traffic from your computer network"
         if bouncer in soup.get_text():
             title_ = ""
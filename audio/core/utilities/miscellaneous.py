@@ -140,7 +140,11 @@ class MiscellaneousUtilities(MixinMeta, ABC, metaclass=CompositeMetaClass):
     async def _close_database(self) -> None:
         if self.api_interface is not None:
             await self.api_interface.run_all_pending_tasks()
-            self.api_interface.close()
+        # The last flushes of the write buffer and the uploader above still need the session
+        await self.node_pool.close()
+        await self.http_client.close()
+        if self.api_interface is not None:
+            await self.api_interface.close()
 
     async def _check_api_tokens(self) -> MutableMapping:
         spotify = await self.bot.get_shared_api_tokens("spotify")
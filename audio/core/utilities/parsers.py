@@ -23,7 +23,9 @@ STREAM_TITLE: Final[re.Pattern] = re.compile(br"StreamTitle='([^']*)';")
 class ParsingUtilities(MixinMeta, ABC, metaclass=CompositeMetaClass):
     async def icyparser(self, url: str) -> Optional[str]:
         try:
-            async with self.session.get(url, headers={"Icy-MetaData": "1"}) as resp:
+            async with self.http_client.request(
+                "stream", "GET", url, headers={"Icy-MetaData": "1"}
+            ) as resp:
                 metaint = int(resp.headers["icy-metaint"])
                 for _ in range(5):
                     await resp.content.readexactly(metaint)
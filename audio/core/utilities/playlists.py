@@ -14,7 +14,6 @@ import time
 
 # Dependency Imports
 from discord.embeds import EmptyEmbed
-import aiohttp
 import discord
 
 # My Modded Imports
@@ -429,7 +428,10 @@ class PlaylistUtilities(MixinMeta, ABC, metaclass=CompositeMetaClass):
             try:
                 try:
                     result, called_api = await self.api_interface.fetch_track(
-                        ctx, player, Query.process_input(song_url, self.local_folder_current_path)
+                        ctx,
+                        player,
+                        Query.process_input(song_url, self.local_folder_current_path),
+                        bulk=True,
                     )
                 except TrackEnqueueError:
                     self.update_player_lock(ctx, False)
@@ -554,7 +556,7 @@ class PlaylistUtilities(MixinMeta, ABC, metaclass=CompositeMetaClass):
                         ),
                     )
                     return False
-                await lavalink.connect(
+                await self.node_pool.connect(
                     ctx.author.voice.channel,
                     deafen=await self.config_cache.auto_deafen.get_context_value(ctx.guild),
                 )
@@ -696,22 +698,23 @@ class PlaylistUtilities(MixinMeta, ABC, metaclass=CompositeMetaClass):
             return str(ctx) if ctx else "the User" if the else "User"
 
     async def _get_bundled_playlist_tracks(self):
-        async with aiohttp.ClientSession(json_serialize=json.dumps) as session:
-            async with session.get(
-                CURRATED_DATA + f"?timestamp={int(time.time())}",
-                headers={"content-type": "application/json"},
-            ) as response:
-                if response.status != 200:
-                    return 0, []
-                try:
-                    data = json.loads(await response.read())
-                except Exception:
-                    log.exception("Curated playlist couldn't be parsed, report this error.")
-                    data = {}
-                web_version = data.get("version", 0)
-                entries = data.get("entries", [])
-                if entries:
-                    random.shuffle(entries)
+        async with self.http_client.request(
+            "github",
+            "GET",
+            CURRATED_DATA + f"?timestamp={int(time.time())}",
+            headers={"content-type": "application/json"},
+        ) as response:
+            if response.status != 200:
+                return 0, []
+            try:
+                data = json.loads(await response.read())
+            except Exception:
+                log.exception("Curated playlist couldn't be parsed, report this error.")
+                data = {}
+            web_version = data.get("version", 0)
+            entries = data.get("entries", [])
+            if entries:
+                random.shuffle(entries)
         tracks = []
         async for entry in AsyncIter(entries, steps=25):
             with contextlib.suppress(Exception):
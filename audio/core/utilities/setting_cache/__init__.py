@@ -31,6 +31,8 @@ from .jukebox import JukeboxManager
 from .jukebox_price import JukeboxPriceManager
 from .local_cache_age import LocalCacheAgeManager
 from .local_cache_level import LocalCacheLevelManager
+from .local_cache_max_rows import LocalCacheMaxRowsManager
+from .local_cache_max_size import LocalCacheMaxSizeManager
 from .localpath import LocalPathManager
 from .lyrics import PreferLyricsManager
 from .managed_lavalink_auto_update import LavalinkAutoUpdateManager
@@ -52,6 +54,8 @@ from .vc_restricted import VCRestrictedManager
 from .volume import VolumeManager
 from .votes_percentage import VotesPercentageManager
 from .voting import VotingManager
+from .youtube_quota_budget import YouTubeQuotaBudgetManager
+from .youtube_quota_threshold import YouTubeQuotaThresholdManager
 
 __all__ = ["SettingCacheManager"]
 
@@ -95,6 +99,12 @@ class SettingCacheManager:
     channel_restrict: ChannelRestrictManager = cache_factory(ChannelRestrictManager)
     volume: VolumeManager = cache_factory(VolumeManager)
     local_cache_age: LocalCacheAgeManager = cache_factory(LocalCacheAgeManager)
+    local_cache_max_rows: LocalCacheMaxRowsManager = cache_factory(LocalCacheMaxRowsManager)
+    local_cache_max_size: LocalCacheMaxSizeManager = cache_factory(LocalCacheMaxSizeManager)
+    youtube_quota_budget: YouTubeQuotaBudgetManager = cache_factory(YouTubeQuotaBudgetManager)
+    youtube_quota_threshold: YouTubeQuotaThresholdManager = cache_factory(
+        YouTubeQuotaThresholdManager
+    )
     java_exec: JavaExecPathManager = cache_factory(JavaExecPathManager)
     jukebox: JukeboxManager = cache_factory(JukeboxManager)
     jukebox_price: JukeboxPriceManager = cache_factory(JukeboxPriceManager)
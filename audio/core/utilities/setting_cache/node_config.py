@@ -228,10 +228,19 @@ class NodeConfigManager(CacheBase):
             return await self.refresh_all_identifiers()
         return self._cached_global[None]
 
+    async def add_node(self, node_identifier: str, **settings: Union[str, int, bool]) -> None:
+        """Add a node with the default settings, overridden by `settings`."""
+        data = self._config.defaults["GLOBAL"]["lavalink"]["nodes"]["primary"]
+        data.update(settings, identifier=node_identifier)
+        await self._config.lavalink.nodes.set_raw(node_identifier, value=data)
+        self._cached_global[node_identifier] = dict(data)
+        await self.refresh_all_identifiers()
+
     async def delete_node(self, node_identifier: str = "primary") -> None:
         await self._config.lavalink.nodes.clear_raw(node_identifier)
         if node_identifier in self._cached_global:
             del self._cached_global[node_identifier]
+        await self.refresh_all_identifiers()
 
     async def refresh_all_identifiers(self) -> Set[str]:
         self._cached_global[None] = set((await self._config.lavalink.nodes.all()).keys())
@@ -0,0 +1,49 @@
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+from typing import Dict, Optional
+
+# Dependency Imports
+import discord
+
+# Music Imports
+from .abc import CacheBase
+
+
+class YouTubeQuotaThresholdManager(CacheBase):
+    __slots__ = (
+        "_config",
+        "bot",
+        "enable_cache",
+        "config_cache",
+        "_cached_global",
+    )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_global: Dict[None, int] = {}
+
+    async def get_global(self) -> int:
+        ret: int
+        if self.enable_cache and None in self._cached_global:
+            ret = self._cached_global[None]
+        else:
+            ret = await self._config.youtube_quota_threshold()
+            self._cached_global[None] = ret
+        return ret
+
+    async def set_global(self, set_to: Optional[int]) -> None:
+        if set_to is not None:
+            await self._config.youtube_quota_threshold.set(set_to)
+            self._cached_global[None] = set_to
+        else:
+            await self._config.youtube_quota_threshold.clear()
+            self._cached_global[None] = self._config.defaults["GLOBAL"]["youtube_quota_threshold"]
+
+    async def get_context_value(self, guild: discord.Guild = None) -> int:
+        return await self.get_global()
+
+    def reset_globals(self) -> None:
+        if None in self._cached_global:
+            del self._cached_global[None]
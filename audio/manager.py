@@ -18,7 +18,6 @@ import tempfile
 
 # Dependency Imports
 from tqdm import tqdm
-import aiohttp
 import yaml
 
 try:
@@ -31,6 +30,7 @@ except ImportError:
 from redbot.core import data_manager
 
 # Music Imports
+from .apis.http_client import HTTPClient
 from .core.utilities import SettingCacheManager
 from .errors import LavalinkDownloadFailed, ShouldAutoRecover
 from .utils import task_callback
@@ -101,39 +101,36 @@ LAVALINK_JAR_ENDPOINT: Final[
 ] = "https://api.github.com/repos/Drapersniper/Lavalink-Jars/releases"
 
 
-async def get_latest_lavalink_release(stable=True, date=False):
-    async with aiohttp.ClientSession(json_serialize=json.dumps) as session:
-        async with session.get(LAVALINK_JAR_ENDPOINT) as resp:
-            if resp.status != 200:
-                return "", "0_0", 0, None
-            data = await resp.json(loads=json.loads)
-            if stable:
-                data = list(
-                    filter(lambda d: d["prerelease"] is False and d["draft"] is False, data)
-                )
-            data = sorted(data, key=lambda k: k["published_at"], reverse=True)[0] or {}
-            output = (
-                data.get("name"),
-                data.get("tag_name"),
-                next(
-                    (
-                        i.get("browser_download_url")
-                        for i in data.get("assets", [])
-                        if i.get("name") == "Lavalink.jar"
-                    ),
-                    None,
+async def get_latest_lavalink_release(http: HTTPClient, stable=True, date=False):
+    async with http.request("github", "GET", LAVALINK_JAR_ENDPOINT) as resp:
+        if resp.status != 200:
+            return "", "0_0", 0, None
+        data = await resp.json(loads=json.loads)
+        if stable:
+            data = list(filter(lambda d: d["prerelease"] is False and d["draft"] is False, data))
+        data = sorted(data, key=lambda k: k["published_at"], reverse=True)[0] or {}
+        output = (
+            data.get("name"),
+            data.get("tag_name"),
+            next(
+                (
+                    i.get("browser_download_url")
+                    for i in data.get("assets", [])
+                    if i.get("name") == "Lavalink.jar"
                 ),
                 None,
+            ),
+            None,
+        )
+        if not date:
+            return output
+        else:
+            return (
+                output[0],
+                output[1],
+                output[2],
+                data.get("published_at", datetime.datetime.now()),
             )
-            if not date:
-                return output
-            else:
-                return (
-                    output[0],
-                    output[1],
-                    output[2],
-                    data.get("published_at", datetime.datetime.now()),
-                )
 
 
 class ServerManager:
@@ -154,8 +151,16 @@ class ServerManager:
     _buildtime: ClassVar[str] = "Unknown"
     _java_exc: ClassVar[str] = "java"
 
-    def __init__(self, host: str, password: str, port: int, cache: SettingCacheManager) -> None:
+    def __init__(
+        self,
+        host: str,
+        password: str,
+        port: int,
+        cache: SettingCacheManager,
+        http: HTTPClient,
+    ) -> None:
         self.ready: asyncio.Event = asyncio.Event()
+        self._http = http
         self._port = port
         self._host = host
         self._password = password
@@ -205,7 +210,7 @@ class ServerManager:
         else:
             if await self.config_cache.managed_lavalink_server_auto_update.get_global():
                 with contextlib.suppress(Exception):
-                    name, tag, url, _nothing = await get_latest_lavalink_release()
+                    name, tag, url, _nothing = await get_latest_lavalink_release(self._http)
                     if name and "_" in name:
                         tag = name
                         version, build = name.split("_")
@@ -430,45 +435,44 @@ class ServerManager:
 
     async def _download_jar(self) -> None:
         log.info("Downloading Lavalink.jar...")
-        async with aiohttp.ClientSession(json_serialize=json.dumps) as session:
-            async with session.get(self._jar_download_url) as response:
-                if response.status == 404:
-                    # A 404 means our LAVALINK_DOWNLOAD_URL is invalid, so likely the jar version
-                    # hasn't been published yet
-                    raise LavalinkDownloadFailed(
-                        f"Lavalink server version {self._jar_version}_{self._jar_build} "
-                        "hasn't been published yet",
-                        response=response,
-                        should_retry=False,
-                    )
-                elif 400 <= response.status < 600:
-                    # Other bad responses should be raised but we should retry just incase
-                    raise LavalinkDownloadFailed(response=response, should_retry=True)
-                fd, path = tempfile.mkstemp()
-                file = open(fd, "wb")
-                nbytes = 0
-                with tqdm(
-                    desc="Lavalink.jar",
-                    total=response.content_length,
-                    file=sys.stdout,
-                    unit="B",
-                    unit_scale=True,
-                    miniters=1,
-                    dynamic_ncols=True,
-                    leave=False,
-                ) as progress_bar:
-                    try:
+        async with self._http.request("download", "GET", self._jar_download_url) as response:
+            if response.status == 404:
+                # A 404 means our LAVALINK_DOWNLOAD_URL is invalid, so likely the jar version
+                # hasn't been published yet
+                raise LavalinkDownloadFailed(
+                    f"Lavalink server version {self._jar_version}_{self._jar_build} "
+                    "hasn't been published yet",
+                    response=response,
+                    should_retry=False,
+                )
+            elif 400 <= response.status < 600:
+                # Other bad responses should be raised but we should retry just incase
+                raise LavalinkDownloadFailed(response=response, should_retry=True)
+            fd, path = tempfile.mkstemp()
+            file = open(fd, "wb")
+            nbytes = 0
+            with tqdm(
+                desc="Lavalink.jar",
+                total=response.content_length,
+                file=sys.stdout,
+                unit="B",
+                unit_scale=True,
+                miniters=1,
+                dynamic_ncols=True,
+                leave=False,
+            ) as progress_bar:
+                try:
+                    chunk = await response.content.read(1024)
+                    while chunk:
+                        chunk_size = file.write(chunk)
+                        nbytes += chunk_size
+                        progress_bar.update(chunk_size)
                         chunk = await response.content.read(1024)
-                        while chunk:
-                            chunk_size = file.write(chunk)
-                            nbytes += chunk_size
-                            progress_bar.update(chunk_size)
-                            chunk = await response.content.read(1024)
-                        file.flush()
-                    finally:
-                        file.close()
-
-                shutil.move(path, str(LAVALINK_JAR_FILE), copy_function=shutil.copyfile)
+                    file.flush()
+                finally:
+                    file.close()
+
+            shutil.move(path, str(LAVALINK_JAR_FILE), copy_function=shutil.copyfile)
 
         log.info("Successfully downloaded Lavalink.jar (%s bytes written)", format(nbytes, ","))
         await self._is_up_to_date()
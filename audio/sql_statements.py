@@ -27,37 +27,98 @@ __all__ = [
     "PLAYLIST_FETCH",
     "PLAYLIST_UPSERT",
     "PLAYLIST_CREATE_INDEX",
+    "PLAYLIST_CREATE_INDEX_SCOPE",
+    "PLAYLIST_CREATE_INDEX_DELETED",
     # YouTube table statements
     "YOUTUBE_DROP_TABLE",
     "YOUTUBE_CREATE_TABLE",
     "YOUTUBE_CREATE_INDEX",
+    "YOUTUBE_CREATE_INDEX_LAST_UPDATED",
     "YOUTUBE_UPSERT",
     "YOUTUBE_UPDATE",
     "YOUTUBE_QUERY",
+    "YOUTUBE_QUERY_MANY",
     "YOUTUBE_QUERY_ALL",
     "YOUTUBE_DELETE_OLD_ENTRIES",
+    "YOUTUBE_DELETE_OLD_ENTRIES_BATCH",
+    "YOUTUBE_DELETE_LEAST_RECENT",
+    "YOUTUBE_QUERY_SIZE",
+    "YOUTUBE_CREATE_INDEX_LAST_FETCHED",
     "YOUTUBE_QUERY_LAST_FETCHED_RANDOM",
+    "YOUTUBE_ADD_COLUMN_ISRC",
+    "YOUTUBE_CREATE_INDEX_ISRC",
+    "YOUTUBE_QUERY_MANY_ISRC",
     # Spotify table statements
     "SPOTIFY_DROP_TABLE",
     "SPOTIFY_CREATE_INDEX",
+    "SPOTIFY_CREATE_INDEX_URI",
+    "SPOTIFY_CREATE_INDEX_LAST_UPDATED",
     "SPOTIFY_CREATE_TABLE",
     "SPOTIFY_UPSERT",
     "SPOTIFY_QUERY",
+    "SPOTIFY_QUERY_MANY",
     "SPOTIFY_QUERY_ALL",
     "SPOTIFY_UPDATE",
     "SPOTIFY_DELETE_OLD_ENTRIES",
+    "SPOTIFY_DELETE_OLD_ENTRIES_BATCH",
+    "SPOTIFY_DELETE_LEAST_RECENT",
+    "SPOTIFY_QUERY_SIZE",
+    "SPOTIFY_CREATE_INDEX_LAST_FETCHED",
     "SPOTIFY_QUERY_LAST_FETCHED_RANDOM",
+    "SPOTIFY_ADD_COLUMN_ISRC",
+    "SPOTIFY_CREATE_INDEX_ISRC",
+    # Spotify collections table statements
+    "SPOTIFY_COLLECTIONS_CREATE_TABLE",
+    "SPOTIFY_COLLECTIONS_CREATE_INDEX_LAST_UPDATED",
+    "SPOTIFY_COLLECTIONS_CREATE_INDEX_LAST_FETCHED",
+    "SPOTIFY_COLLECTIONS_UPSERT",
+    "SPOTIFY_COLLECTIONS_UPDATE",
+    "SPOTIFY_COLLECTIONS_QUERY",
+    "SPOTIFY_COLLECTIONS_DELETE_OLD_ENTRIES_BATCH",
+    "SPOTIFY_COLLECTIONS_DELETE_LEAST_RECENT",
+    "SPOTIFY_COLLECTIONS_QUERY_SIZE",
     # Lavalink table statements
     "LAVALINK_DROP_TABLE",
     "LAVALINK_CREATE_TABLE",
     "LAVALINK_CREATE_INDEX",
+    "LAVALINK_CREATE_INDEX_LAST_UPDATED",
     "LAVALINK_UPSERT",
     "LAVALINK_UPDATE",
     "LAVALINK_QUERY",
+    "LAVALINK_QUERY_MANY",
     "LAVALINK_QUERY_ALL",
     "LAVALINK_QUERY_LAST_FETCHED_RANDOM",
     "LAVALINK_DELETE_OLD_ENTRIES",
+    "LAVALINK_DELETE_OLD_ENTRIES_BATCH",
+    "LAVALINK_DELETE_LEAST_RECENT",
+    "LAVALINK_QUERY_SIZE",
     "LAVALINK_FETCH_ALL_ENTRIES_GLOBAL",
+    "LAVALINK_FETCH_UNSPLIT_PAYLOADS",
+    "LAVALINK_UPDATE_PAYLOAD",
+    "LAVALINK_CREATE_INDEX_LAST_FETCHED",
+    # Autoplay pool statements
+    "AUTOPLAY_POOL_CREATE_TABLE",
+    "AUTOPLAY_POOL_INSERT",
+    "AUTOPLAY_POOL_MAX_SLOT",
+    "AUTOPLAY_POOL_QUERY_SLOT",
+    "AUTOPLAY_POOL_FETCH_SLOT",
+    "AUTOPLAY_POOL_DELETE_SLOT",
+    "AUTOPLAY_POOL_MOVE_SLOT",
+    "AUTOPLAY_POOL_DELETE_ALL",
+    "AUTOPLAY_POOL_REBUILD",
+    # Track table statements
+    "TRACKS_CREATE_TABLE",
+    "TRACKS_CREATE_INDEX_LAST_UPDATED",
+    "TRACKS_ADD_COLUMN_LAST_FETCHED",
+    "TRACKS_SET_LAST_FETCHED",
+    "TRACKS_CREATE_INDEX_LAST_FETCHED",
+    "TRACKS_UPSERT",
+    "TRACKS_QUERY_MANY",
+    "TRACKS_UPDATE_LAST_FETCHED",
+    "TRACKS_DELETE_OLD_ENTRIES",
+    "TRACKS_DELETE_OLD_ENTRIES_BATCH",
+    "TRACKS_DELETE_LEAST_RECENT",
+    "TRACKS_QUERY_SIZE",
     # Persisting Queue statements
     "PERSIST_QUEUE_DROP_TABLE",
     "PERSIST_QUEUE_CREATE_TABLE",
@@ -67,6 +128,14 @@ __all__ = [
     "PERSIST_QUEUE_FETCH_ALL",
     "PERSIST_QUEUE_UPSERT",
     "PERSIST_QUEUE_BULK_PLAYED",
+    # Global API spool statements
+    "GLOBAL_SPOOL_CREATE_TABLE",
+    "GLOBAL_SPOOL_CREATE_INDEX",
+    "GLOBAL_SPOOL_UPSERT",
+    "GLOBAL_SPOOL_FETCH_DUE",
+    "GLOBAL_SPOOL_DELETE",
+    "GLOBAL_SPOOL_RESCHEDULE",
+    "GLOBAL_SPOOL_COUNT",
 ]
 
 # PRAGMA Statements
@@ -94,7 +163,7 @@ pragma user_version;
 PRAGMA_SET_user_version: Final[
     str
 ] = """
-pragma user_version=3;
+pragma user_version=10;
 """
 
 # Data Deletion
@@ -280,6 +349,19 @@ CREATE INDEX IF NOT EXISTS name_index ON playlists (
 scope_type, playlist_id, playlist_name, scope_id
 );
 """
+PLAYLIST_CREATE_INDEX_SCOPE: Final[
+    str
+] = """
+CREATE INDEX IF NOT EXISTS idx_playlists_scope ON playlists (
+scope_type, scope_id, author_id
+);
+"""
+PLAYLIST_CREATE_INDEX_DELETED: Final[
+    str
+] = """
+CREATE INDEX IF NOT EXISTS idx_playlists_deleted ON playlists (deleted)
+WHERE deleted = true;
+"""
 
 # YouTube table statements
 YOUTUBE_DROP_TABLE: Final[
@@ -304,6 +386,12 @@ YOUTUBE_CREATE_INDEX: Final[
 CREATE UNIQUE INDEX IF NOT EXISTS idx_youtube_url
 ON youtube (track_info, youtube_url);
 """
+YOUTUBE_CREATE_INDEX_LAST_UPDATED: Final[
+    str
+] = """
+CREATE INDEX IF NOT EXISTS idx_youtube_last_updated
+ON youtube (last_updated);
+"""
 YOUTUBE_UPSERT: Final[
     str
 ] = """INSERT INTO
@@ -311,6 +399,7 @@ youtube
   (
     track_info,
     youtube_url,
+    isrc,
     last_updated,
     last_fetched
   )
@@ -318,6 +407,7 @@ VALUES
   (
    :track_info,
    :track_url,
+   :isrc,
    :last_updated,
    :last_fetched
   )
@@ -329,6 +419,7 @@ ON CONFLICT
 DO UPDATE
   SET
     track_info = excluded.track_info,
+    isrc = coalesce(excluded.isrc, isrc),
     last_updated = excluded.last_updated
 """
 YOUTUBE_UPDATE: Final[
@@ -348,11 +439,25 @@ WHERE
     AND last_updated > :maxage
 LIMIT 1;
 """
+YOUTUBE_QUERY_MANY: Final[
+    str
+] = """
+SELECT track_info, youtube_url, last_updated
+FROM youtube
+WHERE
+    track_info IN (SELECT value FROM json_each(:keys))
+    AND last_updated > :maxage
+ORDER BY last_updated;
+"""
 YOUTUBE_QUERY_ALL: Final[
     str
 ] = """
-SELECT youtube_url, last_updated
+SELECT rowid, youtube_url, last_updated
 FROM youtube
+WHERE rowid > :last_rowid
+ORDER BY rowid
+LIMIT :limit
+;
 """
 YOUTUBE_DELETE_OLD_ENTRIES: Final[
     str
@@ -362,6 +467,44 @@ WHERE
     last_updated < :maxage
     ;
 """
+YOUTUBE_DELETE_OLD_ENTRIES_BATCH: Final[
+    str
+] = """
+DELETE FROM youtube
+WHERE rowid IN (
+    SELECT rowid
+    FROM youtube
+    WHERE last_updated < :maxage
+    LIMIT :limit
+);
+"""
+YOUTUBE_DELETE_LEAST_RECENT: Final[
+    str
+] = """
+DELETE FROM youtube
+WHERE rowid IN (
+    SELECT rowid
+    FROM youtube
+    ORDER BY last_fetched
+    LIMIT :limit
+);
+"""
+YOUTUBE_QUERY_SIZE: Final[
+    str
+] = """
+SELECT
+    count(*),
+    coalesce(sum(
+        length(track_info) + length(youtube_url)
+    ), 0)
+FROM youtube;
+"""
+YOUTUBE_CREATE_INDEX_LAST_FETCHED: Final[
+    str
+] = """
+CREATE INDEX IF NOT EXISTS idx_youtube_last_fetched
+ON youtube (last_fetched);
+"""
 YOUTUBE_QUERY_LAST_FETCHED_RANDOM: Final[
     str
 ] = """
@@ -373,6 +516,27 @@ WHERE
 LIMIT 100
 ;
 """
+YOUTUBE_ADD_COLUMN_ISRC: Final[
+    str
+] = """
+ALTER TABLE youtube ADD COLUMN isrc TEXT;
+"""
+YOUTUBE_CREATE_INDEX_ISRC: Final[
+    str
+] = """
+CREATE INDEX IF NOT EXISTS idx_youtube_isrc
+ON youtube (isrc, last_updated);
+"""
+YOUTUBE_QUERY_MANY_ISRC: Final[
+    str
+] = """
+SELECT isrc, youtube_url, last_updated
+FROM youtube
+WHERE
+    isrc IN (SELECT value FROM json_each(:keys))
+    AND last_updated > :maxage
+ORDER BY last_updated;
+"""
 
 # Spotify table statements
 SPOTIFY_DROP_TABLE: Final[
@@ -401,18 +565,30 @@ SPOTIFY_CREATE_INDEX: Final[
 CREATE UNIQUE INDEX IF NOT EXISTS idx_spotify_uri
 ON spotify (id, type, uri);
 """
+SPOTIFY_CREATE_INDEX_URI: Final[
+    str
+] = """
+CREATE INDEX IF NOT EXISTS idx_spotify_uri_last_updated
+ON spotify (uri, last_updated);
+"""
+SPOTIFY_CREATE_INDEX_LAST_UPDATED: Final[
+    str
+] = """
+CREATE INDEX IF NOT EXISTS idx_spotify_last_updated
+ON spotify (last_updated);
+"""
 SPOTIFY_UPSERT: Final[
     str
 ] = """INSERT INTO
 spotify
   (
     id, type, uri, track_name, artist_name,
-    song_url, track_info, last_updated, last_fetched
+    song_url, track_info, isrc, last_updated, last_fetched
   )
 VALUES
   (
     :id, :type, :uri, :track_name, :artist_name,
-    :song_url, :track_info, :last_updated, :last_fetched
+    :song_url, :track_info, :isrc, :last_updated, :last_fetched
   )
 ON CONFLICT
   (
@@ -426,6 +602,7 @@ DO UPDATE
     artist_name = excluded.artist_name,
     song_url = excluded.song_url,
     track_info = excluded.track_info,
+    isrc = coalesce(excluded.isrc, isrc),
     last_updated = excluded.last_updated;
 """
 SPOTIFY_UPDATE: Final[
@@ -445,11 +622,25 @@ WHERE
     AND last_updated > :maxage
 LIMIT 1;
 """
+SPOTIFY_QUERY_MANY: Final[
+    str
+] = """
+SELECT uri, track_info, last_updated
+FROM spotify
+WHERE
+    uri IN (SELECT value FROM json_each(:keys))
+    AND last_updated > :maxage
+ORDER BY last_updated;
+"""
 SPOTIFY_QUERY_ALL: Final[
     str
 ] = """
-SELECT track_info, last_updated
+SELECT rowid, track_info, last_updated
 FROM spotify
+WHERE rowid > :last_rowid
+ORDER BY rowid
+LIMIT :limit
+;
 """
 SPOTIFY_DELETE_OLD_ENTRIES: Final[
     str
@@ -459,6 +650,45 @@ WHERE
     last_updated < :maxage
     ;
 """
+SPOTIFY_DELETE_OLD_ENTRIES_BATCH: Final[
+    str
+] = """
+DELETE FROM spotify
+WHERE rowid IN (
+    SELECT rowid
+    FROM spotify
+    WHERE last_updated < :maxage
+    LIMIT :limit
+);
+"""
+SPOTIFY_DELETE_LEAST_RECENT: Final[
+    str
+] = """
+DELETE FROM spotify
+WHERE rowid IN (
+    SELECT rowid
+    FROM spotify
+    ORDER BY last_fetched
+    LIMIT :limit
+);
+"""
+SPOTIFY_QUERY_SIZE: Final[
+    str
+] = """
+SELECT
+    count(*),
+    coalesce(sum(
+        length(id) + length(type) + length(uri) + length(track_name)
+        + length(artist_name) + length(song_url) + length(track_info)
+    ), 0)
+FROM spotify;
+"""
+SPOTIFY_CREATE_INDEX_LAST_FETCHED: Final[
+    str
+] = """
+CREATE INDEX IF NOT EXISTS idx_spotify_last_fetched
+ON spotify (last_fetched);
+"""
 SPOTIFY_QUERY_LAST_FETCHED_RANDOM: Final[
     str
 ] = """
@@ -470,6 +700,115 @@ WHERE
 LIMIT 100
 ;
 """
+SPOTIFY_ADD_COLUMN_ISRC: Final[
+    str
+] = """
+ALTER TABLE spotify ADD COLUMN isrc TEXT;
+"""
+SPOTIFY_CREATE_INDEX_ISRC: Final[
+    str
+] = """
+CREATE INDEX IF NOT EXISTS idx_spotify_isrc
+ON spotify (isrc);
+"""
+
+# Spotify collections table statements
+SPOTIFY_COLLECTIONS_CREATE_TABLE: Final[
+    str
+] = """
+CREATE TABLE IF NOT EXISTS spotify_collections(
+    uri TEXT PRIMARY KEY,
+    snapshot_id TEXT,
+    total INTEGER,
+    tracks BLOB,
+    last_updated INTEGER,
+    last_fetched INTEGER
+);
+"""
+SPOTIFY_COLLECTIONS_CREATE_INDEX_LAST_UPDATED: Final[
+    str
+] = """
+CREATE INDEX IF NOT EXISTS idx_spotify_collections_last_updated
+ON spotify_collections (last_updated);
+"""
+SPOTIFY_COLLECTIONS_CREATE_INDEX_LAST_FETCHED: Final[
+    str
+] = """
+CREATE INDEX IF NOT EXISTS idx_spotify_collections_last_fetched
+ON spotify_collections (last_fetched);
+"""
+SPOTIFY_COLLECTIONS_UPSERT: Final[
+    str
+] = """INSERT INTO
+spotify_collections
+  (
+    uri, snapshot_id, total, tracks, last_updated, last_fetched
+  )
+VALUES
+  (
+    :uri, :snapshot_id, :total, :tracks, :last_updated, :last_fetched
+  )
+ON CONFLICT
+  (
+    uri
+  )
+DO UPDATE
+  SET
+    snapshot_id = excluded.snapshot_id,
+    total = excluded.total,
+    tracks = excluded.tracks,
+    last_updated = excluded.last_updated,
+    last_fetched = excluded.last_fetched;
+"""
+SPOTIFY_COLLECTIONS_UPDATE: Final[
+    str
+] = """
+UPDATE spotify_collections
+SET last_fetched=:last_fetched
+WHERE uri=:uri;
+"""
+SPOTIFY_COLLECTIONS_QUERY: Final[
+    str
+] = """
+SELECT snapshot_id, total, tracks, last_updated
+FROM spotify_collections
+WHERE
+    uri=:uri
+    AND last_updated > :maxage
+LIMIT 1;
+"""
+SPOTIFY_COLLECTIONS_DELETE_OLD_ENTRIES_BATCH: Final[
+    str
+] = """
+DELETE FROM spotify_collections
+WHERE rowid IN (
+    SELECT rowid
+    FROM spotify_collections
+    WHERE last_updated < :maxage
+    LIMIT :limit
+);
+"""
+SPOTIFY_COLLECTIONS_DELETE_LEAST_RECENT: Final[
+    str
+] = """
+DELETE FROM spotify_collections
+WHERE rowid IN (
+    SELECT rowid
+    FROM spotify_collections
+    ORDER BY last_fetched
+    LIMIT :limit
+);
+"""
+SPOTIFY_COLLECTIONS_QUERY_SIZE: Final[
+    str
+] = """
+SELECT
+    count(*),
+    coalesce(sum(
+        length(uri) + coalesce(length(snapshot_id), 0) + length(tracks)
+    ), 0)
+FROM spotify_collections;
+"""
 
 # Lavalink table statements
 LAVALINK_DROP_TABLE: Final[
@@ -494,6 +833,12 @@ LAVALINK_CREATE_INDEX: Final[
 CREATE UNIQUE INDEX IF NOT EXISTS idx_lavalink_query
 ON lavalink (query);
 """
+LAVALINK_CREATE_INDEX_LAST_UPDATED: Final[
+    str
+] = """
+CREATE INDEX IF NOT EXISTS idx_lavalink_last_updated
+ON lavalink (last_updated);
+"""
 LAVALINK_UPSERT: Final[
     str
 ] = """INSERT INTO
@@ -537,11 +882,25 @@ WHERE
     AND last_updated > :maxage
 LIMIT 1;
 """
+LAVALINK_QUERY_MANY: Final[
+    str
+] = """
+SELECT query, data, last_updated
+FROM lavalink
+WHERE
+    query IN (SELECT value FROM json_each(:keys))
+    AND last_updated > :maxage
+ORDER BY last_updated;
+"""
 LAVALINK_QUERY_ALL: Final[
     str
 ] = """
-SELECT data, last_updated
+SELECT rowid, data, last_updated
 FROM lavalink
+WHERE rowid > :last_rowid
+ORDER BY rowid
+LIMIT :limit
+;
 """
 LAVALINK_QUERY_LAST_FETCHED_RANDOM: Final[
     str
@@ -562,11 +921,259 @@ WHERE
     last_updated < :maxage
     ;
 """
+LAVALINK_DELETE_OLD_ENTRIES_BATCH: Final[
+    str
+] = """
+DELETE FROM lavalink
+WHERE rowid IN (
+    SELECT rowid
+    FROM lavalink
+    WHERE last_updated < :maxage
+    LIMIT :limit
+);
+"""
+LAVALINK_DELETE_LEAST_RECENT: Final[
+    str
+] = """
+DELETE FROM lavalink
+WHERE rowid IN (
+    SELECT rowid
+    FROM lavalink
+    ORDER BY last_fetched
+    LIMIT :limit
+);
+"""
+LAVALINK_QUERY_SIZE: Final[
+    str
+] = """
+SELECT
+    count(*),
+    coalesce(sum(
+        length(query) + length(data)
+    ), 0)
+FROM lavalink;
+"""
 LAVALINK_FETCH_ALL_ENTRIES_GLOBAL: Final[
     str
 ] = """
-SELECT query, data
+SELECT rowid, query, data
+FROM lavalink
+WHERE rowid > :last_rowid
+ORDER BY rowid
+LIMIT :limit
+;
+"""
+LAVALINK_FETCH_UNSPLIT_PAYLOADS: Final[
+    str
+] = """
+SELECT rowid, data, last_updated
+FROM lavalink
+WHERE
+    rowid > :last_rowid
+    AND (typeof(data) = 'text' OR substr(data, 1, 4) != :header)
+ORDER BY rowid
+LIMIT :limit
+;
+"""
+LAVALINK_UPDATE_PAYLOAD: Final[
+    str
+] = """
+UPDATE lavalink
+SET data=:data
+WHERE rowid=:rowid;
+"""
+LAVALINK_CREATE_INDEX_LAST_FETCHED: Final[
+    str
+] = """
+CREATE INDEX IF NOT EXISTS idx_lavalink_last_fetched
+ON lavalink (last_fetched);
+"""
+
+# Autoplay pool statements
+# Every recently played Lavalink query holds one slot, slots are kept dense (1..n)
+# so a uniform random sample is a single primary key lookup.
+AUTOPLAY_POOL_CREATE_TABLE: Final[
+    str
+] = """
+CREATE TABLE IF NOT EXISTS autoplay_pool(
+    slot INTEGER PRIMARY KEY,
+    query TEXT UNIQUE
+);
+"""
+AUTOPLAY_POOL_INSERT: Final[
+    str
+] = """
+INSERT OR IGNORE INTO autoplay_pool (query)
+VALUES (:query);
+"""
+AUTOPLAY_POOL_MAX_SLOT: Final[
+    str
+] = """
+SELECT max(slot)
+FROM autoplay_pool;
+"""
+AUTOPLAY_POOL_QUERY_SLOT: Final[
+    str
+] = """
+SELECT pool.query, lavalink.data, lavalink.last_updated, lavalink.last_fetched
+FROM autoplay_pool AS pool
+LEFT JOIN lavalink ON lavalink.query = pool.query
+WHERE pool.slot = :slot
+LIMIT 1;
+"""
+AUTOPLAY_POOL_FETCH_SLOT: Final[
+    str
+] = """
+SELECT slot
+FROM autoplay_pool
+WHERE query = :query;
+"""
+AUTOPLAY_POOL_DELETE_SLOT: Final[
+    str
+] = """
+DELETE FROM autoplay_pool
+WHERE slot = :slot;
+"""
+AUTOPLAY_POOL_MOVE_SLOT: Final[
+    str
+] = """
+UPDATE autoplay_pool
+SET slot = :slot
+WHERE slot = :last_slot;
+"""
+AUTOPLAY_POOL_DELETE_ALL: Final[
+    str
+] = """
+DELETE FROM autoplay_pool;
+"""
+AUTOPLAY_POOL_REBUILD: Final[
+    str
+] = """
+INSERT OR IGNORE INTO autoplay_pool (query)
+SELECT query
 FROM lavalink
+WHERE
+    last_fetched > :day
+    AND last_updated > :maxage
+ORDER BY last_fetched;
+"""
+
+# Track table statements
+TRACKS_CREATE_TABLE: Final[
+    str
+] = """
+CREATE TABLE IF NOT EXISTS tracks(
+    key TEXT PRIMARY KEY,
+    data BLOB,
+    last_updated INTEGER
+);
+"""
+TRACKS_CREATE_INDEX_LAST_UPDATED: Final[
+    str
+] = """
+CREATE INDEX IF NOT EXISTS idx_tracks_last_updated
+ON tracks (last_updated);
+"""
+TRACKS_ADD_COLUMN_LAST_FETCHED: Final[
+    str
+] = """
+ALTER TABLE tracks ADD COLUMN last_fetched INTEGER;
+"""
+TRACKS_SET_LAST_FETCHED: Final[
+    str
+] = """
+UPDATE tracks
+SET last_fetched = last_updated
+WHERE last_fetched IS NULL;
+"""
+TRACKS_CREATE_INDEX_LAST_FETCHED: Final[
+    str
+] = """
+CREATE INDEX IF NOT EXISTS idx_tracks_last_fetched
+ON tracks (last_fetched);
+"""
+TRACKS_UPSERT: Final[
+    str
+] = """INSERT INTO
+tracks
+  (
+    key,
+    data,
+    last_updated,
+    last_fetched
+  )
+VALUES
+  (
+   :key,
+   :data,
+   :last_updated,
+   :last_fetched
+  )
+ON CONFLICT
+  (
+    key
+  )
+DO UPDATE
+  SET
+    data = excluded.data,
+    last_updated = max(last_updated, excluded.last_updated),
+    last_fetched = max(coalesce(last_fetched, 0), excluded.last_fetched);
+"""
+TRACKS_UPDATE_LAST_FETCHED: Final[
+    str
+] = """
+UPDATE tracks
+SET last_fetched = :last_fetched
+WHERE
+    key IN (SELECT value FROM json_each(:keys))
+    AND coalesce(last_fetched, 0) < :last_fetched;
+"""
+TRACKS_QUERY_MANY: Final[
+    str
+] = """
+SELECT key, data
+FROM tracks
+WHERE key IN (SELECT value FROM json_each(:keys));
+"""
+TRACKS_DELETE_OLD_ENTRIES: Final[
+    str
+] = """
+DELETE FROM tracks
+WHERE
+    last_updated < :maxage
+    ;
+"""
+TRACKS_DELETE_OLD_ENTRIES_BATCH: Final[
+    str
+] = """
+DELETE FROM tracks
+WHERE rowid IN (
+    SELECT rowid
+    FROM tracks
+    WHERE last_updated < :maxage
+    LIMIT :limit
+);
+"""
+TRACKS_DELETE_LEAST_RECENT: Final[
+    str
+] = """
+DELETE FROM tracks
+WHERE rowid IN (
+    SELECT rowid
+    FROM tracks
+    ORDER BY last_fetched
+    LIMIT :limit
+);
+"""
+TRACKS_QUERY_SIZE: Final[
+    str
+] = """
+SELECT
+    count(*),
+    coalesce(sum(
+        length(key) + length(data)
+    ), 0)
+FROM tracks;
 """
 
 # Persisting Queue statements
@@ -648,3 +1255,71 @@ UPDATE
     SET
         time = excluded.time
 """
+
+# Global API spool statements
+# Contributions waiting to be uploaded to the Global Audio API, one row per query
+GLOBAL_SPOOL_CREATE_TABLE: Final[
+    str
+] = """
+CREATE TABLE IF NOT EXISTS global_spool(
+    query TEXT PRIMARY KEY,
+    data BLOB NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt INTEGER NOT NULL,
+    created_at INTEGER NOT NULL
+);
+"""
+GLOBAL_SPOOL_CREATE_INDEX: Final[
+    str
+] = """
+CREATE INDEX IF NOT EXISTS idx_global_spool_next_attempt
+ON global_spool (next_attempt);
+"""
+GLOBAL_SPOOL_UPSERT: Final[
+    str
+] = """
+INSERT INTO
+    global_spool (query, data, attempts, next_attempt, created_at)
+VALUES
+    (
+        :query, :data, 0, :created_at, :created_at
+    )
+ON CONFLICT (query) DO
+UPDATE
+    SET
+        data = excluded.data
+"""
+GLOBAL_SPOOL_FETCH_DUE: Final[
+    str
+] = """
+SELECT query, data, attempts
+FROM global_spool
+WHERE next_attempt <= :now
+ORDER BY next_attempt
+LIMIT :limit
+;
+"""
+GLOBAL_SPOOL_DELETE: Final[
+    str
+] = """
+DELETE FROM global_spool
+WHERE query = :query
+;
+"""
+GLOBAL_SPOOL_RESCHEDULE: Final[
+    str
+] = """
+UPDATE global_spool
+SET
+    attempts = :attempts,
+    next_attempt = :next_attempt
+WHERE query = :query
+;
+"""
+GLOBAL_SPOOL_COUNT: Final[
+    str
+] = """
+SELECT count(*)
+FROM global_spool
+;
+"""
@@ -0,0 +1,62 @@
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+from types import SimpleNamespace
+import tempfile
+
+# Dependency Imports
+from redbot.core import data_manager
+from redbot.core.utils.dbtools import APSWConnectionWrapper
+import pytest
+
+# `audio/__init__.py` looks up the Downloader lib folder on import, which needs a data path.
+data_manager.basic_config = data_manager.basic_config_default
+data_manager.basic_config["DATA_PATH"] = tempfile.mkdtemp()
+
+# My Modded Imports
+from audio.apis.db_executor import DatabaseExecutor  # noqa: E402
+from audio.apis.local_db import LocalCacheWrapper  # noqa: E402
+
+
+class GlobalSetting:
+    """Stands in for a global value of the cog's `SettingCacheManager`."""
+
+    def __init__(self, value):
+        self.value = value
+
+    async def get_global(self):
+        return self.value
+
+    async def set_global(self, value):
+        self.value = value
+
+
+@pytest.fixture()
+def settings():
+    return SimpleNamespace(
+        local_cache_age=GlobalSetting(365),
+        local_cache_max_rows=GlobalSetting(0),
+        local_cache_max_size=GlobalSetting(0),
+    )
+
+
+@pytest.fixture()
+def database(tmp_path):
+    conn = APSWConnectionWrapper(str(tmp_path / "Audio.db"))
+    yield conn
+    conn.close()
+
+
+@pytest.fixture()
+def executor(database):
+    executor = DatabaseExecutor(database)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.fixture()
+async def local_cache(database, executor, settings):
+    local_cache = LocalCacheWrapper(None, None, database, None, settings, executor)
+    await local_cache.lavalink.init()
+    return local_cache
@@ -0,0 +1,90 @@
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+import time
+
+# Dependency Imports
+import pytest
+
+# My Modded Imports
+from audio.apis.circuit_breaker import CircuitBreaker
+
+
+@pytest.fixture()
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    return now
+
+
+def make_breaker() -> CircuitBreaker:
+    return CircuitBreaker("Test", min_calls=4, latency_budget=1.0, cooldown=30, max_cooldown=100)
+
+
+def test_stays_closed_below_min_calls(clock):
+    breaker = make_breaker()
+    for __ in range(3):
+        assert breaker.allow()
+        breaker.record(False, 0.1)
+    assert breaker.state == breaker.CLOSED
+
+
+def test_opens_on_error_rate(clock):
+    breaker = make_breaker()
+    for success in (True, False, True, False):
+        breaker.allow()
+        breaker.record(success, 0.1)
+    assert breaker.state == breaker.OPEN
+    assert not breaker.allow()
+    assert not breaker.available
+    assert breaker.refused == 1
+
+
+def test_opens_on_p95_latency(clock):
+    breaker = make_breaker()
+    for latency in (0.1, 0.1, 0.1, 2.0):
+        breaker.allow()
+        breaker.record(True, latency)
+    assert breaker.state == breaker.OPEN
+
+
+def test_half_open_probe_closes_the_circuit(clock):
+    breaker = make_breaker()
+    for __ in range(4):
+        breaker.record(False, 0.1)
+    clock[0] += 30
+    assert breaker.available
+    assert breaker.allow()
+    assert breaker.state == breaker.HALF_OPEN
+    # Only one probe at a time
+    assert not breaker.allow()
+    breaker.record(True, 0.1)
+    assert breaker.state == breaker.CLOSED
+    assert breaker.cooldown == 30
+    assert breaker.error_rate == 0.0
+
+
+def test_failed_probe_doubles_the_cooldown_up_to_the_cap(clock):
+    breaker = make_breaker()
+    for __ in range(4):
+        breaker.record(False, 0.1)
+    for expected in (60, 100, 100):
+        clock[0] += breaker.cooldown
+        assert breaker.allow()
+        breaker.record(False, 0.1)
+        assert breaker.state == breaker.OPEN
+        assert breaker.cooldown == expected
+    clock[0] += 99
+    assert not breaker.allow()
+    assert breaker.times_opened == 4
+
+
+def test_slow_probe_reopens_the_circuit(clock):
+    breaker = make_breaker()
+    for __ in range(4):
+        breaker.record(False, 0.1)
+    clock[0] += 30
+    assert breaker.allow()
+    breaker.record(True, 5.0)
+    assert breaker.state == breaker.OPEN
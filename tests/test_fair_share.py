@@ -0,0 +1,113 @@
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+import asyncio
+
+# Dependency Imports
+import pytest
+
+# My Modded Imports
+from audio.apis.fair_share import FairShareLimiter
+
+
+async def run_queued(limiter: FairShareLimiter, calls) -> list:
+    """Queue `calls`, (key, bulk, label), behind a held slot and return the order they ran in."""
+    order = []
+    release = asyncio.Event()
+
+    async def hold():
+        async with limiter.slot("holder"):
+            await release.wait()
+
+    async def call(key, bulk, label):
+        async with limiter.slot(key, bulk=bulk):
+            order.append(label)
+            await asyncio.sleep(0)
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    tasks = []
+    for key, bulk, label in calls:
+        tasks.append(asyncio.create_task(call(key, bulk, label)))
+        await asyncio.sleep(0)
+    assert limiter.queued == len(calls)
+    release.set()
+    await asyncio.gather(holder, *tasks)
+    return order
+
+
+async def test_interactive_calls_go_before_bulk_ones():
+    limiter = FairShareLimiter(1)
+    order = await run_queued(
+        limiter,
+        [(1, True, "bulk1"), (1, True, "bulk2"), (2, False, "play"), (3, False, "search")],
+    )
+    assert order == ["play", "search", "bulk1", "bulk2"]
+
+
+async def test_guilds_take_turns():
+    limiter = FairShareLimiter(1)
+    order = await run_queued(
+        limiter,
+        [(1, True, "a1"), (1, True, "a2"), (1, True, "a3"), (1, True, "a4"), (2, True, "b1")],
+    )
+    # The second guild only waits for one call of the first guild's backlog
+    assert order == ["a1", "b1", "a2", "a3", "a4"]
+
+
+async def test_weights_give_a_guild_a_bigger_share():
+    limiter = FairShareLimiter(1)
+    limiter.weights[1] = 2.0
+    order = await run_queued(
+        limiter,
+        [(1, True, "a1"), (1, True, "a2"), (1, True, "a3"), (1, True, "a4")]
+        + [(2, True, "b1"), (2, True, "b2")],
+    )
+    assert order == ["a1", "a2", "b1", "a3", "a4", "b2"]
+
+
+async def test_concurrency_is_capped():
+    limiter = FairShareLimiter(2)
+    running = peak = 0
+
+    async def call():
+        nonlocal running, peak
+        async with limiter.slot(1):
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*(call() for __ in range(6)))
+    assert peak == 2
+    assert limiter.stats(1)["count"] == 6
+    assert limiter.stats()["running"] == 0
+
+
+async def test_cancelled_waiters_give_up_their_turn():
+    limiter = FairShareLimiter(1)
+    release = asyncio.Event()
+
+    async def hold():
+        async with limiter.slot(1):
+            await release.wait()
+
+    async def call():
+        async with limiter.slot(2):
+            return "ran"
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    cancelled = asyncio.create_task(call())
+    waiting = asyncio.create_task(call())
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+    assert limiter.queued == 1
+    release.set()
+
+    assert await waiting == "ran"
+    await holder
+    assert limiter.stats()["running"] == 0
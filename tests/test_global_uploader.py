@@ -0,0 +1,142 @@
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+from types import SimpleNamespace
+import time
+
+# Dependency Imports
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+import pytest
+
+# My Modded Imports
+from audio.apis import global_db
+from audio.apis.global_db import GlobalCacheWrapper
+from audio.apis.global_uploader import GlobalContributionUploader
+from audio.apis.http_client import HTTPClient
+from audio.apis.payload_codec import encode_payload
+from audio.sql_statements import GLOBAL_SPOOL_UPSERT
+
+
+class GlobalAPIStandIn:
+    """Answers Global API submissions with the status code set for their query."""
+
+    def __init__(self):
+        self.statuses = {}
+        self.received = []
+        self.app = web.Application()
+        self.app.router.add_post("/api/v2/queries", self.submit)
+
+    async def submit(self, request: web.Request) -> web.Response:
+        assert request.headers["Authorization"] == "api key"
+        query = request.query["query"]
+        self.received.append((query, await request.json()))
+        return web.Response(status=self.statuses.get(query, 200))
+
+
+@pytest.fixture()
+async def api(monkeypatch):
+    stand_in = GlobalAPIStandIn()
+    server = TestServer(stand_in.app)
+    await server.start_server()
+    monkeypatch.setattr(global_db, "_API_URL", str(server.make_url("/")))
+    yield stand_in
+    await server.close()
+
+
+@pytest.fixture()
+async def global_api():
+    async def get_shared_api_tokens(service):
+        return {"api_key": "api key"}
+
+    bot = SimpleNamespace(get_shared_api_tokens=get_shared_api_tokens, owner_ids={1})
+    cog = SimpleNamespace(global_api_user={"can_post": True})
+    http = HTTPClient()
+    yield GlobalCacheWrapper(bot, None, http, cog, None)
+    await http.close()
+
+
+async def spool(executor, *queries: str) -> None:
+    now = int(time.time())
+    await executor.executemany(
+        GLOBAL_SPOOL_UPSERT,
+        [
+            {"query": query, "data": encode_payload(load_result(query)), "created_at": now}
+            for query in queries
+        ],
+    )
+
+
+def load_result(query: str) -> dict:
+    return {
+        "loadType": "TRACK_LOADED",
+        "playlistInfo": {},
+        "tracks": [{"track": "QAAA", "info": {"identifier": query, "sourceName": "youtube"}}],
+    }
+
+
+async def test_failed_uploads_back_off_and_rejected_ones_are_dropped(api, global_api, executor):
+    uploader = GlobalContributionUploader(global_api, executor)
+    await uploader.init()
+    await spool(executor, "ok", "rate-limited", "unavailable", "rejected")
+    api.statuses.update({"rate-limited": 429, "unavailable": 503, "rejected": 400})
+
+    await uploader.drain()
+
+    assert sorted(query for query, __ in api.received) == [
+        "ok",
+        "rate-limited",
+        "rejected",
+        "unavailable",
+    ]
+    assert dict(api.received)["ok"] == load_result("ok")
+    assert (uploader.uploaded, uploader.dropped, uploader.retried) == (1, 1, 2)
+    rows = await executor.fetchall(
+        "SELECT query, attempts, next_attempt FROM global_spool ORDER BY query"
+    )
+    assert [(query, attempts) for query, attempts, __ in rows] == [
+        ("rate-limited", 1),
+        ("unavailable", 1),
+    ]
+    assert all(next_attempt >= time.time() + 60 for __, __, next_attempt in rows)
+
+    # Nothing is due yet
+    await uploader.drain()
+    assert len(api.received) == 4
+    await uploader.close()
+
+
+async def test_spool_survives_a_restart(api, global_api, executor):
+    uploader = GlobalContributionUploader(global_api, executor)
+    await uploader.init()
+    await spool(executor, "a", "b")
+    api.statuses["b"] = 500
+    await uploader.drain()
+    await uploader.close()
+
+    restarted = GlobalContributionUploader(global_api, executor)
+    await restarted.init()
+    assert await restarted.pending() == 1
+    await executor.execute("UPDATE global_spool SET next_attempt = 0")
+    api.statuses.clear()
+
+    await restarted.drain()
+
+    assert [query for query, __ in api.received] == ["a", "b", "b"]
+    assert await restarted.pending() == 0
+    await restarted.close()
+
+
+async def test_nothing_is_uploaded_while_the_circuit_is_open(api, global_api, executor):
+    uploader = GlobalContributionUploader(global_api, executor)
+    await uploader.init()
+    await spool(executor, "a")
+    for __ in range(global_api.breaker.min_calls):
+        global_api.breaker.record(False, 0.0)
+
+    await uploader.drain()
+
+    assert api.received == []
+    assert await uploader.pending() == 1
+    await uploader.close()
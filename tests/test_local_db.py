@@ -0,0 +1,242 @@
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+from collections import Counter
+import base64
+import json
+import time
+
+# My Modded Imports
+from audio.apis.cache_maintenance import LocalCacheMaintenance
+from audio.apis.payload_codec import encode_listing
+from audio.sql_statements import SPOTIFY_COLLECTIONS_QUERY_SIZE
+
+DAY = 86400
+
+
+def make_result(identifier: str, size: int = 0) -> dict:
+    return {
+        "loadType": "TRACK_LOADED",
+        "playlistInfo": {},
+        "tracks": [
+            {
+                "track": base64.b64encode(identifier.encode() + bytes(size)).decode("ascii"),
+                "info": {"identifier": identifier, "sourceName": "youtube", "title": identifier},
+            }
+        ],
+    }
+
+
+def lavalink_row(query: str, last_updated: int, last_fetched: int, size: int = 0) -> dict:
+    return {
+        "query": query,
+        "data": json.dumps(make_result(query, size)),
+        "last_updated": last_updated,
+        "last_fetched": last_fetched,
+    }
+
+
+async def test_autoplay_only_picks_recently_played_entries(local_cache):
+    now = int(time.time())
+    await local_cache.lavalink.insert(
+        [lavalink_row("recent{}".format(i), now, now - DAY) for i in range(4)]
+        + [lavalink_row("stale{}".format(i), now, now - 30 * DAY) for i in range(4)]
+    )
+    # Every write adds to the pool, the rebuild only keeps what was played in the last week
+    await local_cache.lavalink.rebuild_autoplay_pool()
+    (pool_size,) = await local_cache.executor.fetchone("SELECT count(*) FROM autoplay_pool")
+    assert pool_size == 4
+
+    window = {"day": now - 7 * DAY, "maxage": now - 365 * DAY}
+    picked = Counter()
+    for __ in range(200):
+        result = await local_cache.lavalink.fetch_random(window)
+        picked[result["tracks"][0]["info"]["identifier"]] += 1
+    assert set(picked) == {"recent0", "recent1", "recent2", "recent3"}
+
+
+async def test_autoplay_evicts_entries_that_left_the_window(local_cache):
+    now = int(time.time())
+    await local_cache.lavalink.insert([lavalink_row("a", now, now), lavalink_row("b", now, now)])
+    await local_cache.lavalink.rebuild_autoplay_pool()
+    await local_cache.executor.execute(
+        "UPDATE lavalink SET last_fetched = :day WHERE query = 'a'", {"day": now - 30 * DAY}
+    )
+
+    window = {"day": now - 7 * DAY, "maxage": now - 365 * DAY}
+    for __ in range(20):
+        result = await local_cache.lavalink.fetch_random(window)
+        assert result["tracks"][0]["info"]["identifier"] == "b"
+    rows = await local_cache.executor.fetchall("SELECT slot, query FROM autoplay_pool")
+    assert rows == [(1, "b")]
+
+
+async def test_maintenance_rebuilds_the_autoplay_pool(local_cache, settings):
+    now = int(time.time())
+    await local_cache.lavalink.insert(
+        [lavalink_row("recent", now, now), lavalink_row("stale", now, now - 30 * DAY)]
+    )
+    (pool_size,) = await local_cache.executor.fetchone("SELECT count(*) FROM autoplay_pool")
+    assert pool_size == 2
+
+    await LocalCacheMaintenance(local_cache, settings).run_once()
+
+    rows = await local_cache.executor.fetchall("SELECT query FROM autoplay_pool")
+    assert rows == [("recent",)]
+
+
+async def test_maintenance_removes_expired_then_least_recently_used(local_cache, settings):
+    now = int(time.time())
+    settings.local_cache_age.value = 30
+    settings.local_cache_max_rows.value = 5
+    await local_cache.lavalink.insert(
+        [lavalink_row("old{}".format(i), now - 40 * DAY, now) for i in range(3)]
+        + [lavalink_row("q{}".format(i), now, now - 100 + i) for i in range(10)]
+    )
+
+    reports = await LocalCacheMaintenance(local_cache, settings).run_once()
+
+    lavalink = next(report for report in reports if report.table == "lavalink")
+    assert (lavalink.expired, lavalink.evicted, lavalink.rows) == (3, 5, 5)
+    rows = await local_cache.executor.fetchall("SELECT query FROM lavalink ORDER BY query")
+    assert rows == [("q5",), ("q6",), ("q7",), ("q8",), ("q9",)]
+
+
+async def test_tracks_of_entries_in_use_are_evicted_last(local_cache, settings):
+    now = int(time.time())
+    settings.local_cache_max_size.value = 1
+    # 40 entries of 50 KB each, cached oldest first
+    await local_cache.lavalink.insert(
+        [lavalink_row("q{}".format(i), now, now - 1000 + i, size=50_000) for i in range(40)]
+    )
+    # The 5 oldest entries are played again
+    await local_cache.lavalink.write_batch(
+        [], [{"query": "q{}".format(i), "last_fetched": now} for i in range(5)]
+    )
+
+    reports = await LocalCacheMaintenance(local_cache, settings).run_once()
+
+    tracks = next(report for report in reports if report.table == "tracks")
+    assert tracks.evicted and tracks.size <= 1024 * 1024
+    local_cache.lavalink.front_cache.clear()
+    played = await local_cache.lavalink.fetch_many(["q{}".format(i) for i in range(5)])
+    assert len(played) == 5
+
+
+def youtube_row(index: int, last_updated: int) -> dict:
+    return {
+        "track_info": "artist - track {}".format(index),
+        "track_url": "https://youtu.be/{}".format(index),
+        "isrc": None,
+        "last_updated": last_updated,
+        "last_fetched": last_updated,
+    }
+
+
+async def test_fetch_many_spans_several_chunks(local_cache):
+    now = int(time.time())
+    await local_cache.youtube.insert([youtube_row(i, now) for i in range(1200)])
+    await local_cache.youtube.insert([youtube_row(i, now - 400 * DAY) for i in range(1200, 1210)])
+    keys = ["artist - track {}".format(i) for i in range(0, 1210, 2)] + ["missing"]
+
+    found = await local_cache.youtube.fetch_many(keys)
+
+    assert found == {
+        "artist - track {}".format(i): "https://youtu.be/{}".format(i) for i in range(0, 1200, 2)
+    }
+    # Misses are remembered, hits are served from memory the next time
+    assert local_cache.youtube.front_cache.get("missing", count=False) is None
+    reads = local_cache.executor.stats()["read"]["submitted"]
+    assert await local_cache.youtube.fetch_many(keys) == found
+    assert local_cache.executor.stats()["read"]["submitted"] == reads
+
+
+async def test_lavalink_fetch_many_returns_copies(local_cache):
+    now = int(time.time())
+    await local_cache.lavalink.insert([lavalink_row("a", now, now), lavalink_row("b", now, now)])
+    first = await local_cache.lavalink.fetch_many(["a", "b", "c"])
+    assert set(first) == {"a", "b"}
+    first["a"]["tracks"].clear()
+    second = await local_cache.lavalink.fetch_many(["a"])
+    assert second["a"] == make_result("a")
+
+
+async def test_fetch_all_pages_through_every_row(local_cache):
+    now = int(time.time())
+    await local_cache.youtube.insert([youtube_row(i, now) for i in range(50)])
+
+    reads = local_cache.executor.stats()["read"]["submitted"]
+    urls = [result.query async for result in local_cache.youtube.fetch_all(page_size=7)]
+
+    assert sorted(urls) == sorted("https://youtu.be/{}".format(i) for i in range(50))
+    # 8 pages with rows, and the empty one that ends the iteration
+    assert local_cache.executor.stats()["read"]["submitted"] - reads == 9
+
+
+async def test_fetch_all_for_global_decodes_on_access(local_cache):
+    now = int(time.time())
+    await local_cache.lavalink.insert([lavalink_row("q{}".format(i), now, now) for i in range(5)])
+
+    results = [result async for result in local_cache.lavalink.fetch_all_for_global(page_size=2)]
+
+    assert sorted(result.query for result in results) == ["q0", "q1", "q2", "q3", "q4"]
+    for result in results:
+        assert result.data == make_result(result.query)
+        assert json.loads(result.data_string) == make_result(result.query)
+
+
+async def test_collection_listings_are_stored_and_sized(local_cache):
+    now = int(time.time())
+    listing = [{"uri": "spotify:track:a", "name": "a"}, {"uri": "spotify:track:b", "name": "b"}]
+    await local_cache.spotify_collections.insert(
+        [
+            {
+                "uri": "spotify:playlist:p",
+                "snapshot_id": "snapshot",
+                "total": 2,
+                "tracks": encode_listing(listing),
+                "last_updated": now,
+                "last_fetched": now,
+            },
+            # Albums don't have a snapshot_id
+            {
+                "uri": "spotify:album:a",
+                "snapshot_id": None,
+                "total": 2,
+                "tracks": encode_listing(listing),
+                "last_updated": now,
+                "last_fetched": now,
+            },
+        ]
+    )
+
+    playlist = await local_cache.spotify_collections.fetch_one("spotify:playlist:p")
+    assert (playlist.snapshot_id, playlist.total, playlist.tracks) == ("snapshot", 2, listing)
+    album = await local_cache.spotify_collections.fetch_one("spotify:album:a")
+    assert (album.snapshot_id, album.tracks) == (None, listing)
+    assert await local_cache.spotify_collections.fetch_one("spotify:album:missing") is None
+
+    rows, size = await local_cache.executor.fetchone(SPOTIFY_COLLECTIONS_QUERY_SIZE)
+    assert rows == 2
+    keys = len("spotify:playlist:p") + len("snapshot") + len("spotify:album:a")
+    assert size == keys + 2 * len(encode_listing(listing))
+
+
+async def test_youtube_urls_are_found_by_isrc(local_cache):
+    now = int(time.time())
+    rows = [youtube_row(i, now) for i in range(3)]
+    rows[0]["isrc"] = "USRC17607839"
+    rows[1]["isrc"] = "GBAYE0601498"
+    await local_cache.youtube.insert(rows)
+    # Entries older than the max age are not used
+    await local_cache.youtube.insert([{**youtube_row(3, now - 400 * DAY), "isrc": "NLC0L0000001"}])
+
+    found = await local_cache.youtube.fetch_many_isrc(
+        ["USRC17607839", "GBAYE0601498", "GBAYE0601498", None, "NLC0L0000001", "missing"]
+    )
+
+    assert found == {
+        "USRC17607839": "https://youtu.be/0",
+        "GBAYE0601498": "https://youtu.be/1",
+    }
@@ -0,0 +1,110 @@
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+import base64
+import json
+import time
+
+# My Modded Imports
+from audio.apis.local_db import _SCHEMA_VERSION, LocalCacheWrapper
+from audio.apis.payload_codec import encode_payload, is_track_refs_payload
+
+# The local cache tables as they were at schema version 3
+V3_SCHEMA = (
+    """
+    CREATE TABLE lavalink(query TEXT, data JSON, last_updated INTEGER, last_fetched INTEGER);
+    """,
+    "CREATE UNIQUE INDEX idx_lavalink_query ON lavalink (query);",
+    """
+    CREATE TABLE youtube(
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        track_info TEXT,
+        youtube_url TEXT,
+        last_updated INTEGER,
+        last_fetched INTEGER
+    );
+    """,
+    "CREATE UNIQUE INDEX idx_youtube_url ON youtube (track_info, youtube_url);",
+    """
+    CREATE TABLE spotify(
+        id TEXT,
+        type TEXT,
+        uri TEXT,
+        track_name TEXT,
+        artist_name TEXT,
+        song_url TEXT,
+        track_info TEXT,
+        last_updated INTEGER,
+        last_fetched INTEGER
+    );
+    """,
+    "CREATE UNIQUE INDEX idx_spotify_uri ON spotify (id, type, uri);",
+    "pragma user_version=3;",
+)
+
+
+def make_result(*identifiers: str) -> dict:
+    return {
+        "loadType": "SEARCH_RESULT",
+        "playlistInfo": {},
+        "tracks": [
+            {
+                "track": base64.b64encode(identifier.encode()).decode("ascii"),
+                "info": {"identifier": identifier, "sourceName": "youtube", "title": identifier},
+            }
+            for identifier in identifiers
+        ],
+    }
+
+
+def columns(database, table: str) -> set:
+    return {row[1] for row in database.cursor().execute("pragma table_info({})".format(table))}
+
+
+async def test_version_3_database_is_migrated(database, executor, settings):
+    cursor = database.cursor()
+    for statement in V3_SCHEMA:
+        cursor.execute(statement)
+    now = int(time.time())
+    results = {
+        "ytsearch:one": make_result("a", "b"),
+        "ytsearch:two": make_result("b", "c"),
+        # Written by version 4, with the tracks inlined in the binary payload
+        "ytsearch:three": make_result("c", "d"),
+    }
+    for query, result in results.items():
+        data = encode_payload(result) if query == "ytsearch:three" else json.dumps(result)
+        cursor.execute("INSERT INTO lavalink VALUES (?, ?, ?, ?)", (query, data, now, now))
+
+    local_cache = LocalCacheWrapper(None, None, database, None, settings, executor)
+    await local_cache.lavalink.init()
+
+    assert cursor.execute("pragma user_version").fetchone() == (_SCHEMA_VERSION,)
+    assert "isrc" in columns(database, "youtube")
+    assert "isrc" in columns(database, "spotify")
+    assert "last_fetched" in columns(database, "tracks")
+    indexes = {
+        row[0] for row in cursor.execute("SELECT name FROM sqlite_master WHERE type='index'")
+    }
+    assert {"idx_lavalink_last_updated", "idx_tracks_last_fetched", "idx_youtube_isrc"} <= indexes
+
+    # Rows written before the upgrade stay readable until the background migration gets to them
+    result, __ = await local_cache.lavalink.fetch_one({"query": "ytsearch:one"})
+    assert result == results["ytsearch:one"]
+
+    assert await local_cache.lavalink.migrate_payloads(chunk_size=2) == 3
+    for (data,) in cursor.execute("SELECT data FROM lavalink"):
+        assert is_track_refs_payload(data)
+    (track_count,) = cursor.execute("SELECT count(*) FROM tracks").fetchone()
+    assert track_count == 4
+
+    local_cache.lavalink.front_cache.clear()
+    for query, expected in results.items():
+        result, __ = await local_cache.lavalink.fetch_one({"query": query})
+        assert result == expected
+
+    # Nothing is left to migrate, and a restart doesn't migrate the schema again
+    assert await local_cache.lavalink.migrate_payloads() == 0
+    await local_cache.lavalink.init()
+    assert cursor.execute("pragma user_version").fetchone() == (_SCHEMA_VERSION,)
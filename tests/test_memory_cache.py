@@ -0,0 +1,68 @@
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+import time
+
+# My Modded Imports
+from audio.apis.memory_cache import LRUCache, MISSING
+from audio.apis.write_buffer import WriteBehindBuffer
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = LRUCache(2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.evictions == 1
+
+
+def test_negative_entries_expire(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    cache = LRUCache(4, negative_ttl=60)
+    cache.set_negative("a")
+    assert cache.get("a") is None
+    now += 61
+    assert cache.get("a") is MISSING
+    assert cache.stats()["negative_hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_non_positive_ttl_is_not_stored():
+    cache = LRUCache(4)
+    cache.set("a", 1, ttl=0)
+    assert "a" not in cache
+
+
+async def test_write_invalidates_a_cached_miss(local_cache):
+    youtube = local_cache.youtube
+    assert await youtube.fetch_one({"track": "artist - track"}) == (None, None)
+    assert youtube.front_cache.get("artist - track", count=False) is None
+
+    buffer = WriteBehindBuffer(local_cache)
+    now = int(time.time())
+    buffer.add_insert(
+        "youtube",
+        [
+            {
+                "track_info": "artist - track",
+                "track_url": "https://youtu.be/a",
+                "isrc": None,
+                "last_updated": now,
+                "last_fetched": now,
+            }
+        ],
+    )
+    await buffer.flush()
+
+    url, __ = await youtube.fetch_one({"track": "artist - track"})
+    assert url == "https://youtu.be/a"
+    # The second lookup is served from memory
+    hits = youtube.front_cache.hits
+    await youtube.fetch_one({"track": "artist - track"})
+    assert youtube.front_cache.hits == hits + 1
@@ -0,0 +1,171 @@
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+from types import SimpleNamespace
+from typing import Optional
+
+# Dependency Imports
+import aiohttp
+
+# My Modded Imports
+from audio.apis.node_pool import NodePool
+
+
+class FakePlayer:
+    def __init__(self, guild_id: int, playing: bool = False, region: Optional[str] = None):
+        self.channel = make_channel(guild_id, region)
+        self.is_playing = playing
+        self.is_auto_playing = False
+        self.current = "track" if playing else None
+        self.queue = []
+
+
+class FakePlayerManager:
+    def __init__(self, players):
+        self.players = list(players)
+
+    @property
+    def guild_ids(self):
+        return {player.channel.guild.id for player in self.players}
+
+    async def create_player(self, channel, deafen: bool = False):
+        player = FakePlayer(channel.guild.id)
+        self.players.append(player)
+        return player
+
+
+class FakeNode:
+    """A connected Lavalink node with a player manager holding `players`."""
+
+    def __init__(self, *players: FakePlayer, system_load: Optional[float] = None):
+        self.ready = True
+        self.stats = None
+        if system_load is not None:
+            self.stats = SimpleNamespace(
+                system_load=system_load, frames_deficit=-1, frames_nulled=-1
+            )
+        self.player_manager = FakePlayerManager(players)
+
+
+def make_channel(guild_id: int, region: Optional[str] = None, shard_id: int = 0):
+    return SimpleNamespace(
+        guild=SimpleNamespace(id=guild_id, shard_id=shard_id), rtc_region=region
+    )
+
+
+def make_pool(**nodes) -> NodePool:
+    pool = NodePool(None)
+    for name, (node, settings) in nodes.items():
+        pool.add(name, node, **settings)
+    return pool
+
+
+async def test_players_are_placed_on_the_least_loaded_node():
+    busy = FakeNode(FakePlayer(1), FakePlayer(2))
+    idle = FakeNode(FakePlayer(3))
+    overloaded_cpu = FakeNode(system_load=0.9)
+    pool = make_pool(busy=(busy, {}), idle=(idle, {}), cpu=(overloaded_cpu, {}))
+
+    player = await pool.connect(make_channel(10))
+
+    assert player in idle.player_manager.players
+    assert pool.placed == 1
+    # A guild that already has a player stays on its node
+    assert pool.select(make_channel(1)).name == "busy"
+
+
+def test_region_affinity():
+    pool = make_pool(
+        europe=(FakeNode(FakePlayer(1), FakePlayer(2)), {"region": "Europe"}),
+        anywhere=(FakeNode(), {}),
+        us=(FakeNode(), {"region": "us-east"}),
+    )
+    # The node of the channel's region is preferred even when it's busier
+    assert pool.select(make_channel(10, "europe")).name == "europe"
+    # Channels of other regions go to the nodes without a region first
+    assert pool.select(make_channel(11, "japan")).name == "anywhere"
+    assert pool.select(make_channel(12)).name == "anywhere"
+
+
+def test_shard_and_search_only_nodes_are_respected():
+    pool = make_pool(
+        shard1=(FakeNode(), {"shard_id": "1"}),
+        search=(FakeNode(), {"search_only": True}),
+        main=(FakeNode(FakePlayer(1), FakePlayer(2)), {}),
+    )
+    assert [pooled.name for pooled in pool.candidates(make_channel(10, shard_id=0))] == ["main"]
+    assert pool.select(make_channel(11, shard_id=1)).name == "shard1"
+    pool.get("main").node.ready = False
+    assert pool.select(make_channel(12, shard_id=0)) is None
+
+
+def test_rebalance_moves_idle_players_off_busy_nodes():
+    idle = [FakePlayer(guild_id) for guild_id in range(8)]
+    playing = [FakePlayer(guild_id, playing=True) for guild_id in range(8, 12)]
+    pool = make_pool(
+        busy=(FakeNode(*idle, *playing), {}),
+        spare=(FakeNode(), {}),
+        search=(FakeNode(), {"search_only": True}),
+    )
+    pool.rebalance_margin = 2.0
+
+    moves = pool.plan_rebalance()
+
+    # Idle players move until the nodes are within the margin, playing ones are left alone
+    assert [target.name for __, target in moves] == ["spare"] * 5
+    assert all(player in idle for player, __ in moves)
+
+
+def test_rebalance_needs_two_nodes_and_a_margin():
+    pool = make_pool(only=(FakeNode(FakePlayer(1), FakePlayer(2)), {}))
+    assert pool.plan_rebalance() == []
+    pool = make_pool(a=(FakeNode(FakePlayer(1), FakePlayer(2)), {}), b=(FakeNode(), {}))
+    assert pool.plan_rebalance() == []
+
+
+class FailingHTTP:
+    def __init__(self):
+        self.requests = 0
+
+    def request(self, *args, **kwargs):
+        self.requests += 1
+        raise aiohttp.ClientConnectionError()
+
+
+class LoadingPlayer:
+    def __init__(self):
+        self.loaded = []
+
+    async def load_tracks(self, query):
+        self.loaded.append(query)
+        return "loaded by the player"
+
+
+def test_search_node_with_the_fewest_loads_in_flight_is_used():
+    pool = make_pool(
+        main=(FakeNode(), {"rest_uri": "http://main:2333"}),
+        search1=(FakeNode(), {"search_only": True, "rest_uri": "http://search1:2333"}),
+        search2=(FakeNode(), {"search_only": True, "rest_uri": "http://search2:2333"}),
+        unreachable=(FakeNode(), {"search_only": True}),
+    )
+    pool.get("search1").in_flight = 3
+    assert pool.search_node().name == "search2"
+    pool.get("search2").node.ready = False
+    assert pool.search_node().name == "search1"
+
+
+async def test_loads_fall_back_to_the_player():
+    http = FailingHTTP()
+    pool = NodePool(http)
+    pool.add("search", FakeNode(), search_only=True, rest_uri="http://search:2333")
+    player = LoadingPlayer()
+
+    # Local tracks are only on the node playing them
+    assert await pool.load_tracks(player, "/music/a.mp3", local=True) == "loaded by the player"
+    assert http.requests == 0
+    assert await pool.load_tracks(player, "ytsearch:a", guild_id=1) == "loaded by the player"
+    assert http.requests == 1
+    assert pool.fallbacks == 1
+    assert pool.get("search").failures == 1
+    assert player.loaded == ["/music/a.mp3", "ytsearch:a"]
@@ -0,0 +1,112 @@
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+import base64
+import json
+
+# Dependency Imports
+import pytest
+
+# My Modded Imports
+from audio.apis.payload_codec import (
+    decode_listing,
+    decode_payload,
+    decode_track,
+    encode_listing,
+    encode_payload,
+    encode_track,
+    is_encoded_payload,
+    is_track_refs_payload,
+    join_payload,
+    payload_track_keys,
+    split_payload,
+    track_key,
+)
+
+
+def make_track(identifier: str, source: str = "youtube") -> dict:
+    return {
+        "track": base64.b64encode(b"\x00QAAA" + identifier.encode()).decode("ascii"),
+        "info": {
+            "identifier": identifier,
+            "sourceName": source,
+            "title": "Title {}".format(identifier),
+            "author": "Artist",
+            "length": 212000,
+            "isStream": False,
+            "uri": "https://www.youtube.com/watch?v={}".format(identifier),
+        },
+    }
+
+
+LOAD_RESULT = {
+    "loadType": "PLAYLIST_LOADED",
+    "playlistInfo": {"name": "A playlist", "selectedTrack": -1},
+    "tracks": [make_track("a"), make_track("b"), make_track("a")],
+}
+
+
+def test_inline_payload_round_trip():
+    encoded = encode_payload(json.dumps(LOAD_RESULT))
+    assert is_encoded_payload(encoded)
+    assert not is_track_refs_payload(encoded)
+    assert decode_payload(encoded) == LOAD_RESULT
+    assert decode_payload(memoryview(encoded)) == LOAD_RESULT
+
+
+def test_inline_payload_is_smaller_than_json():
+    result = {**LOAD_RESULT, "tracks": [make_track(str(i)) for i in range(50)]}
+    assert len(encode_payload(result)) < len(json.dumps(result))
+
+
+def test_refs_payload_round_trip():
+    payload, tracks = split_payload(LOAD_RESULT)
+    assert is_encoded_payload(payload)
+    assert is_track_refs_payload(payload)
+    assert payload_track_keys(payload) == ["youtube:a", "youtube:b", "youtube:a"]
+    stored = {key: decode_track(encode_track(track)) for key, track in tracks}
+    assert len(stored) == 2
+    assert join_payload(payload, stored) == LOAD_RESULT
+
+
+def test_refs_payload_splits_an_inline_payload():
+    payload, __ = split_payload(encode_payload(LOAD_RESULT))
+    assert is_track_refs_payload(payload)
+    assert payload_track_keys(payload) == ["youtube:a", "youtube:b", "youtube:a"]
+
+
+def test_refs_payload_with_a_missing_track():
+    payload, tracks = split_payload(LOAD_RESULT)
+    with pytest.raises(KeyError):
+        join_payload(payload, dict(tracks[:1]))
+
+
+def test_refs_payload_is_not_decoded_inline():
+    payload, __ = split_payload(LOAD_RESULT)
+    with pytest.raises(ValueError):
+        decode_payload(payload)
+
+
+def test_track_key_falls_back_to_the_uri_host():
+    track = make_track("a", source="")
+    track["info"]["uri"] = "https://soundcloud.com/artist/a"
+    assert track_key(track) == "soundcloud.com:a"
+
+
+def test_empty_load_result_round_trip():
+    result = {"loadType": "NO_MATCHES", "playlistInfo": {}, "tracks": []}
+    assert decode_payload(encode_payload(result)) == result
+    payload, tracks = split_payload(result)
+    assert tracks == []
+    assert join_payload(payload, {}) == result
+
+
+def test_listing_round_trip():
+    listing = [
+        {"uri": "spotify:track:{}".format(i), "name": "Track {}".format(i)} for i in range(3)
+    ]
+    encoded = encode_listing(listing)
+    assert len(encoded) < len(json.dumps(listing))
+    assert decode_listing(encoded) == listing
+    assert decode_listing(memoryview(encoded)) == listing
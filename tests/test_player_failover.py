@@ -0,0 +1,176 @@
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+from types import SimpleNamespace
+import asyncio
+import functools
+
+# My Modded Imports
+from audio.apis.node_pool import NodePool
+from audio.core.tasks.lavalink import LavalinkTasks
+
+
+class FakePlayer:
+    def __init__(self, node: FakeNode, channel):
+        self.node = node
+        self.channel = channel
+        self.current = None
+        self.position = 0
+        self.paused = False
+        self.queue = []
+        self.volume = 100
+        self.equalizer = None
+        self.repeat = self.shuffle = self.shuffle_bumped = False
+        self._metadata = {}
+
+    def store(self, key, value):
+        self._metadata[key] = value
+
+    def fetch(self, key, default=None):
+        return self._metadata.get(key, default)
+
+    async def set_volume(self, volume):
+        self.volume = volume
+
+    async def set_equalizer(self, equalizer):
+        self.equalizer = equalizer
+
+    async def set_filters(self, **filters):
+        for name, value in filters.items():
+            setattr(self, name, value)
+
+    async def resume(self, track, start: int = 0, replace: bool = False):
+        self.current = track
+        self.position = start
+
+    async def pause(self):
+        self.paused = True
+
+
+class FakePlayerManager:
+    def __init__(self, node: FakeNode):
+        self.node = node
+        self.players = []
+        self.fail = False
+
+    @property
+    def guild_ids(self):
+        return {player.channel.guild.id for player in self.players}
+
+    async def create_player(self, channel, deafen: bool = False):
+        if self.fail:
+            raise RuntimeError("Node not ready")
+        player = FakePlayer(self.node, channel)
+        self.players.append(player)
+        return player
+
+    async def remove_player(self, player):
+        self.players.remove(player)
+
+
+class FakeNode:
+    def __init__(self):
+        self.ready = True
+        self.stats = None
+        self.player_manager = FakePlayerManager(self)
+        self.destroyed = []
+
+    async def destroy_guild(self, guild_id: int):
+        if not self.ready:
+            raise ConnectionError("Node is not connected")
+        self.destroyed.append(guild_id)
+
+
+def make_cog():
+    async def get_context_value(guild):
+        return True
+
+    async def restore_players():
+        cog.restored += 1
+
+    cog = SimpleNamespace(
+        config_cache=SimpleNamespace(
+            auto_deafen=SimpleNamespace(get_context_value=get_context_value)
+        ),
+        _restore_task=None,
+        restore_players=restore_players,
+        restored=0,
+    )
+    cog._retire_player = functools.partial(LavalinkTasks._retire_player, cog)
+    cog.move = functools.partial(LavalinkTasks.lavalink_move_player, cog)
+    return cog
+
+
+def make_nodes():
+    pool = NodePool(None)
+    failed, healthy = FakeNode(), FakeNode()
+    pool.add("failed", failed)
+    pool.add("healthy", healthy)
+    channel = SimpleNamespace(guild=SimpleNamespace(id=1, shard_id=0), rtc_region=None)
+    player = FakePlayer(failed, channel)
+    failed.player_manager.players.append(player)
+    player.current = "track"
+    player.position = 61_000
+    player.paused = True
+    player.queue = ["next"]
+    player.volume = 35
+    player.equalizer = "bass boost"
+    player.timescale = {"speed": 1.2}
+    player.store("notify_channel", 42)
+    failed.ready = False
+    return pool, failed, healthy, player
+
+
+async def test_failover_moves_the_player_with_its_state():
+    pool, failed, healthy, old = make_nodes()
+    cog = make_cog()
+
+    assert await pool.failover(pool.get("failed"), cog.move) == 1
+
+    (new,) = healthy.player_manager.players
+    assert (new.current, new.position, new.paused) == ("track", 61_000, True)
+    assert (new.volume, new.equalizer, new.timescale) == (35, "bass boost", {"speed": 1.2})
+    assert new.queue == ["next"]
+    assert new.fetch("notify_channel") == 42
+    # The old player was dropped after the new one took over
+    assert failed.player_manager.players == []
+    assert cog.restored == 0
+
+
+async def test_failed_move_falls_back_to_restoring_the_player():
+    pool, failed, healthy, old = make_nodes()
+    healthy.player_manager.fail = True
+    cog = make_cog()
+
+    assert await pool.failover(pool.get("failed"), cog.move) == 0
+    await cog._restore_task
+
+    assert failed.player_manager.players == [old]
+    assert healthy.player_manager.players == []
+    assert cog.restored == 1
+    assert pool.moved == 0
+
+
+async def test_failed_move_drops_the_half_created_player():
+    pool, failed, healthy, old = make_nodes()
+    cog = make_cog()
+
+    async def fail(volume):
+        raise asyncio.TimeoutError()
+
+    original = healthy.player_manager.create_player
+
+    async def create_player(channel, deafen: bool = False):
+        player = await original(channel, deafen=deafen)
+        player.set_volume = fail
+        return player
+
+    healthy.player_manager.create_player = create_player
+
+    assert await pool.failover(pool.get("failed"), cog.move) == 0
+    await cog._restore_task
+
+    assert healthy.player_manager.players == []
+    assert healthy.destroyed == [1]
+    assert failed.player_manager.players == [old]
@@ -0,0 +1,85 @@
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+import asyncio
+
+# Dependency Imports
+import pytest
+
+# My Modded Imports
+from audio.apis.single_flight import SingleFlight
+
+
+async def test_concurrent_calls_share_one_result():
+    flight = SingleFlight()
+    release = asyncio.Event()
+    started = 0
+
+    async def lookup():
+        nonlocal started
+        started += 1
+        await release.wait()
+        return {"tracks": []}
+
+    callers = [asyncio.create_task(flight.do("query", lookup)) for __ in range(5)]
+    await asyncio.sleep(0)
+    assert "query" in flight and len(flight) == 1
+    release.set()
+    results = await asyncio.gather(*callers)
+
+    assert started == 1
+    assert all(result is results[0] for result in results)
+    assert (flight.calls, flight.coalesced) == (1, 4)
+    assert len(flight) == 0
+
+
+async def test_different_keys_are_not_coalesced():
+    flight = SingleFlight()
+
+    async def lookup(value):
+        await asyncio.sleep(0)
+        return value
+
+    results = await asyncio.gather(
+        flight.do("a", lambda: lookup("a")), flight.do("b", lambda: lookup("b"))
+    )
+    assert results == ["a", "b"]
+    assert (flight.calls, flight.coalesced) == (2, 0)
+
+
+async def test_every_caller_sees_the_exception():
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def lookup():
+        await release.wait()
+        raise RuntimeError("API unavailable")
+
+    callers = [asyncio.create_task(flight.do("query", lookup)) for __ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*callers, return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    # A failed call isn't remembered, the next caller starts a new one
+    assert "query" not in flight
+
+
+async def test_a_cancelled_caller_does_not_cancel_the_call():
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def lookup():
+        await release.wait()
+        return "result"
+
+    first = asyncio.create_task(flight.do("query", lookup))
+    second = asyncio.create_task(flight.do("query", lookup))
+    await asyncio.sleep(0)
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    release.set()
+
+    assert await second == "result"
@@ -0,0 +1,96 @@
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+import asyncio
+
+# My Modded Imports
+from audio.apis.spotify_token import SpotifyTokenManager
+
+
+class TokenEndpoint:
+    """Hands out numbered tokens, failing the requests listed in `failing`."""
+
+    def __init__(self, expires_in: float = 3600, delay: float = 0.0):
+        self.expires_in = expires_in
+        self.delay = delay
+        self.requests = 0
+        self.failing = set()
+
+    async def __call__(self):
+        self.requests += 1
+        await asyncio.sleep(self.delay)
+        if self.requests in self.failing:
+            return None
+        return {"access_token": "token{}".format(self.requests), "expires_in": self.expires_in}
+
+
+def bearer(request: int) -> dict:
+    return {"Authorization": "Bearer token{}".format(request)}
+
+
+async def test_concurrent_callers_share_one_refresh():
+    endpoint = TokenEndpoint(delay=0.01)
+    tokens = SpotifyTokenManager(endpoint)
+
+    headers = await asyncio.gather(*(tokens.get_header() for __ in range(10)))
+
+    assert endpoint.requests == 1
+    assert headers == [bearer(1)] * 10
+    assert tokens.cached_header() == bearer(1)
+    await tokens.close()
+
+
+async def test_token_is_renewed_ahead_of_expiry():
+    endpoint = TokenEndpoint(expires_in=0.5)
+    tokens = SpotifyTokenManager(endpoint, min_validity=0.05, renew_ahead=0.3)
+    assert await tokens.get_header() == bearer(1)
+
+    await asyncio.sleep(0.3)
+
+    # Renewed in the background while the first token was still valid
+    assert endpoint.requests == 2
+    assert tokens.cached_header() == bearer(2)
+    assert tokens.refreshes == 2
+    await tokens.close()
+
+
+async def test_failed_renewal_is_retried_while_the_token_lasts():
+    endpoint = TokenEndpoint(expires_in=1.0)
+    endpoint.failing = {2, 3}
+    tokens = SpotifyTokenManager(endpoint, min_validity=0.05, renew_ahead=0.8, retry_after=0.05)
+    await tokens.get_header()
+
+    await asyncio.sleep(0.4)
+
+    assert endpoint.requests == 4
+    assert tokens.failures == 2
+    assert tokens.cached_header() == bearer(4)
+    await tokens.close()
+
+
+async def test_old_token_is_served_while_renewal_fails():
+    endpoint = TokenEndpoint(expires_in=1.0)
+    endpoint.failing = {2}
+    tokens = SpotifyTokenManager(endpoint, min_validity=0.05, renew_ahead=0.9, retry_after=0.5)
+    await tokens.get_header()
+
+    await asyncio.sleep(0.2)
+
+    assert endpoint.requests == 2
+    assert tokens.cached_header() == bearer(1)
+    await tokens.close()
+
+
+async def test_invalidate_forces_a_new_token():
+    endpoint = TokenEndpoint()
+    tokens = SpotifyTokenManager(endpoint)
+    assert await tokens.get_header() == bearer(1)
+
+    # Spotify answered 401 with the current token
+    tokens.invalidate()
+
+    assert tokens.cached_header() is None
+    assert await tokens.get_header() == bearer(2)
+    assert endpoint.requests == 2
+    await tokens.close()
@@ -0,0 +1,68 @@
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+import time
+
+# My Modded Imports
+from audio.apis.write_buffer import WriteBehindBuffer
+
+
+def youtube_row(track_info: str, track_url: str, timestamp: int) -> dict:
+    return {
+        "track_info": track_info,
+        "track_url": track_url,
+        "isrc": None,
+        "last_updated": timestamp,
+        "last_fetched": timestamp,
+    }
+
+
+async def test_repeated_writes_collapse_into_one_row(local_cache):
+    buffer = WriteBehindBuffer(local_cache)
+    now = int(time.time())
+    buffer.add_insert("youtube", [youtube_row("artist - track", "https://youtu.be/a", now)])
+    buffer.add_insert("youtube", [youtube_row("artist - track", "https://youtu.be/a", now + 1)])
+    buffer.add_insert("youtube", [youtube_row("artist - other", "https://youtu.be/b", now)])
+    for __ in range(5):
+        buffer.add_update("youtube", {"track": "artist - track"})
+
+    assert buffer.pending == 3
+    assert buffer.coalesced_rows == 5
+
+    await buffer.flush()
+
+    assert buffer.pending == 0
+    assert buffer.flushed_rows == 3
+    rows = await local_cache.executor.fetchall(
+        "SELECT track_info, youtube_url, last_updated FROM youtube ORDER BY track_info"
+    )
+    assert rows == [
+        ("artist - other", "https://youtu.be/b", now),
+        ("artist - track", "https://youtu.be/a", now + 1),
+    ]
+
+
+async def test_unknown_tables_are_ignored(local_cache):
+    buffer = WriteBehindBuffer(local_cache)
+    buffer.add_insert("not_a_table", [{"query": "a"}])
+    buffer.add_update("not_a_table", {"query": "a"})
+    assert buffer.pending == 0
+
+
+async def test_reaching_max_rows_wakes_the_flusher(local_cache):
+    buffer = WriteBehindBuffer(local_cache, flush_interval=3600, max_rows=2)
+    now = int(time.time())
+    buffer.add_insert("youtube", [youtube_row("a", "https://youtu.be/a", now)])
+    assert not buffer._wakeup.is_set()
+    buffer.add_insert("youtube", [youtube_row("b", "https://youtu.be/b", now)])
+    assert buffer._wakeup.is_set()
+
+
+async def test_close_writes_what_is_left(local_cache):
+    buffer = WriteBehindBuffer(local_cache, flush_interval=3600)
+    buffer.start()
+    buffer.add_insert("youtube", [youtube_row("a", "https://youtu.be/a", int(time.time()))])
+    await buffer.close()
+    (count,) = await local_cache.executor.fetchone("SELECT count(*) FROM youtube")
+    assert count == 1
@@ -0,0 +1,89 @@
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+from types import SimpleNamespace
+
+# Dependency Imports
+import pytest
+
+# My Modded Imports
+from audio.apis.youtube_quota import YouTubeQuotaAccountant
+
+
+class Value:
+    """Stands in for both a Config value and a global of the `SettingCacheManager`."""
+
+    def __init__(self, value):
+        self.value = value
+
+    async def __call__(self):
+        return self.value
+
+    async def set(self, value):
+        self.value = value
+
+    async def get_global(self):
+        return self.value
+
+
+@pytest.fixture()
+def today(monkeypatch):
+    day = ["2026-03-01"]
+    monkeypatch.setattr(YouTubeQuotaAccountant, "_today", staticmethod(lambda: day[0]))
+    return day
+
+
+@pytest.fixture()
+def config():
+    return SimpleNamespace(youtube_quota_usage=Value({}))
+
+
+@pytest.fixture()
+def cache():
+    return SimpleNamespace(youtube_quota_budget=Value(1000), youtube_quota_threshold=Value(50))
+
+
+async def test_searches_are_routed_past_the_threshold(today, config, cache):
+    quota = YouTubeQuotaAccountant(config, cache)
+    for __ in range(5):
+        assert await quota.allow()
+        await quota.record()
+    assert not await quota.allow()
+    assert await quota.remaining() == 500
+    stats = await quota.stats()
+    assert (stats["spent"], stats["calls"], stats["routed"]) == (500, 5, 1)
+
+
+async def test_usage_survives_a_reload(today, config, cache):
+    quota = YouTubeQuotaAccountant(config, cache)
+    await quota.record()
+    assert config.youtube_quota_usage.value == {"day": "2026-03-01", "spent": 100}
+
+    reloaded = YouTubeQuotaAccountant(config, cache)
+    assert await reloaded.remaining() == 900
+
+
+async def test_usage_is_reset_at_the_day_rollover(today, config, cache):
+    quota = YouTubeQuotaAccountant(config, cache)
+    await quota.exhausted()
+    assert await quota.remaining() == 0
+    assert not await quota.allow()
+
+    today[0] = "2026-03-02"
+    assert await quota.allow()
+    assert await quota.remaining() == 1000
+    await quota.record()
+    assert config.youtube_quota_usage.value == {"day": "2026-03-02", "spent": 100}
+
+
+async def test_usage_saved_on_a_previous_day_is_ignored(today, config, cache):
+    config.youtube_quota_usage.value = {"day": "2026-02-28", "spent": 1000}
+    quota = YouTubeQuotaAccountant(config, cache)
+    assert await quota.remaining() == 1000
+
+
+async def test_reset_is_at_midnight_pacific_time(config, cache):
+    quota = YouTubeQuotaAccountant(config, cache)
+    reset_at = quota.reset_at
+    assert reset_at.minute == 0 and reset_at.hour in (7, 8)
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3.8
+"""
+Script auditing the query plans of the statements in audio/sql_statements.py.
+
+It builds a throwaway database from every CREATE TABLE and CREATE INDEX statement,
+seeds it with generated rows, runs ANALYZE, and then prints the EXPLAIN QUERY PLAN
+output of every statement.
+It exits with a non-zero status if a statement listed in HOT_PATH scans a whole table
+instead of searching an index.
+
+Only the standard library is needed, so it can run without a bot environment:
+
+    python tools/query_plan_audit.py [--verbose] [--rows N]
+"""
+
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+import argparse
+import importlib.util
+import random
+import re
+import sqlite3
+import sys
+
+ROOT_PATH = Path(__file__).parent.parent.resolve()
+STATEMENTS_PATH = ROOT_PATH / "audio" / "sql_statements.py"
+
+# Statements run while a user waits on a command or a track, they must not scan a table.
+HOT_PATH = (
+    "PLAYLIST_DELETE",
+    "PLAYLIST_DELETE_SCHEDULED",
+    "PLAYLIST_FETCH",
+    "PLAYLIST_FETCH_ALL",
+    "PLAYLIST_FETCH_ALL_WITH_FILTER",
+    "PLAYLIST_FETCH_ALL_CONVERTER",
+    "YOUTUBE_UPDATE",
+    "YOUTUBE_QUERY",
+    "YOUTUBE_QUERY_MANY",
+    "YOUTUBE_QUERY_MANY_ISRC",
+    "YOUTUBE_QUERY_ALL",
+    "YOUTUBE_DELETE_OLD_ENTRIES",
+    "YOUTUBE_DELETE_OLD_ENTRIES_BATCH",
+    "SPOTIFY_UPDATE",
+    "SPOTIFY_QUERY",
+    "SPOTIFY_QUERY_MANY",
+    "SPOTIFY_QUERY_ALL",
+    "SPOTIFY_DELETE_OLD_ENTRIES",
+    "SPOTIFY_DELETE_OLD_ENTRIES_BATCH",
+    "SPOTIFY_COLLECTIONS_UPDATE",
+    "SPOTIFY_COLLECTIONS_QUERY",
+    "SPOTIFY_COLLECTIONS_DELETE_OLD_ENTRIES_BATCH",
+    "LAVALINK_UPDATE",
+    "LAVALINK_QUERY",
+    "LAVALINK_QUERY_MANY",
+    "LAVALINK_QUERY_ALL",
+    "LAVALINK_FETCH_ALL_ENTRIES_GLOBAL",
+    "LAVALINK_DELETE_OLD_ENTRIES",
+    "LAVALINK_DELETE_OLD_ENTRIES_BATCH",
+    "LAVALINK_FETCH_UNSPLIT_PAYLOADS",
+    "LAVALINK_UPDATE_PAYLOAD",
+    "AUTOPLAY_POOL_MAX_SLOT",
+    "AUTOPLAY_POOL_QUERY_SLOT",
+    "AUTOPLAY_POOL_FETCH_SLOT",
+    "AUTOPLAY_POOL_DELETE_SLOT",
+    "AUTOPLAY_POOL_MOVE_SLOT",
+    "AUTOPLAY_POOL_REBUILD",
+    "TRACKS_QUERY_MANY",
+    "TRACKS_UPDATE_LAST_FETCHED",
+    "TRACKS_DELETE_OLD_ENTRIES",
+    "TRACKS_DELETE_OLD_ENTRIES_BATCH",
+    "PERSIST_QUEUE_PLAYED",
+    "PERSIST_QUEUE_BULK_PLAYED",
+    "GLOBAL_SPOOL_FETCH_DUE",
+    "GLOBAL_SPOOL_DELETE",
+    "GLOBAL_SPOOL_RESCHEDULE",
+)
+# Statements with more than one SQL statement in them can't be explained as a whole.
+SKIPPED = ("HANDLE_DISCORD_DATA_DELETION_QUERY",)
+# Plan entries which scan something other than a table row by row.
+ALLOWED_SCANS = ("CONSTANT ROW", "VIRTUAL TABLE")
+PARAMETER_RE = re.compile(r"(?<!:):([A-Za-z_][A-Za-z0-9_]*)")
+
+
+def load_statements() -> Dict[str, str]:
+    spec = importlib.util.spec_from_file_location("sql_statements", STATEMENTS_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return {name: getattr(module, name) for name in module.__all__}
+
+
+def build_database(statements: Dict[str, str]) -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:")
+    for name, statement in statements.items():
+        if "_CREATE_TABLE" in name:
+            conn.execute(statement)
+    for name, statement in statements.items():
+        if "_ADD_COLUMN" in name:
+            conn.execute(statement)
+    for name, statement in statements.items():
+        if "_CREATE_INDEX" in name:
+            conn.execute(statement)
+    return conn
+
+
+def seed_database(conn: sqlite3.Connection, rows: int) -> None:
+    rng = random.Random(0)
+    now = 1_600_000_000
+
+    def stamp() -> int:
+        return now + rng.randint(0, 60 * 86400)
+
+    conn.executemany(
+        "INSERT INTO lavalink VALUES (?, ?, ?, ?)",
+        ((f"ytsearch:{i}", b"LLP\x02", stamp(), stamp()) for i in range(rows)),
+    )
+    conn.executemany(
+        "INSERT INTO youtube (track_info, youtube_url, isrc, last_updated, last_fetched) "
+        "VALUES (?, ?, ?, ?, ?)",
+        (
+            (f"artist {i} - track", f"https://youtu.be/{i}", f"USRC1{i:07}", stamp(), stamp())
+            for i in range(rows)
+        ),
+    )
+    conn.executemany(
+        "INSERT INTO spotify VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            (str(i), "track", f"spotify:track:{i}", "t", "a", "u", "i", stamp(), stamp(), None)
+            for i in range(rows)
+        ),
+    )
+    conn.executemany(
+        "INSERT INTO spotify_collections VALUES (?, ?, ?, ?, ?, ?)",
+        (
+            (f"spotify:playlist:{i}", str(i), 100, b"", stamp(), stamp())
+            for i in range(0, rows, 10)
+        ),
+    )
+    conn.executemany(
+        "INSERT INTO tracks VALUES (?, ?, ?, ?)",
+        ((f"youtube:{i}", b"", stamp(), stamp()) for i in range(rows)),
+    )
+    conn.executemany(
+        "INSERT INTO autoplay_pool (query) VALUES (?)",
+        ((f"ytsearch:{i}",) for i in range(0, rows, 3)),
+    )
+    conn.executemany(
+        "INSERT INTO playlists VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            (
+                rng.randint(1, 3),
+                i,
+                f"playlist {i}",
+                rng.randint(1, 500),
+                i % 97,
+                i % 50 == 0,
+                "",
+                "[]",
+            )
+            for i in range(rows)
+        ),
+    )
+    conn.executemany(
+        "INSERT INTO persist_queue VALUES (?, ?, ?, ?, ?, ?)",
+        ((i % 200, 1, "{}", i % 2 == 0, str(i), stamp()) for i in range(rows)),
+    )
+    conn.executemany(
+        "INSERT INTO global_spool VALUES (?, ?, ?, ?, ?)",
+        ((f"ytsearch:{i}", b"LLP\x01", i % 4, stamp(), stamp()) for i in range(0, rows, 5)),
+    )
+    conn.execute("ANALYZE")
+
+
+def explain(conn: sqlite3.Connection, statement: str) -> List[str]:
+    values = {name: 0 for name in PARAMETER_RE.findall(statement)}
+    if "keys" in values:
+        values["keys"] = '["youtube:1", "youtube:2"]'
+    return [row[-1] for row in conn.execute(f"EXPLAIN QUERY PLAN {statement}", values)]
+
+
+def full_scans(plan: List[str]) -> Iterator[str]:
+    for detail in plan:
+        if detail.startswith("SCAN ") and not any(a in detail for a in ALLOWED_SCANS):
+            yield detail
+
+
+def audit(rows: int, verbose: bool) -> List[Tuple[str, str]]:
+    statements = load_statements()
+    conn = build_database(statements)
+    seed_database(conn, rows)
+    failures: List[Tuple[str, str]] = []
+    for name, statement in statements.items():
+        if (
+            name in SKIPPED
+            or name.startswith("PRAGMA_")
+            or "_CREATE_" in name
+            or "_ADD_COLUMN" in name
+        ):
+            continue
+        try:
+            plan = explain(conn, statement)
+        except sqlite3.Error as exc:
+            failures.append((name, f"could not be explained: {exc}"))
+            continue
+        scans = list(full_scans(plan))
+        hot = name in HOT_PATH
+        if hot and scans:
+            failures.extend((name, scan) for scan in scans)
+        if verbose or (hot and scans):
+            print(f"{'FAIL' if hot and scans else 'ok  '} {name}")
+            for detail in plan:
+                print(f"       {detail}")
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=5000, help="Rows seeded into each table.")
+    parser.add_argument("--verbose", action="store_true", help="Print every query plan.")
+    args = parser.parse_args()
+    failures = audit(args.rows, args.verbose)
+    if failures:
+        print(f"\n{len(failures)} hot path statement(s) fall back to a full table scan:")
+        for name, detail in failures:
+            print(f"  {name}: {detail}")
+        return 1
+    print("All hot path statements use an index.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())